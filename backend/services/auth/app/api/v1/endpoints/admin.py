@@ -10,8 +10,8 @@ from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 
 from app.core.database import get_db
-from app.middleware.auth_middleware import require_admin
-from app.models.user_profile import UserProfile, UserRole
+from app.middleware.auth_middleware import auth_cache, require_admin_fast
+from app.models.user_profile import UserRole
 from app.services.admin_service import AdminService
 from app.utils.phone_validator import PhoneValidator
 
@@ -91,7 +91,7 @@ class AdminActionResponse(BaseModel):
 def create_manager(
     request: CreateManagerRequest,
     db: Session = Depends(get_db),
-    admin_user: UserProfile = Depends(require_admin),
+    admin_user_id: str = Depends(require_admin_fast),
 ):
     """
     Create a new manager account (Admin only)
@@ -99,7 +99,7 @@ def create_manager(
     Args:
         request: Manager creation request
         db: Database session
-        admin_user: Current admin user
+        admin_user_id: Supabase user ID of the current admin
 
     Returns:
         CreateManagerResponse: Manager creation result with temporary credentials
@@ -119,7 +119,7 @@ def create_manager(
             first_name=request.first_name,
             last_name=request.last_name,
             fleet_name=request.fleet_name,
-            created_by_admin_id=str(admin_user.user_id),
+            created_by_admin_id=admin_user_id,
             db=db,
         )
 
@@ -165,7 +165,7 @@ def list_managers(
     limit: int = 100,
     active_only: bool = False,
     db: Session = Depends(get_db),
-    admin_user: UserProfile = Depends(require_admin),
+    admin_user_id: str = Depends(require_admin_fast),
 ):
     """
     List all manager accounts (Admin only)
@@ -175,7 +175,7 @@ def list_managers(
         limit: Maximum number of records to return
         active_only: Filter for active managers only
         db: Database session
-        admin_user: Current admin user
+        admin_user_id: Supabase user ID of the current admin
 
     Returns:
         ManagerListResponse: List of managers
@@ -215,7 +215,7 @@ def list_managers(
 def get_manager(
     manager_id: UUID,
     db: Session = Depends(get_db),
-    admin_user: UserProfile = Depends(require_admin),
+    admin_user_id: str = Depends(require_admin_fast),
 ):
     """
     Get manager details (Admin only)
@@ -223,7 +223,7 @@ def get_manager(
     Args:
         manager_id: Manager's user ID
         db: Database session
-        admin_user: Current admin user
+        admin_user_id: Supabase user ID of the current admin
 
     Returns:
         ManagerResponse: Manager details
@@ -269,7 +269,7 @@ def get_manager(
 def activate_manager(
     manager_id: UUID,
     db: Session = Depends(get_db),
-    admin_user: UserProfile = Depends(require_admin),
+    admin_user_id: str = Depends(require_admin_fast),
 ):
     """
     Activate manager account (Admin only)
@@ -277,7 +277,7 @@ def activate_manager(
     Args:
         manager_id: Manager's user ID
         db: Database session
-        admin_user: Current admin user
+        admin_user_id: Supabase user ID of the current admin
 
     Returns:
         AdminActionResponse: Action result
@@ -285,9 +285,10 @@ def activate_manager(
     try:
         success, response_data = admin_service.activate_manager(
             manager_id=str(manager_id),
-            admin_id=str(admin_user.user_id),
+            admin_id=admin_user_id,
             db=db,
         )
+        auth_cache.pop(str(manager_id))
 
         if not success:
             error_code = response_data.get("error_code", "UNKNOWN_ERROR")
@@ -324,7 +325,7 @@ def activate_manager(
 def deactivate_manager(
     manager_id: UUID,
     db: Session = Depends(get_db),
-    admin_user: UserProfile = Depends(require_admin),
+    admin_user_id: str = Depends(require_admin_fast),
 ):
     """
     Deactivate manager account (Admin only)
@@ -332,7 +333,7 @@ def deactivate_manager(
     Args:
         manager_id: Manager's user ID
         db: Database session
-        admin_user: Current admin user
+        admin_user_id: Supabase user ID of the current admin
 
     Returns:
         AdminActionResponse: Action result
@@ -340,9 +341,10 @@ def deactivate_manager(
     try:
         success, response_data = admin_service.deactivate_manager(
             manager_id=str(manager_id),
-            admin_id=str(admin_user.user_id),
+            admin_id=admin_user_id,
             db=db,
         )
+        auth_cache.pop(str(manager_id))
 
         if not success:
             error_code = response_data.get("error_code", "UNKNOWN_ERROR")
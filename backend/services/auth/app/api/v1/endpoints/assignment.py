@@ -6,11 +6,12 @@ import logging
 from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.middleware.auth_middleware import require_manager
-from app.models.user_profile import UserProfile
+from app.schemas.auth import AuthPrincipal
 from app.services.assignment_service import assignment_service
 from app.schemas.assignment import (
     AssignmentRequest,
@@ -38,7 +39,7 @@ router = APIRouter()
 def create_assignment(
     request: AssignmentRequest,
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Create a new driver-vehicle assignment (Manager only)
@@ -107,7 +108,7 @@ def list_assignments(
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
     active_only: bool = Query(True, description="Show only active assignments"),
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     List assignments in manager's fleet
@@ -138,16 +139,8 @@ def list_assignments(
                 detail=response_data["message"],
             )
 
-        return AssignmentListResponse(
-            assignments=[
-                AssignmentResponse(**assignment)
-                for assignment in response_data["assignments"]
-            ],
-            total_count=response_data["total_count"],
-            page=response_data["page"],
-            limit=response_data["limit"],
-            total_pages=response_data["total_pages"],
-        )
+        # Rows already have the AssignmentResponse fields; skip re-validation
+        return ORJSONResponse(response_data)
 
     except HTTPException:
         raise
@@ -169,7 +162,7 @@ def unassign_driver(
     assignment_id: UUID,
     request: UnassignRequest,
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Unassign driver from vehicle (Manager only)
@@ -229,7 +222,7 @@ def unassign_driver(
 )
 def get_available_drivers(
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Get drivers available for assignment
@@ -274,7 +267,7 @@ def get_available_drivers(
 )
 def get_available_vehicles(
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Get vehicles available for assignment
@@ -321,7 +314,7 @@ def get_assignment_history(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Get assignment history including inactive assignments
@@ -351,16 +344,8 @@ def get_assignment_history(
                 detail=response_data["message"],
             )
 
-        return AssignmentHistoryResponse(
-            assignments=[
-                AssignmentResponse(**assignment)
-                for assignment in response_data["assignments"]
-            ],
-            total_count=response_data["total_count"],
-            page=response_data["page"],
-            limit=response_data["limit"],
-            total_pages=response_data["total_pages"],
-        )
+        # Rows already have the AssignmentResponse fields; skip re-validation
+        return ORJSONResponse(response_data)
 
     except HTTPException:
         raise
@@ -4,7 +4,8 @@ Booking API endpoints for passenger seat booking
 
 import logging
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -28,6 +29,19 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# List responses are validated and serialized in one pydantic-core pass
+# rather than through FastAPI's per-item response encoding
+_TRIP_SEARCH_LIST_ADAPTER = TypeAdapter(TripSearchListResponse)
+_BOOKING_LIST_ADAPTER = TypeAdapter(BookingListResponse)
+
+
+def _list_response(adapter: TypeAdapter, result: dict) -> Response:
+    """Return a list result as JSON serialized by its adapter"""
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(result)),
+        media_type="application/json",
+    )
+
 
 @router.get("/trips/search", response_model=TripSearchListResponse)
 def search_trips(
@@ -73,8 +87,6 @@ def search_trips(
                 detail=result.get("error", "Failed to search trips"),
             )
 
-        return result
-
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -87,6 +99,10 @@ def search_trips(
             detail="Internal server error",
         )
 
+    # Outside the try: a result that does not fit the response model is a
+    # server error, not a bad date from the client
+    return _list_response(_TRIP_SEARCH_LIST_ADAPTER, result)
+
 
 @router.get("/trips/{trip_id}/seats", response_model=SeatAvailabilityResponse)
 def get_seat_availability(
@@ -152,7 +168,7 @@ def get_bookings(
                 detail=result.get("error", "Failed to get bookings"),
             )
 
-        return result
+        return _list_response(_BOOKING_LIST_ADAPTER, result)
 
     except Exception as e:
         logger.error(f"Error in get_bookings endpoint: {str(e)}")
@@ -10,7 +10,7 @@ from uuid import UUID
 
 from app.core.database import get_db
 from app.middleware.auth_middleware import require_manager
-from app.models.user_profile import UserProfile
+from app.schemas.auth import AuthPrincipal
 from app.services.fleet_analytics_service import FleetAnalyticsService
 from app.schemas.fleet_analytics import (
     MetricRecordRequest,
@@ -33,7 +33,7 @@ router = APIRouter()
 def record_performance_metric(
     request: MetricRecordRequest,
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """Record a performance metric for the fleet"""
     success, result = FleetAnalyticsService.record_performance_metric(
@@ -71,7 +71,7 @@ def get_fleet_metrics(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """Get performance metrics for the fleet"""
 
@@ -116,7 +116,7 @@ def get_fleet_metrics(
 def record_route_performance(
     request: RoutePerformanceRequest,
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """Record route performance data"""
     success, result = FleetAnalyticsService.record_route_performance(
@@ -147,7 +147,7 @@ def get_route_performance(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """Get route performance data for the fleet"""
 
@@ -173,7 +173,7 @@ def get_route_performance(
 def record_kpi(
     request: KPIRequest,
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """Record a KPI measurement"""
     success, result = FleetAnalyticsService.record_kpi(
@@ -207,7 +207,7 @@ def get_fleet_kpis(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """Get KPIs for the fleet"""
 
@@ -232,7 +232,7 @@ def get_fleet_dashboard(
         None, description="Target date for dashboard (defaults to today)"
     ),
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """Get fleet dashboard summary"""
 
@@ -251,7 +251,7 @@ def get_analytics_summary(
     start_date: Optional[date] = Query(None, description="Start date for filtering"),
     end_date: Optional[date] = Query(None, description="End date for filtering"),
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """Get comprehensive analytics summary"""
 
@@ -12,7 +12,7 @@ from pydantic import BaseModel, Field, field_validator
 
 from app.core.database import get_db
 from app.middleware.auth_middleware import require_manager
-from app.models.user_profile import UserProfile
+from app.schemas.auth import AuthPrincipal
 from app.services.driver_service import driver_service
 from app.utils.phone_validator import PhoneValidator
 
@@ -125,7 +125,7 @@ class DriverDetailsResponse(BaseModel):
 def register_driver(
     request: RegisterDriverRequest,
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Register a new driver (Manager only)
@@ -209,7 +209,7 @@ def list_drivers(
     search: Optional[str] = Query(None, description="Search term"),
     status: Optional[str] = Query(None, description="Filter by employment status"),
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     List drivers in manager's fleet
@@ -277,7 +277,7 @@ def list_drivers(
 def get_driver(
     driver_id: UUID,
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Get driver details (Manager only)
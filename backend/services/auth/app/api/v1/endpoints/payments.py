@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.middleware.auth_middleware import get_current_user, require_manager
-from app.models.user_profile import UserProfile
+from app.schemas.auth import AuthPrincipal
 from app.services.mpesa_service import MpesaService
 from app.services.payment_service import PaymentService
 from app.schemas.payment import (
@@ -37,7 +37,7 @@ async def initiate_payment(
     request: PaymentInitiateRequest,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
-    current_user: UserProfile = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_user),
 ):
     """
     Initiate M-Pesa STK Push payment
@@ -102,7 +102,7 @@ async def initiate_payment(
 async def get_payment_status(
     payment_id: str,
     db: Session = Depends(get_db),
-    current_user: UserProfile = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_user),
 ):
     """
     Get payment status by payment ID
@@ -134,7 +134,7 @@ async def get_payment_status(
 async def query_payment_status(
     request: PaymentStatusRequest,
     db: Session = Depends(get_db),
-    current_user: UserProfile = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_user),
 ):
     """
     Query payment status from M-Pesa API
@@ -177,7 +177,7 @@ async def list_payments(
     status_filter: Optional[str] = Query(None, description="Filter by payment status"),
     booking_id: Optional[str] = Query(None, description="Filter by booking ID"),
     db: Session = Depends(get_db),
-    current_user: UserProfile = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_user),
 ):
     """
     List payments for current user or manager's fleet
@@ -215,7 +215,7 @@ async def list_payments(
 @router.get("/dashboard", response_model=PaymentDashboardResponse)
 async def get_payment_dashboard(
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Get payment dashboard data for managers
@@ -255,11 +255,11 @@ async def mpesa_callback(
     This endpoint receives callbacks from M-Pesa after payment processing
     """
     try:
-        logger.info(f"Received M-Pesa callback: {callback_data.dict()}")
+        logger.info(f"Received M-Pesa callback: {callback_data.model_dump()}")
 
         # Process callback in background to respond quickly to M-Pesa
         background_tasks.add_task(
-            payment_service.process_mpesa_callback, callback_data.dict(), db
+            payment_service.process_mpesa_callback, callback_data.model_dump(), db
         )
 
         # Return success response to M-Pesa
@@ -275,7 +275,7 @@ async def mpesa_callback(
 async def initiate_refund(
     request: RefundInitiateRequest,
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Initiate refund for a payment (Manager only)
@@ -313,7 +313,7 @@ async def initiate_refund(
 async def get_refund_status(
     refund_id: str,
     db: Session = Depends(get_db),
-    current_user: UserProfile = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_user),
 ):
     """
     Get refund status by refund ID
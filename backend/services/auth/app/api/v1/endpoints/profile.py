@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field
 from app.core.database import get_db
 from app.middleware.auth_middleware import get_current_user
 from app.models.user_profile import UserProfile
+from app.schemas.auth import AuthPrincipal
 from app.utils.phone_validator import PhoneValidator
 
 logger = logging.getLogger(__name__)
@@ -18,6 +19,16 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _get_profile(current_user: AuthPrincipal, db: Session) -> UserProfile:
+    """Load the full profile row for the authenticated user"""
+    user = db.get(UserProfile, current_user.id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User profile not found"
+        )
+    return user
+
+
 # Request/Response Models
 class UserProfileResponse(BaseModel):
     """User profile response model"""
@@ -54,30 +65,37 @@ class UpdateProfileResponse(BaseModel):
     summary="Get current user profile",
     description="Get the profile of the currently authenticated user",
 )
-def get_current_user_profile(current_user: UserProfile = Depends(get_current_user)):
+def get_current_user_profile(
+    current_user: AuthPrincipal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
     """
     Get current user's profile
 
     Args:
         current_user: Current authenticated user
+        db: Database session
 
     Returns:
         User profile data
     """
     try:
+        user = _get_profile(current_user, db)
         return UserProfileResponse(
             id=str(current_user.id),
-            user_id=str(current_user.user_id),
-            phone=PhoneValidator.format_for_display(current_user.phone),
-            first_name=current_user.first_name,
-            last_name=current_user.last_name,
-            email=current_user.email,
+            user_id=str(user.user_id),
+            phone=PhoneValidator.format_for_display(user.phone),
+            first_name=user.first_name,
+            last_name=user.last_name,
+            email=user.email,
             role=current_user.role.value,
             is_active=current_user.is_active,
-            created_at=current_user.created_at.isoformat(),
-            updated_at=current_user.updated_at.isoformat(),
+            created_at=user.created_at.isoformat(),
+            updated_at=user.updated_at.isoformat(),
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Get profile error: {e}")
         raise HTTPException(
@@ -94,7 +112,7 @@ def get_current_user_profile(current_user: UserProfile = Depends(get_current_use
 )
 def update_user_profile(
     request: UpdateProfileRequest,
-    current_user: UserProfile = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -112,19 +130,21 @@ def update_user_profile(
         HTTPException: If profile update fails
     """
     try:
+        user = _get_profile(current_user, db)
+
         # Update fields if provided
         updated = False
 
         if request.first_name is not None:
-            current_user.first_name = request.first_name.strip()
+            user.first_name = request.first_name.strip()
             updated = True
 
         if request.last_name is not None:
-            current_user.last_name = request.last_name.strip()
+            user.last_name = request.last_name.strip()
             updated = True
 
         if request.email is not None:
-            current_user.email = request.email
+            user.email = request.email
             updated = True
 
         if not updated:
@@ -135,23 +155,23 @@ def update_user_profile(
 
         # Save changes
         db.commit()
-        db.refresh(current_user)
+        db.refresh(user)
 
-        logger.info(f"Profile updated for user: {current_user.id}")
+        logger.info(f"Profile updated for user: {user.id}")
 
         return UpdateProfileResponse(
             message="Profile updated successfully",
             user=UserProfileResponse(
                 id=str(current_user.id),
-                user_id=str(current_user.user_id),
-                phone=PhoneValidator.format_for_display(current_user.phone),
-                first_name=current_user.first_name,
-                last_name=current_user.last_name,
-                email=current_user.email,
+                user_id=str(user.user_id),
+                phone=PhoneValidator.format_for_display(user.phone),
+                first_name=user.first_name,
+                last_name=user.last_name,
+                email=user.email,
                 role=current_user.role.value,
                 is_active=current_user.is_active,
-                created_at=current_user.created_at.isoformat(),
-                updated_at=current_user.updated_at.isoformat(),
+                created_at=user.created_at.isoformat(),
+                updated_at=user.updated_at.isoformat(),
             ),
         )
 
@@ -171,23 +191,28 @@ def update_user_profile(
     summary="Get user dashboard data",
     description="Get dashboard data for the current user",
 )
-def get_user_dashboard(current_user: UserProfile = Depends(get_current_user)):
+def get_user_dashboard(
+    current_user: AuthPrincipal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
     """
     Get user dashboard data
 
     Args:
         current_user: Current authenticated user
+        db: Database session
 
     Returns:
         Dashboard data based on user role
     """
     try:
+        user = _get_profile(current_user, db)
         dashboard_data = {
             "user": {
                 "id": str(current_user.id),
-                "name": f"{current_user.first_name} {current_user.last_name}",
+                "name": f"{user.first_name} {user.last_name}",
                 "role": current_user.role.value,
-                "phone": PhoneValidator.format_for_display(current_user.phone),
+                "phone": PhoneValidator.format_for_display(user.phone),
             },
             "stats": {},
             "recent_activity": [],
@@ -236,6 +261,8 @@ def get_user_dashboard(current_user: UserProfile = Depends(get_current_user)):
 
         return dashboard_data
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Dashboard data error: {e}")
         raise HTTPException(
@@ -10,7 +10,7 @@ from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.middleware.auth_middleware import require_manager
-from app.models.user_profile import UserProfile
+from app.schemas.auth import AuthPrincipal
 from app.services.trip_service import TripService
 from app.schemas.trip import (
     RouteCreateRequest,
@@ -40,7 +40,7 @@ router = APIRouter()
 def create_route(
     request: RouteCreateRequest,
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """Create a new route"""
     try:
@@ -73,7 +73,7 @@ def create_route(
 def get_routes(
     active_only: bool = Query(True, description="Filter for active routes only"),
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """Get all routes for the manager's fleet"""
     try:
@@ -104,7 +104,7 @@ def update_route(
     route_id: str,
     request: RouteUpdateRequest,
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """Update an existing route"""
     try:
@@ -135,7 +135,7 @@ def update_route(
 def create_trip(
     request: TripCreateRequest,
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """Create a new trip"""
     try:
@@ -173,7 +173,7 @@ def get_trips(
     start_date: Optional[date] = Query(None, description="Filter trips from this date"),
     end_date: Optional[date] = Query(None, description="Filter trips until this date"),
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """Get trips with filtering and pagination"""
     try:
@@ -211,7 +211,7 @@ def update_trip(
     trip_id: str,
     request: TripUpdateRequest,
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """Update an existing trip"""
     try:
@@ -246,7 +246,7 @@ def cancel_trip(
     trip_id: str,
     cancellation_reason: str = Query(..., description="Reason for cancellation"),
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """Cancel a trip"""
     try:
@@ -281,7 +281,7 @@ def cancel_trip(
 def check_availability(
     request: AvailabilityCheckRequest,
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """Check vehicle and driver availability"""
     try:
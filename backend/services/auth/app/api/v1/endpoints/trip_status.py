@@ -10,13 +10,14 @@ from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.middleware.auth_middleware import require_manager, get_current_user
-from app.models.user_profile import UserProfile
+from app.schemas.auth import AuthPrincipal
 from app.services.trip_status_service import TripStatusService
 from app.schemas.trip_status import (
     TripStatusUpdateRequest,
     TripStatusUpdateResponse,
     TripStatusHistoryResponse,
     GPSLocationRequest,
+    GPSLocationBatchRequest,
     GPSLocationResponse,
     GPSLocationHistoryResponse,
     NotificationPreferenceRequest,
@@ -41,7 +42,7 @@ def update_trip_status(
     trip_id: UUID,
     request: TripStatusUpdateRequest,
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Update trip status (Manager only)
@@ -107,7 +108,7 @@ def get_trip_status_history(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
     db: Session = Depends(get_db),
-    user: UserProfile = Depends(get_current_user),
+    user: AuthPrincipal = Depends(get_current_user),
 ):
     """
     Get trip status history (Manager or Passenger)
@@ -164,7 +165,7 @@ def get_trip_status_history(
 def record_gps_location(
     request: GPSLocationRequest,
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Record GPS location (Manager only)
@@ -213,6 +214,63 @@ def record_gps_location(
         )
 
 
+@router.post(
+    "/gps/locations/batch",
+    summary="Record GPS locations in bulk",
+    description="Record a batch of GPS readings in a single insert",
+)
+def record_gps_locations(
+    request: GPSLocationBatchRequest,
+    db: Session = Depends(get_db),
+    manager: AuthPrincipal = Depends(require_manager),
+):
+    """
+    Record a batch of GPS locations (Manager only)
+
+    Args:
+        request: GPS readings, up to 1000
+        db: Database session
+        manager: Current manager user
+
+    Returns:
+        Number of locations recorded
+    """
+    try:
+        success, response_data = TripStatusService.record_gps_locations(
+            request=request,
+            db=db,
+        )
+
+        if not success:
+            error_code = response_data.get("error_code", "UNKNOWN_ERROR")
+
+            if error_code in ["VEHICLE_NOT_FOUND", "TRIP_NOT_FOUND"]:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=response_data["message"],
+                )
+            else:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=response_data["message"],
+                )
+
+        return {
+            "success": True,
+            "message": response_data["message"],
+            "recorded_count": response_data["recorded_count"],
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"GPS batch recording error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="GPS location recording failed",
+        )
+
+
 @router.get(
     "/trips/{trip_id}/location",
     summary="Get current trip location",
@@ -221,7 +279,7 @@ def record_gps_location(
 def get_current_trip_location(
     trip_id: UUID,
     db: Session = Depends(get_db),
-    user: UserProfile = Depends(get_current_user),
+    user: AuthPrincipal = Depends(get_current_user),
 ):
     """
     Get current trip location (Manager or Passenger)
@@ -279,7 +337,7 @@ def get_current_trip_location(
 )
 def get_fleet_tracking_dashboard(
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Get fleet tracking dashboard (Manager only)
@@ -325,7 +383,7 @@ def create_delay_alert(
     trip_id: UUID,
     request: DelayAlertRequest,
     db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Create delay alert (Manager only)
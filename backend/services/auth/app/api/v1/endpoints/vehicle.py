@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.middleware.auth_middleware import get_current_user
-from app.models.user_profile import UserProfile
+from app.schemas.auth import AuthPrincipal
 from app.services.vehicle_service import VehicleService
 from app.schemas.vehicle import (
     VehicleRegistrationRequest,
@@ -27,7 +27,7 @@ router = APIRouter()
 @router.post("/vehicles", response_model=VehicleRegistrationResponse)
 async def register_vehicle(
     vehicle_data: VehicleRegistrationRequest,
-    current_user: UserProfile = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -74,7 +74,7 @@ async def list_vehicles(
     search: Optional[str] = Query(None, description="Search term"),
     status: Optional[str] = Query(None, description="Filter by status"),
     vehicle_type: Optional[str] = Query(None, description="Filter by vehicle type"),
-    current_user: UserProfile = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -122,7 +122,7 @@ async def list_vehicles(
 @router.get("/vehicles/{vehicle_id}", response_model=VehicleDetailsResponse)
 async def get_vehicle_details(
     vehicle_id: str,
-    current_user: UserProfile = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -158,7 +158,7 @@ async def get_vehicle_details(
 async def update_vehicle(
     vehicle_id: str,
     vehicle_data: VehicleUpdateRequest,
-    current_user: UserProfile = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
@@ -3,14 +3,27 @@ Vehicle status and maintenance tracking endpoints
 """
 
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Type
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    status,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.exceptions import RequestValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.redis_client import redis_client
 from app.middleware.auth_middleware import require_manager
-from app.models.user_profile import UserProfile
+from app.schemas.auth import AuthPrincipal
 from app.services.vehicle_status_service import vehicle_status_service
 from app.schemas.vehicle_status import (
     StatusChangeRequest,
@@ -31,16 +44,121 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+# Service error codes that map to a specific HTTP status (anything else is 500)
+_ERROR_STATUS_CODES = {
+    "VEHICLE_NOT_FOUND": status.HTTP_404_NOT_FOUND,
+    "ACCESS_DENIED": status.HTTP_403_FORBIDDEN,
+}
+
+
+def _raise_service_error(response_data: dict):
+    """Raise the HTTPException matching a failed service response"""
+    raise HTTPException(
+        status_code=_ERROR_STATUS_CODES.get(
+            response_data.get("error_code"), status.HTTP_500_INTERNAL_SERVER_ERROR
+        ),
+        detail=response_data["message"],
+    )
+
+
+# Generation counters: bumping one orphans every cached page keyed under it,
+# and the orphans expire with STATUS_CACHE_TTL_SECONDS
+def _status_history_generation_key(vehicle_id: str) -> str:
+    return f"vsh:gen:{vehicle_id}"
+
+
+def _maintenance_list_generation_key(fleet_id: str) -> str:
+    return f"maint:gen:{fleet_id}"
+
+
+def _status_history_cache_key(
+    fleet_id: str, vehicle_id: str, page: int, limit: int
+) -> str:
+    """Cache key for a page of vehicle status history"""
+    generation = redis_client.get_generation(_status_history_generation_key(vehicle_id))
+    return f"vsh:{fleet_id}:{vehicle_id}:{generation}:{page}:{limit}"
+
+
+def _maintenance_list_cache_key(
+    fleet_id: str,
+    page: int,
+    limit: int,
+    status_filter: Optional[str],
+    priority_filter: Optional[str],
+) -> str:
+    """Cache key for a page of fleet maintenance records"""
+    generation = redis_client.get_generation(_maintenance_list_generation_key(fleet_id))
+    return (
+        f"maint:{fleet_id}:{generation}:{page}:{limit}:"
+        f"{status_filter}:{priority_filter}"
+    )
+
+
+@lru_cache(maxsize=None)
+def _response_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Module-wide TypeAdapter per response model"""
+    return TypeAdapter(model)
+
+
+def _json_bytes(response_model: BaseModel) -> bytes:
+    """Serialize a response model straight to JSON bytes"""
+    return _response_adapter(type(response_model)).dump_json(response_model)
+
+
+def _json_response(body: bytes) -> Response:
+    """Return pre-serialized JSON, bypassing FastAPI's response encoding"""
+    return Response(content=body, media_type="application/json")
+
+
+def _cached_json_response(key: str, response_model: BaseModel) -> Response:
+    """Store a serialized response model in Redis and return it"""
+    body = _json_bytes(response_model)
+    redis_client.set_bytes(key, body, expire=settings.STATUS_CACHE_TTL_SECONDS)
+    return _json_response(body)
+
+
+def _json_body(model: Type[BaseModel]):
+    """
+    Dependency that parses and validates the raw JSON body in a single
+    pydantic-core pass (instead of json.loads followed by model validation)
+    """
+    adapter = TypeAdapter(model)
+
+    async def validate_body(http_request: Request) -> BaseModel:
+        try:
+            return adapter.validate_json(await http_request.body())
+        except ValidationError as e:
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ("body", *error["loc"])}
+                    for error in e.errors(include_url=False)
+                ]
+            )
+
+    return validate_body
+
+
+def _json_body_openapi(model: Type[BaseModel]) -> dict:
+    """OpenAPI request body for endpoints using _json_body"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+
 @router.post(
     "/vehicles/{vehicle_id}/status",
     summary="Change vehicle status",
     description="Change the operational status of a vehicle and record the change",
+    openapi_extra=_json_body_openapi(StatusChangeRequest),
 )
-def change_vehicle_status(
+async def change_vehicle_status(
     vehicle_id: UUID,
-    request: StatusChangeRequest,
-    db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    request: StatusChangeRequest = Depends(_json_body(StatusChangeRequest)),
+    db: AsyncSession = Depends(get_async_db),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Change vehicle status (Manager only)
@@ -55,7 +173,7 @@ def change_vehicle_status(
         Status change confirmation
     """
     try:
-        success, response_data = vehicle_status_service.change_vehicle_status(
+        success, response_data = await vehicle_status_service.change_vehicle_status(
             vehicle_id=str(vehicle_id),
             new_status=request.new_status,
             manager_id=str(manager.id),
@@ -65,23 +183,9 @@ def change_vehicle_status(
         )
 
         if not success:
-            error_code = response_data.get("error_code", "UNKNOWN_ERROR")
-
-            if error_code == "VEHICLE_NOT_FOUND":
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=response_data["message"],
-                )
-            elif error_code == "ACCESS_DENIED":
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=response_data["message"],
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=response_data["message"],
-                )
+            _raise_service_error(response_data)
+
+        redis_client.incr(_status_history_generation_key(str(vehicle_id)))
 
         return {
             "success": True,
@@ -108,12 +212,12 @@ def change_vehicle_status(
     summary="Get vehicle status history",
     description="Get the status change history for a vehicle",
 )
-def get_vehicle_status_history(
+async def get_vehicle_status_history(
     vehicle_id: UUID,
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    db: AsyncSession = Depends(get_async_db),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Get vehicle status history
@@ -129,34 +233,29 @@ def get_vehicle_status_history(
         StatusHistoryListResponse: Paginated status history
     """
     try:
-        success, response_data = vehicle_status_service.get_vehicle_status_history(
-            vehicle_id=str(vehicle_id),
-            manager_id=str(manager.id),
-            page=page,
-            limit=limit,
-            db=db,
+        cache_key = _status_history_cache_key(
+            str(manager.fleet_id), str(vehicle_id), page, limit
+        )
+        cached = redis_client.get_bytes(cache_key)
+        if cached:
+            return _json_response(cached)
+
+        success, response_data = (
+            await vehicle_status_service.get_vehicle_status_history(
+                vehicle_id=str(vehicle_id),
+                manager_id=str(manager.id),
+                page=page,
+                limit=limit,
+                db=db,
+            )
         )
 
         if not success:
-            error_code = response_data.get("error_code", "UNKNOWN_ERROR")
-
-            if error_code == "VEHICLE_NOT_FOUND":
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=response_data["message"],
-                )
-            elif error_code == "ACCESS_DENIED":
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=response_data["message"],
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=response_data["message"],
-                )
-
-        return StatusHistoryListResponse(**response_data)
+            _raise_service_error(response_data)
+
+        return _cached_json_response(
+            cache_key, StatusHistoryListResponse(**response_data)
+        )
 
     except HTTPException:
         raise
@@ -173,12 +272,13 @@ def get_vehicle_status_history(
     response_model=dict,
     summary="Create maintenance record",
     description="Create a new maintenance record for a vehicle",
+    openapi_extra=_json_body_openapi(MaintenanceRecordRequest),
 )
-def create_maintenance_record(
+async def create_maintenance_record(
     vehicle_id: UUID,
-    request: MaintenanceRecordRequest,
-    db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    request: MaintenanceRecordRequest = Depends(_json_body(MaintenanceRecordRequest)),
+    db: AsyncSession = Depends(get_async_db),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Create maintenance record (Manager only)
@@ -205,7 +305,7 @@ def create_maintenance_record(
             "odometer_reading": request.odometer_reading,
         }
 
-        success, response_data = vehicle_status_service.create_maintenance_record(
+        success, response_data = await vehicle_status_service.create_maintenance_record(
             vehicle_id=str(vehicle_id),
             manager_id=str(manager.id),
             maintenance_data=maintenance_data,
@@ -213,23 +313,9 @@ def create_maintenance_record(
         )
 
         if not success:
-            error_code = response_data.get("error_code", "UNKNOWN_ERROR")
-
-            if error_code == "VEHICLE_NOT_FOUND":
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=response_data["message"],
-                )
-            elif error_code == "ACCESS_DENIED":
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=response_data["message"],
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=response_data["message"],
-                )
+            _raise_service_error(response_data)
+
+        redis_client.incr(_maintenance_list_generation_key(str(manager.fleet_id)))
 
         return {
             "success": True,
@@ -253,7 +339,7 @@ def create_maintenance_record(
     summary="List fleet maintenance records",
     description="Get maintenance records for the manager's fleet with filtering options",
 )
-def list_maintenance_records(
+async def list_maintenance_records(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
     status_filter: Optional[str] = Query(
@@ -262,8 +348,8 @@ def list_maintenance_records(
     priority_filter: Optional[MaintenancePriorityEnum] = Query(
         None, description="Filter by priority"
     ),
-    db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    db: AsyncSession = Depends(get_async_db),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     List maintenance records for fleet
@@ -280,31 +366,35 @@ def list_maintenance_records(
         MaintenanceListResponse: Paginated maintenance records
     """
     try:
-        success, response_data = vehicle_status_service.get_fleet_maintenance_records(
-            manager_id=str(manager.id),
-            fleet_id=str(manager.fleet_id),
-            page=page,
-            limit=limit,
-            status_filter=status_filter,
-            priority_filter=priority_filter.value if priority_filter else None,
-            db=db,
+        cache_key = _maintenance_list_cache_key(
+            str(manager.fleet_id),
+            page,
+            limit,
+            status_filter,
+            priority_filter.value if priority_filter else None,
+        )
+        cached = redis_client.get_bytes(cache_key)
+        if cached:
+            return _json_response(cached)
+
+        success, response_data = (
+            await vehicle_status_service.get_fleet_maintenance_records(
+                manager_id=str(manager.id),
+                fleet_id=str(manager.fleet_id),
+                page=page,
+                limit=limit,
+                status_filter=status_filter,
+                priority_filter=priority_filter.value if priority_filter else None,
+                db=db,
+            )
         )
 
         if not success:
-            error_code = response_data.get("error_code", "UNKNOWN_ERROR")
+            _raise_service_error(response_data)
 
-            if error_code == "ACCESS_DENIED":
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=response_data["message"],
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=response_data["message"],
-                )
-
-        return MaintenanceListResponse(**response_data)
+        return _cached_json_response(
+            cache_key, MaintenanceListResponse(**response_data)
+        )
 
     except HTTPException:
         raise
@@ -322,11 +412,11 @@ def list_maintenance_records(
     summary="Create vehicle document",
     description="Create a new document record for a vehicle",
 )
-def create_vehicle_document(
+async def create_vehicle_document(
     vehicle_id: UUID,
     request: VehicleDocumentRequest,
-    db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    db: AsyncSession = Depends(get_async_db),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Create vehicle document (Manager only)
@@ -351,7 +441,7 @@ def create_vehicle_document(
             "notes": request.notes,
         }
 
-        success, response_data = vehicle_status_service.create_vehicle_document(
+        success, response_data = await vehicle_status_service.create_vehicle_document(
             vehicle_id=str(vehicle_id),
             manager_id=str(manager.id),
             document_data=document_data,
@@ -359,23 +449,7 @@ def create_vehicle_document(
         )
 
         if not success:
-            error_code = response_data.get("error_code", "UNKNOWN_ERROR")
-
-            if error_code == "VEHICLE_NOT_FOUND":
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=response_data["message"],
-                )
-            elif error_code == "ACCESS_DENIED":
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=response_data["message"],
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=response_data["message"],
-                )
+            _raise_service_error(response_data)
 
         return {
             "success": True,
@@ -399,12 +473,12 @@ def create_vehicle_document(
     summary="Get vehicle documents",
     description="Get all documents for a vehicle",
 )
-def get_vehicle_documents(
+async def get_vehicle_documents(
     vehicle_id: UUID,
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+    db: AsyncSession = Depends(get_async_db),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Get vehicle documents
@@ -420,7 +494,7 @@ def get_vehicle_documents(
         DocumentListResponse: Paginated documents
     """
     try:
-        success, response_data = vehicle_status_service.get_vehicle_documents(
+        success, response_data = await vehicle_status_service.get_vehicle_documents(
             vehicle_id=str(vehicle_id),
             manager_id=str(manager.id),
             page=page,
@@ -429,25 +503,9 @@ def get_vehicle_documents(
         )
 
         if not success:
-            error_code = response_data.get("error_code", "UNKNOWN_ERROR")
-
-            if error_code == "VEHICLE_NOT_FOUND":
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=response_data["message"],
-                )
-            elif error_code == "ACCESS_DENIED":
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=response_data["message"],
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=response_data["message"],
-                )
-
-        return DocumentListResponse(**response_data)
+            _raise_service_error(response_data)
+
+        return _json_response(_json_bytes(DocumentListResponse(**response_data)))
 
     except HTTPException:
         raise
@@ -465,9 +523,9 @@ def get_vehicle_documents(
     summary="Get fleet status dashboard",
     description="Get fleet status overview and summary statistics",
 )
-def get_fleet_status_dashboard(
-    db: Session = Depends(get_db),
-    manager: UserProfile = Depends(require_manager),
+async def get_fleet_status_dashboard(
+    db: AsyncSession = Depends(get_async_db),
+    manager: AuthPrincipal = Depends(require_manager),
 ):
     """
     Get fleet status dashboard
@@ -480,25 +538,16 @@ def get_fleet_status_dashboard(
         Fleet status dashboard data
     """
     try:
-        success, response_data = vehicle_status_service.get_fleet_status_dashboard(
-            manager_id=str(manager.id),
-            fleet_id=str(manager.fleet_id),
-            db=db,
+        success, response_data = (
+            await vehicle_status_service.get_fleet_status_dashboard(
+                manager_id=str(manager.id),
+                fleet_id=str(manager.fleet_id),
+                db=db,
+            )
         )
 
         if not success:
-            error_code = response_data.get("error_code", "UNKNOWN_ERROR")
-
-            if error_code == "ACCESS_DENIED":
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=response_data["message"],
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=response_data["message"],
-                )
+            _raise_service_error(response_data)
 
         return {
             "success": True,
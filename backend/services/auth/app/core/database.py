@@ -2,10 +2,18 @@
 Database configuration and session management
 """
 
+import asyncio
+import weakref
+from typing import Any, AsyncIterator, Optional, Type, TypeVar
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import raiseload, sessionmaker, Session
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.pool import NullPool
 import logging
 
 from .config import settings
@@ -18,8 +26,15 @@ logger = logging.getLogger(__name__)
 engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
-    poolclass=NullPool,  # Use NullPool for development
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
     pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    # Multi-row INSERT ... VALUES for executemany inserts, and
+    # psycopg2 execute_batch for executemany UPDATE/DELETE
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
 )
 
 # Create session factory
@@ -29,10 +44,63 @@ SessionLocal = sessionmaker(
     autoflush=False,
 )
 
+# Async engines are bound to the event loop that opened their connections,
+# so keep one per running loop instead of a single module-level engine
+ASYNC_DATABASE_URL = settings.DATABASE_URL.replace(
+    "postgresql://", "postgresql+asyncpg://", 1
+)
+_async_engines: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncEngine]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Create async session factory (bound to the loop's engine per session)
+AsyncSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Create declarative base
 Base = declarative_base()
 
 
+def load_options(*options):
+    """Eager-load options, refusing any other lazy load in debug mode"""
+    if settings.DEBUG:
+        return (*options, raiseload("*"))
+    return options
+
+
+_Model = TypeVar("_Model")
+
+
+def get_by_id(db: Session, model: Type[_Model], ident: Any) -> Optional[_Model]:
+    """
+    Load a row by primary key at most once per session
+
+    Sessions are opened per request, so lookups repeated while building one
+    response (the same route or vehicle for many trips) reuse the first
+    result. Results, including misses, are held in the session's info dict
+    until it closes; the identity map alone only keeps instances that are
+    still referenced.
+
+    Args:
+        db: Database session
+        model: Mapped class
+        ident: Primary key value, as a UUID or its string form
+
+    Returns:
+        The instance, or None if no row has that key
+    """
+    cache = db.info.setdefault("by_id", {})
+    key = (model, str(ident))
+    try:
+        return cache[key]
+    except KeyError:
+        instance = cache[key] = db.get(model, ident)
+        return instance
+
+
 def get_db() -> Session:
     """
     Dependency to get database session
@@ -48,6 +116,47 @@ def get_db() -> Session:
         db.close()
 
 
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the async engine for the running event loop
+    """
+    loop = asyncio.get_running_loop()
+    async_engine = _async_engines.get(loop)
+    if async_engine is None:
+        async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            echo=settings.DEBUG,
+            pool_size=20,
+            max_overflow=10,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+        )
+        _async_engines[loop] = async_engine
+    return async_engine
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency to get async database session
+    """
+    async with AsyncSessionLocal(bind=get_async_engine()) as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Async database session error: {e}")
+            await db.rollback()
+            raise
+
+
+async def dispose_async_engine():
+    """
+    Dispose the async engine owned by the running event loop
+    """
+    async_engine = _async_engines.pop(asyncio.get_running_loop(), None)
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
 def init_db():
     """
     Initialize database tables
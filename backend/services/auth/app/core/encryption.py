@@ -3,14 +3,39 @@ Encryption utilities for sensitive data
 """
 
 import base64
+import hashlib
 import os
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from functools import lru_cache
 import logging
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Use a fixed salt for consistency (not recommended for production)
+KDF_SALT = b"matatu_fleet_salt_2025"  # Should be random and stored securely
+KDF_ITERATIONS = 100000
+
+# AES-GCM ciphertexts are prefixed so legacy Fernet values still decrypt
+AESGCM_PREFIX = "v2:"
+AESGCM_NONCE_SIZE = 12
+# Every Fernet token starts with its version byte and a zero-led timestamp
+FERNET_TOKEN_PREFIX = "gAAAAA"
+
+
+@lru_cache(maxsize=8)
+def _pbkdf2_key(password: str) -> bytes:
+    """Run PBKDF2 once per password per process"""
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=KDF_SALT,
+        iterations=KDF_ITERATIONS,
+    )
+    return base64.urlsafe_b64encode(kdf.derive(password.encode()))
+
 
 class EncryptionService:
     """Service for encrypting and decrypting sensitive data"""
@@ -18,10 +43,16 @@ class EncryptionService:
     def __init__(self):
         self._key = None
         self._fernet = None
+        self._aesgcm = None
         self._initialize_encryption()
 
     def _initialize_encryption(self):
         """Initialize encryption with key from environment"""
+        # cryptography is imported when the service is first used, not when
+        # this module is imported
+        from cryptography.fernet import Fernet
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
         try:
             # Get encryption key from environment or generate one
             encryption_key = os.getenv("ENCRYPTION_KEY")
@@ -53,6 +84,7 @@ class EncryptionService:
                 self._key = encryption_key
 
             self._fernet = Fernet(self._key)
+            self._aesgcm = AESGCM(base64.urlsafe_b64decode(self._key))
             logger.info("Encryption service initialized successfully")
 
         except Exception as e:
@@ -60,29 +92,63 @@ class EncryptionService:
             # Fallback to a default key for development
             self._key = Fernet.generate_key()
             self._fernet = Fernet(self._key)
+            self._aesgcm = AESGCM(base64.urlsafe_b64decode(self._key))
             logger.warning("Using fallback encryption key")
 
     def _derive_key_from_password(self, password: str) -> bytes:
         """Derive encryption key from password"""
-        # Use a fixed salt for consistency (not recommended for production)
-        salt = b"matatu_fleet_salt_2025"  # Should be random and stored securely
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
+        # Workers share the derived key through ENCRYPTION_KEY_CACHE_PATH
+        # (e.g. a tmpfs file) so PBKDF2 runs once per host, not per worker
+        cache_path = os.getenv("ENCRYPTION_KEY_CACHE_PATH")
+        fingerprint = hashlib.sha256(KDF_SALT + password.encode()).hexdigest()
+
+        if cache_path:
+            key = self._read_cached_key(cache_path, fingerprint)
+            if key:
+                return key
+
+        key = _pbkdf2_key(password)
+
+        if cache_path:
+            self._write_cached_key(cache_path, fingerprint, key)
         return key
 
+    @staticmethod
+    def _read_cached_key(cache_path: str, fingerprint: str) -> Optional[bytes]:
+        """Read a previously derived key if it was derived from the same password"""
+        try:
+            with open(cache_path, "rb") as f:
+                cached_fingerprint, key = f.read().split(b":", 1)
+            if cached_fingerprint.decode() == fingerprint:
+                return key.strip()
+        except (OSError, ValueError):
+            pass
+        return None
+
+    @staticmethod
+    def _write_cached_key(cache_path: str, fingerprint: str, key: bytes):
+        """Persist a derived key (owner read/write only)"""
+        tmp_path = f"{cache_path}.{os.getpid()}"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(fingerprint.encode() + b":" + key)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache derived encryption key: {e}")
+
     def encrypt(self, data: str) -> str:
         """Encrypt string data"""
         try:
             if not data:
                 return data
 
-            encrypted_data = self._fernet.encrypt(data.encode())
-            return base64.urlsafe_b64encode(encrypted_data).decode()
+            nonce = os.urandom(AESGCM_NONCE_SIZE)
+            encrypted_data = self._aesgcm.encrypt(nonce, data.encode(), None)
+            return (
+                AESGCM_PREFIX
+                + base64.urlsafe_b64encode(nonce + encrypted_data).decode()
+            )
 
         except Exception as e:
             logger.error(f"Encryption error: {e}")
@@ -94,8 +160,21 @@ class EncryptionService:
             if not encrypted_data:
                 return encrypted_data
 
-            # Decode from base64
-            encrypted_bytes = base64.urlsafe_b64decode(encrypted_data.encode())
+            if encrypted_data.startswith(AESGCM_PREFIX):
+                encrypted_bytes = base64.urlsafe_b64decode(
+                    encrypted_data[len(AESGCM_PREFIX) :].encode()
+                )
+                decrypted_data = self._aesgcm.decrypt(
+                    encrypted_bytes[:AESGCM_NONCE_SIZE],
+                    encrypted_bytes[AESGCM_NONCE_SIZE:],
+                    None,
+                )
+                return decrypted_data.decode()
+
+            # Legacy Fernet token, which older releases base64-encoded twice
+            encrypted_bytes = encrypted_data.encode()
+            if not encrypted_data.startswith(FERNET_TOKEN_PREFIX):
+                encrypted_bytes = base64.urlsafe_b64decode(encrypted_bytes)
             decrypted_data = self._fernet.decrypt(encrypted_bytes)
             return decrypted_data.decode()
 
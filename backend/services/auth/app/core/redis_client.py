@@ -3,13 +3,30 @@ Redis client configuration for caching and OTP storage
 """
 
 import redis
-import json
+import msgpack
+import orjson
 import logging
+from datetime import date, datetime
 from typing import Optional, Any
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
+# Namespace for msgpack-encoded structured values
+PACKED_KEY_PREFIX = "mp:"
+
+
+def _packed_key(key: str) -> str:
+    """Key under which a structured value is stored"""
+    return f"{PACKED_KEY_PREFIX}{key}"
+
+
+def _msgpack_default(value: Any) -> str:
+    """Encode types msgpack doesn't support natively"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
 
 class RedisClient:
     """Redis client wrapper for sync operations"""
@@ -17,24 +34,42 @@ class RedisClient:
     def __init__(self):
         self.redis_url = settings.REDIS_URL
         self._client: Optional[redis.Redis] = None
+        self._raw_client: Optional[redis.Redis] = None
+
+    def _create_client(self, **kwargs) -> redis.Redis:
+        """Create a Redis client over its own blocking connection pool"""
+        # redis-py picks the hiredis parser automatically when it is installed
+        pool = redis.BlockingConnectionPool.from_url(
+            self.redis_url,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            **kwargs,
+        )
+        return redis.Redis(connection_pool=pool)
 
     def connect(self):
         """Connect to Redis"""
         if not self._client:
-            self._client = redis.from_url(
-                self.redis_url, encoding="utf-8", decode_responses=True
-            )
+            self._client = self._create_client(encoding="utf-8", decode_responses=True)
         return self._client
 
+    def connect_raw(self):
+        """Connect to Redis without response decoding (for cached bytes)"""
+        if not self._raw_client:
+            self._raw_client = self._create_client(decode_responses=False)
+        return self._raw_client
+
     def close(self):
         """Close Redis connection"""
-        if self._client:
-            try:
-                self._client.close()
-            except Exception as e:
-                # Log the exception but don't raise it during cleanup
-                print(f"Warning: Error closing Redis connection: {e}")
-            self._client = None
+        for client in (self._client, self._raw_client):
+            if client:
+                try:
+                    client.close()
+                    client.connection_pool.disconnect()
+                except Exception as e:
+                    # Log the exception but don't raise it during cleanup
+                    print(f"Warning: Error closing Redis connection: {e}")
+        self._client = None
+        self._raw_client = None
 
     def ping(self) -> bool:
         """Test Redis connection"""
@@ -48,12 +83,23 @@ class RedisClient:
 
     def set(self, key: str, value: Any, expire: Optional[int] = None) -> bool:
         """Set a key-value pair with optional expiration"""
-        client = self.connect()
         try:
             if isinstance(value, (dict, list)):
-                value = json.dumps(value)
-
-            result = client.set(key, value, ex=expire)
+                # Structured values are msgpack-encoded under their own key;
+                # drop any JSON copy left by older releases
+                client = self.connect_raw()
+                key, stale_key = _packed_key(key), key
+                value = msgpack.packb(
+                    value, default=_msgpack_default, use_bin_type=True
+                )
+            else:
+                client = self.connect()
+                stale_key = _packed_key(key)
+
+            pipe = client.pipeline(transaction=False)
+            pipe.set(key, value, ex=expire)
+            pipe.delete(stale_key)
+            result, _ = pipe.execute()
             return bool(result)
         except Exception as e:
             logger.error(f"Redis set error: {e}")
@@ -61,14 +107,17 @@ class RedisClient:
 
     def get(self, key: str) -> Optional[Any]:
         """Get value by key"""
-        client = self.connect()
+        client = self.connect_raw()
         try:
-            value = client.get(key)
+            packed, value = client.mget(_packed_key(key), key)
+            if packed is not None:
+                return msgpack.unpackb(packed, raw=False)
             if value:
+                value = value.decode()
                 try:
-                    # Try to parse as JSON
-                    return json.loads(value)
-                except json.JSONDecodeError:
+                    # Try to parse as JSON (entries written before msgpack)
+                    return orjson.loads(value)
+                except orjson.JSONDecodeError:
                     # Return as string if not JSON
                     return value
             return None
@@ -76,21 +125,54 @@ class RedisClient:
             logger.error(f"Redis get error: {e}")
             return None
 
+    def set_bytes(self, key: str, value: bytes, expire: Optional[int] = None) -> bool:
+        """Set a raw bytes value with optional expiration"""
+        client = self.connect_raw()
+        try:
+            result = client.set(key, value, ex=expire)
+            return bool(result)
+        except Exception as e:
+            logger.error(f"Redis set_bytes error: {e}")
+            return False
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        """Get raw bytes value by key"""
+        client = self.connect_raw()
+        try:
+            return client.get(key)
+        except Exception as e:
+            logger.error(f"Redis get_bytes error: {e}")
+            return None
+
     def delete(self, key: str) -> bool:
         """Delete a key"""
         client = self.connect()
         try:
-            result = client.delete(key)
+            result = client.delete(key, _packed_key(key))
             return bool(result)
         except Exception as e:
             logger.error(f"Redis delete error: {e}")
             return False
 
+    def get_generation(self, key: str) -> int:
+        """
+        Current value of a cache generation counter (0 if never bumped)
+
+        Cached entries embed the generation in their key; bumping it with
+        incr() invalidates them all without scanning the keyspace.
+        """
+        client = self.connect()
+        try:
+            return int(client.get(key) or 0)
+        except Exception as e:
+            logger.error(f"Redis get_generation error: {e}")
+            return 0
+
     def exists(self, key: str) -> bool:
         """Check if key exists"""
         client = self.connect()
         try:
-            result = client.exists(key)
+            result = client.exists(key, _packed_key(key))
             return bool(result)
         except Exception as e:
             logger.error(f"Redis exists error: {e}")
@@ -106,12 +188,32 @@ class RedisClient:
             logger.error(f"Redis incr error: {e}")
             return None
 
+    def incr_with_expiry(
+        self, key: str, seconds: int, amount: int = 1
+    ) -> Optional[int]:
+        """Increment a counter and (re)set its expiration in one round-trip"""
+        try:
+            with self.pipeline() as pipe:
+                pipe.incr(key, amount)
+                pipe.expire(key, seconds)
+                result, _ = pipe.execute()
+            return result
+        except Exception as e:
+            logger.error(f"Redis incr_with_expiry error: {e}")
+            return None
+
+    def pipeline(self):
+        """Non-transactional pipeline for batching commands into one round-trip"""
+        return self.connect().pipeline(transaction=False)
+
     def expire(self, key: str, seconds: int) -> bool:
         """Set expiration for a key"""
         client = self.connect()
         try:
-            result = client.expire(key, seconds)
-            return bool(result)
+            pipe = client.pipeline(transaction=False)
+            pipe.expire(key, seconds)
+            pipe.expire(_packed_key(key), seconds)
+            return any(pipe.execute())
         except Exception as e:
             logger.error(f"Redis expire error: {e}")
             return False
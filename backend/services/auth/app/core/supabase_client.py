@@ -2,45 +2,85 @@
 Supabase client configuration and utilities
 """
 
-from supabase import create_client, Client
+from typing import TYPE_CHECKING
+import httpx
 from app.core.config import settings
+from app.core.redis_client import redis_client
 import logging
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 logger = logging.getLogger(__name__)
 
+# Connection reuse for PostgREST (table) requests
+POSTGREST_HTTP_LIMITS = httpx.Limits(
+    max_connections=50, max_keepalive_connections=20, keepalive_expiry=60
+)
+
+
+def _profile_cache_key(user_id: str) -> str:
+    """Redis key for a cached Supabase profile"""
+    return f"supabase_profile:{user_id}"
+
+
+def _use_persistent_http2_session(client: "Client") -> "Client":
+    """
+    Swap the client's PostgREST session for one with HTTP/2 and keep-alive
+    limits (supabase-py doesn't accept a custom httpx client)
+    """
+    from postgrest.utils import SyncClient
+
+    postgrest = client.postgrest
+    session = postgrest.session
+    postgrest.session = SyncClient(
+        base_url=session.base_url,
+        headers=session.headers,
+        timeout=session.timeout,
+        http2=True,
+        limits=POSTGREST_HTTP_LIMITS,
+    )
+    session.close()
+    return client
+
 
 class SupabaseClient:
     """Supabase client wrapper"""
 
     def __init__(self):
-        self._client: Client = None
-        self._service_client: Client = None
+        self._client: "Client" = None
+        self._service_client: "Client" = None
 
     @property
-    def client(self) -> Client:
+    def client(self) -> "Client":
         """Get Supabase client with anon key (for client-side operations)"""
         if not self._client:
             if not settings.SUPABASE_URL or not settings.SUPABASE_ANON_KEY:
                 logger.warning("Supabase credentials not configured")
                 return None
 
-            self._client = create_client(
-                settings.SUPABASE_URL, settings.SUPABASE_ANON_KEY
+            # Imported on first use; supabase pulls in a large dependency tree
+            from supabase import create_client
+
+            self._client = _use_persistent_http2_session(
+                create_client(settings.SUPABASE_URL, settings.SUPABASE_ANON_KEY)
             )
             logger.info("Supabase client initialized")
 
         return self._client
 
     @property
-    def service_client(self) -> Client:
+    def service_client(self) -> "Client":
         """Get Supabase client with service role key (for server-side operations)"""
         if not self._service_client:
             if not settings.SUPABASE_URL or not settings.SUPABASE_SERVICE_KEY:
                 logger.warning("Supabase service credentials not configured")
                 return None
 
-            self._service_client = create_client(
-                settings.SUPABASE_URL, settings.SUPABASE_SERVICE_KEY
+            from supabase import create_client
+
+            self._service_client = _use_persistent_http2_session(
+                create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_KEY)
             )
             logger.info("Supabase service client initialized")
 
@@ -86,14 +126,22 @@ class SupabaseClient:
             if not self.service_client:
                 raise Exception("Supabase service client not available")
 
-            response = (
-                self.service_client.table("profiles")
-                .select("*")
-                .eq("id", user_id)
-                .execute()
-            )
+            cache_key = _profile_cache_key(user_id)
+            cached_profile = redis_client.get(cache_key)
+            if cached_profile:
+                return cached_profile
+
+            # get_profile is a server-side function with a cached plan
+            response = self.service_client.rpc(
+                "get_profile", {"profile_id": user_id}
+            ).execute()
 
             if response.data:
+                redis_client.set(
+                    cache_key,
+                    response.data[0],
+                    expire=settings.PROFILE_CACHE_TTL_SECONDS,
+                )
                 return response.data[0]
             else:
                 return None
@@ -115,6 +163,8 @@ class SupabaseClient:
                 .execute()
             )
 
+            redis_client.delete(_profile_cache_key(user_id))
+
             if response.data:
                 logger.info(f"User profile updated: {user_id}")
                 return response.data[0]
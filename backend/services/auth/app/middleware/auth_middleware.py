@@ -2,109 +2,196 @@
 Authentication middleware for protecting routes
 """
 
+import functools
+import hashlib
 import logging
-from typing import Optional
-from fastapi import HTTPException, status, Depends
+import time
+import uuid
+from typing import Any, Dict, Optional
+from fastapi import HTTPException, Request, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.ttl_cache import TTLCache
 from app.services.jwt_service import jwt_service
-from app.models.user_profile import UserProfile
+from app.models.user_profile import UserProfile, UserRole
+from app.schemas.auth import AuthPrincipal
 from app.core.supabase_client import supabase_client
 
 logger = logging.getLogger(__name__)
 
 # Security scheme for Bearer token
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+# Roles accepted by the fixed role guards
+_ADMIN_ROLES = frozenset({UserRole.ADMIN})
+_MANAGER_ROLES = frozenset({UserRole.MANAGER})
+
+# Verified token payloads, keyed by a digest of the raw token
+TOKEN_CACHE_MAX_SECONDS = 600
+_token_cache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_MAX_SECONDS)
+
+
+def _verify_token_cached(token: str) -> Dict[str, Any]:
+    """Verify a token, reusing the payload of a recent successful verify"""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    # Failures raise here and are never cached
+    payload = jwt_service.verify_token(token)
+    exp = payload.get("exp")
+    if exp is not None:
+        _token_cache.set(key, payload, ttl=exp - time.time())
+    return payload
+
+
+# Principals keyed by Supabase user ID; pop an entry after changing a
+# user's role, fleet or active flag so the next request reloads it
+auth_cache = TTLCache(maxsize=10000, ttl=settings.AUTH_USER_CACHE_TTL_SECONDS)
+
+# Built once so every auth lookup reuses the same cached compilation. Only
+# the principal's columns are selected, as plain rows.
+_AUTH_USER_STMT = select(
+    UserProfile.id,
+    UserProfile.user_id,
+    UserProfile.role,
+    UserProfile.is_active,
+    UserProfile.fleet_id,
+).where(UserProfile.user_id == bindparam("uid"))
+
+
+async def _load_principal(user_id: str, db: AsyncSession) -> AuthPrincipal:
+    """Load the principal for a user from the database"""
+    try:
+        uid = uuid.UUID(user_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    try:
+        result = await db.execute(_AUTH_USER_STMT, {"uid": uid})
+        row = result.first()
+    except Exception as e:
+        logger.error("Database query error: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return AuthPrincipal.model_validate(row)
+
+
+# Existence check for admin-only routes; answered from the partial
+# user_id index without hydrating a profile row
+_ACTIVE_ADMIN_STMT = select(literal(True)).where(
+    UserProfile.user_id == bindparam("uid"),
+    UserProfile.is_active.is_(True),
+    UserProfile.role == UserRole.ADMIN,
+)
+
+
+async def _resolve_user(
+    request: Request, token: str, async_db: AsyncSession
+) -> AuthPrincipal:
+    """Resolve a bearer token to an active principal, memoized per request"""
+    principal = getattr(request.state, "auth_user", None)
+    if principal is not None:
+        return principal
+
+    try:
+        # Verify token
+        payload = _verify_token_cached(token)
+        user_id = payload.get("sub")
+
+        if not user_id:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authentication credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        principal = auth_cache.get(user_id)
+        if principal is None:
+            principal = await _load_principal(user_id, async_db)
+            auth_cache.set(user_id, principal)
+
+        if not principal.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User account is inactive",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        logger.debug("User authenticated: %s", principal.id)
+        request.state.auth_user = principal
+        return principal
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Authentication error: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
 
 class AuthMiddleware:
     """Authentication middleware class"""
 
     @staticmethod
-    def get_current_user(
+    async def get_current_user(
+        request: Request,
         credentials: HTTPAuthorizationCredentials = Depends(security),
-        db: Session = Depends(get_db),
-    ) -> UserProfile:
+        async_db: AsyncSession = Depends(get_async_db),
+    ) -> AuthPrincipal:
         """
         Get current authenticated user from JWT token
 
+        The resolved principal is memoized on request.state for the rest of
+        the request, so stacked auth dependencies share a single lookup.
+        Cache misses are loaded over the async engine without blocking a
+        worker thread. The principal is not bound to any session; routes
+        that need the full profile load it themselves.
+
         Args:
+            request: Incoming request
             credentials: HTTP Bearer credentials
-            db: Database session
+            async_db: Async database session for the user lookup
 
         Returns:
-            UserProfile: Current user profile
+            AuthPrincipal: Current user
 
         Raises:
             HTTPException: If authentication fails
         """
-        try:
-            # Extract token
-            token = credentials.credentials
-
-            # Verify token
-            payload = jwt_service.verify_token(token)
-            user_id = payload.get("sub")
-
-            if not user_id:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid authentication credentials",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
+        return await _resolve_user(request, credentials.credentials, async_db)
 
-            # Get user from database
-            try:
-                # Use string comparison to avoid UUID casting issues
-                from sqlalchemy import text
-
-                user = (
-                    db.query(UserProfile)
-                    .filter(text("user_id::text = :user_id"))
-                    .params(user_id=user_id)
-                    .first()
-                )
-            except Exception as e:
-                logger.error(f"Database query error: {e}")
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Could not validate credentials",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-
-            if not user:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="User not found",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-
-            if not user.is_active:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="User account is inactive",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-
-            logger.debug(f"User authenticated: {user.id}")
-            return user
-
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Authentication error: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    # Dependencies below unwrap the staticmethod so FastAPI sees the
+    # coroutine function and shares its result with get_current_user
 
     @staticmethod
     def get_current_active_user(
-        current_user: UserProfile = Depends(get_current_user),
-    ) -> UserProfile:
+        current_user: AuthPrincipal = Depends(get_current_user.__func__),
+    ) -> AuthPrincipal:
         """
         Get current active user (alias for get_current_user)
 
@@ -112,26 +199,31 @@ class AuthMiddleware:
             current_user: Current user from get_current_user
 
         Returns:
-            UserProfile: Current active user
+            AuthPrincipal: Current active user
         """
         return current_user
 
     @staticmethod
+    @functools.lru_cache(maxsize=8)
     def require_role(required_role: str):
         """
         Create dependency that requires specific user role
 
+        The checker is memoized per role so every route guarded by the same
+        role shares one dependency, which FastAPI resolves once per request.
+
         Args:
             required_role: Required user role (admin, manager, passenger)
 
         Returns:
             Dependency function
         """
+        allowed_roles = frozenset({UserRole(required_role)})
 
         def role_checker(
-            current_user: UserProfile = Depends(AuthMiddleware.get_current_user),
-        ) -> UserProfile:
-            if current_user.role.value != required_role:
+            current_user: AuthPrincipal = Depends(AuthMiddleware.get_current_user),
+        ) -> AuthPrincipal:
+            if current_user.role not in allowed_roles:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail=f"Operation requires {required_role} role",
@@ -142,8 +234,8 @@ class AuthMiddleware:
 
     @staticmethod
     def require_admin(
-        current_user: UserProfile = Depends(get_current_user),
-    ) -> UserProfile:
+        current_user: AuthPrincipal = Depends(get_current_user.__func__),
+    ) -> AuthPrincipal:
         """
         Require admin role
 
@@ -151,21 +243,74 @@ class AuthMiddleware:
             current_user: Current user
 
         Returns:
-            UserProfile: Admin user
+            AuthPrincipal: Admin user
 
         Raises:
             HTTPException: If user is not admin
         """
-        if current_user.role.value != "admin":
+        if current_user.role not in _ADMIN_ROLES:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required"
             )
         return current_user
 
+    @staticmethod
+    async def require_admin_fast(
+        credentials: HTTPAuthorizationCredentials = Depends(security),
+        async_db: AsyncSession = Depends(get_async_db),
+    ) -> str:
+        """
+        Require an active admin without loading the user profile
+
+        Use on admin routes that only need the caller's ID; routes that
+        need the principal should keep using require_admin.
+
+        Args:
+            credentials: HTTP Bearer credentials
+            async_db: Async database session for the admin check
+
+        Returns:
+            str: Supabase user ID of the admin
+
+        Raises:
+            HTTPException: If authentication fails or user is not admin
+        """
+        try:
+            payload = _verify_token_cached(credentials.credentials)
+            user_id = payload.get("sub")
+            uid = uuid.UUID(user_id) if user_id else None
+        except Exception as e:
+            logger.error("Authentication error: %s", e)
+            uid = None
+
+        if uid is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authentication credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        try:
+            result = await async_db.execute(_ACTIVE_ADMIN_STMT, {"uid": uid})
+            is_admin = result.scalar()
+        except Exception as e:
+            logger.error("Database query error: %s", e)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        if not is_admin:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required"
+            )
+        return user_id
+
     @staticmethod
     def require_manager(
-        current_user: UserProfile = Depends(get_current_user),
-    ) -> UserProfile:
+        current_user: AuthPrincipal = Depends(get_current_user.__func__),
+    ) -> AuthPrincipal:
         """
         Require manager role
 
@@ -173,44 +318,41 @@ class AuthMiddleware:
             current_user: Current user
 
         Returns:
-            UserProfile: Manager user
+            AuthPrincipal: Manager user
 
         Raises:
             HTTPException: If user is not manager
         """
-        if current_user.role.value != "manager":
+        if current_user.role not in _MANAGER_ROLES:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail="Manager access required"
             )
         return current_user
 
     @staticmethod
-    def get_optional_user(
+    async def get_optional_user(
+        request: Request,
         credentials: Optional[HTTPAuthorizationCredentials] = Depends(
-            HTTPBearer(auto_error=False)
+            optional_security
         ),
-        db: Session = Depends(get_db),
-    ) -> Optional[UserProfile]:
+        async_db: AsyncSession = Depends(get_async_db),
+    ) -> Optional[AuthPrincipal]:
         """
         Get current user if token is provided, otherwise return None
 
         Args:
+            request: Incoming request
             credentials: Optional HTTP Bearer credentials
-            db: Database session
+            async_db: Async database session for the user lookup
 
         Returns:
-            UserProfile or None
+            AuthPrincipal or None
         """
         if not credentials:
             return None
 
         try:
-            return AuthMiddleware.get_current_user(
-                HTTPAuthorizationCredentials(
-                    scheme="Bearer", credentials=credentials.credentials
-                ),
-                db,
-            )
+            return await _resolve_user(request, credentials.credentials, async_db)
         except HTTPException:
             return None
 
@@ -219,5 +361,6 @@ class AuthMiddleware:
 get_current_user = AuthMiddleware.get_current_user
 get_current_active_user = AuthMiddleware.get_current_active_user
 require_admin = AuthMiddleware.require_admin
+require_admin_fast = AuthMiddleware.require_admin_fast
 require_manager = AuthMiddleware.require_manager
 get_optional_user = AuthMiddleware.get_optional_user
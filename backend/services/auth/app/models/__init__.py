@@ -1,4 +1,8 @@
 # Models package
+from sqlalchemy.orm import configure_mappers
+
+from .user_profile import UserProfile, UserRole
+from .audit_log import AuditLog
 from .fleet import Fleet
 from .simple_vehicle import SimpleVehicle
 from .simple_driver import SimpleDriver
@@ -11,6 +15,7 @@ from .vehicle_status import (
 )
 from .fleet_analytics import (
     PerformanceMetric,
+    PerformanceMeasures,
     RoutePerformance,
     VehiclePerformanceSummary,
     FleetKPI,
@@ -19,7 +24,6 @@ from .trip import (
     Route,
     Trip,
     TripTemplate,
-    TripStatus,
 )
 from .booking import (
     Booking,
@@ -47,3 +51,7 @@ from .trip_status import (
     TripStatusEnum,
     UpdateSourceEnum,
 )
+
+# Resolve the relationship graph at import time instead of on the first
+# query, which also surfaces a missing model import at startup
+configure_mappers()
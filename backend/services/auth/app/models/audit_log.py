@@ -2,40 +2,44 @@
 Audit log model for tracking admin actions
 """
 
-import uuid
-from datetime import datetime
 from sqlalchemy import Column, String, DateTime, Text, JSON
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
 
 from app.core.database import Base
+from app.utils.ids import uuid7
+from app.models.mixins import ModelMixin
 
 
-class AuditLog(Base):
+class AuditLog(ModelMixin, Base):
     """Audit log model for tracking admin actions"""
 
     __tablename__ = "audit_logs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     admin_id = Column(String(36), nullable=False, index=True)
     action = Column(String(100), nullable=False, index=True)
     target_user_id = Column(String(36), nullable=True, index=True)
     details = Column(JSON, nullable=True)
     ip_address = Column(String(45), nullable=True)
     user_agent = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
+    )
 
     def __repr__(self):
         return f"<AuditLog(id={self.id}, admin_id='{self.admin_id}', action='{self.action}')>"
 
-    def to_dict(self):
-        """Convert audit log to dictionary"""
-        return {
-            "id": str(self.id),
-            "admin_id": self.admin_id,
-            "action": self.action,
-            "target_user_id": self.target_user_id,
-            "details": self.details,
-            "ip_address": self.ip_address,
-            "user_agent": self.user_agent,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
+    _dict_fields = (
+        "id",
+        "admin_id",
+        "action",
+        "target_user_id",
+        "details",
+        "ip_address",
+        "user_agent",
+        "created_at",
+    )
+    _dict_converters = {
+        "id": str,
+    }
@@ -2,7 +2,6 @@
 Booking models for passenger seat booking system
 """
 
-import uuid
 import enum
 from datetime import datetime, date
 from decimal import Decimal
@@ -19,13 +18,17 @@ from sqlalchemy import (
     DECIMAL,
     ARRAY,
     CheckConstraint,
-    Enum as SQLEnum,
+    Index,
+    Sequence,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.core.database import Base
+from app.utils.ids import uuid7
+from app.models.mixins import ModelMixin
 
 
 class BookingStatus(str, enum.Enum):
@@ -67,12 +70,12 @@ class SeatPreference(str, enum.Enum):
     ANY = "any"
 
 
-class Passenger(Base):
+class Passenger(ModelMixin, Base):
     """Passenger model for booking system"""
 
     __tablename__ = "passengers"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True), ForeignKey("user_profiles.id"), nullable=True
     )  # Optional for registered users
@@ -104,32 +107,36 @@ class Passenger(Base):
     def __repr__(self):
         return f"<Passenger(id={self.id}, name='{self.first_name} {self.last_name}')>"
 
-    def to_dict(self):
-        """Convert passenger to dictionary"""
-        return {
-            "id": str(self.id),
-            "user_id": str(self.user_id) if self.user_id else None,
-            "first_name": self.first_name,
-            "last_name": self.last_name,
-            "phone": self.phone,
-            "email": self.email,
-            "date_of_birth": (
-                self.date_of_birth.isoformat() if self.date_of_birth else None
-            ),
-            "national_id": self.national_id,
-            "preferred_seat_type": self.preferred_seat_type,
-            "loyalty_points": self.loyalty_points,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
-
-
-class Booking(Base):
+    _dict_fields = (
+        "id",
+        "user_id",
+        "first_name",
+        "last_name",
+        "phone",
+        "email",
+        "date_of_birth",
+        "national_id",
+        "preferred_seat_type",
+        "loyalty_points",
+        "created_at",
+        "updated_at",
+    )
+    _dict_converters = {
+        "id": str,
+        "user_id": str,
+    }
+
+
+# Backs Booking.booking_reference; created ahead of the bookings table
+booking_ref_seq = Sequence("booking_ref_seq", metadata=Base.metadata)
+
+
+class Booking(ModelMixin, Base):
     """Booking model for trip reservations"""
 
     __tablename__ = "bookings"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     trip_id = Column(
         UUID(as_uuid=True), ForeignKey("trips.id", ondelete="CASCADE"), nullable=False
     )
@@ -138,7 +145,15 @@ class Booking(Base):
         ForeignKey("passengers.id", ondelete="CASCADE"),
         nullable=False,
     )
-    booking_reference = Column(String(20), unique=True, nullable=False, index=True)
+    booking_reference = Column(
+        String(20),
+        unique=True,
+        nullable=False,
+        index=True,
+        server_default=text(
+            "'BKG-' || lpad(nextval('booking_ref_seq')::text, 10, '0')"
+        ),
+    )  # Assigned by the database from booking_ref_seq
 
     # Booking Details
     seats_booked = Column(Integer, nullable=False)
@@ -182,6 +197,16 @@ class Booking(Base):
             "array_length(seat_numbers, 1) = seats_booked",
             name="seat_numbers_match_count",
         ),
+        # Passenger booking history, filtered by status
+        Index("ix_bookings_passenger_status", "passenger_id", "booking_status"),
+        # Seat availability only looks at bookings still holding seats
+        Index(
+            "ix_bookings_trip_active",
+            "trip_id",
+            postgresql_where=text("booking_status IN ('pending', 'confirmed')"),
+        ),
+        # Seat conflict checks use array overlap (seat_numbers && ...)
+        Index("ix_bookings_seat_numbers_gin", "seat_numbers", postgresql_using="gin"),
     )
 
     # Relationships
@@ -197,42 +222,44 @@ class Booking(Base):
     def __repr__(self):
         return f"<Booking(id={self.id}, reference='{self.booking_reference}')>"
 
-    def to_dict(self):
-        """Convert booking to dictionary"""
-        return {
-            "id": str(self.id),
-            "trip_id": str(self.trip_id),
-            "passenger_id": str(self.passenger_id),
-            "booking_reference": self.booking_reference,
-            "seats_booked": self.seats_booked,
-            "seat_numbers": self.seat_numbers,
-            "total_fare": float(self.total_fare),
-            "booking_status": self.booking_status,
-            "payment_method": self.payment_method if self.payment_method else None,
-            "payment_status": self.payment_status,
-            "amount_paid": float(self.amount_paid),
-            "amount_due": float(self.amount_due),
-            "passenger_name": self.passenger_name,
-            "passenger_phone": self.passenger_phone,
-            "passenger_email": self.passenger_email,
-            "emergency_contact": self.emergency_contact,
-            "booking_date": (
-                self.booking_date.isoformat() if self.booking_date else None
-            ),
-            "payment_deadline": (
-                self.payment_deadline.isoformat() if self.payment_deadline else None
-            ),
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
-
-
-class Payment(Base):
+    _dict_fields = (
+        "id",
+        "trip_id",
+        "passenger_id",
+        "booking_reference",
+        "seats_booked",
+        "seat_numbers",
+        "total_fare",
+        "booking_status",
+        "payment_method",
+        "payment_status",
+        "amount_paid",
+        "amount_due",
+        "passenger_name",
+        "passenger_phone",
+        "passenger_email",
+        "emergency_contact",
+        "booking_date",
+        "payment_deadline",
+        "created_at",
+        "updated_at",
+    )
+    _dict_converters = {
+        "id": str,
+        "trip_id": str,
+        "passenger_id": str,
+        "total_fare": float,
+        "amount_paid": float,
+        "amount_due": float,
+    }
+
+
+class Payment(ModelMixin, Base):
     """Payment model for booking transactions"""
 
     __tablename__ = "payments"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     booking_id = Column(
         UUID(as_uuid=True),
         ForeignKey("bookings.id", ondelete="CASCADE"),
@@ -241,7 +268,7 @@ class Payment(Base):
 
     # Payment Details
     payment_reference = Column(String(50), unique=True, nullable=False, index=True)
-    payment_method = Column(SQLEnum(PaymentMethod), nullable=False)
+    payment_method = Column(String(20), nullable=False)  # PaymentMethod value
     amount = Column(DECIMAL(10, 2), nullable=False)
     currency = Column(String(3), default="KES", nullable=False)
 
@@ -250,7 +277,9 @@ class Payment(Base):
     gateway_response = Column(Text, nullable=True)
 
     # Status
-    payment_status = Column(SQLEnum(PaymentStatus), default="pending", nullable=False)
+    payment_status = Column(
+        String(20), default=PaymentStatus.PENDING.value, nullable=False
+    )  # PaymentStatus value
     processed_at = Column(DateTime(timezone=True), nullable=True)
 
     # Timestamps
@@ -260,7 +289,10 @@ class Payment(Base):
     )
 
     # Constraints
-    __table_args__ = (CheckConstraint("amount > 0", name="positive_payment_amount"),)
+    __table_args__ = (
+        CheckConstraint("amount > 0", name="positive_payment_amount"),
+        Index("idx_payments_status", "payment_status"),
+    )
 
     # Relationships
     booking = relationship("Booking", back_populates="payments")
@@ -268,21 +300,22 @@ class Payment(Base):
     def __repr__(self):
         return f"<Payment(id={self.id}, reference='{self.payment_reference}')>"
 
-    def to_dict(self):
-        """Convert payment to dictionary"""
-        return {
-            "id": str(self.id),
-            "booking_id": str(self.booking_id),
-            "payment_reference": self.payment_reference,
-            "payment_method": self.payment_method.value,
-            "amount": float(self.amount),
-            "currency": self.currency,
-            "gateway_transaction_id": self.gateway_transaction_id,
-            "gateway_response": self.gateway_response,
-            "payment_status": self.payment_status.value,
-            "processed_at": (
-                self.processed_at.isoformat() if self.processed_at else None
-            ),
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+    _dict_fields = (
+        "id",
+        "booking_id",
+        "payment_reference",
+        "payment_method",
+        "amount",
+        "currency",
+        "gateway_transaction_id",
+        "gateway_response",
+        "payment_status",
+        "processed_at",
+        "created_at",
+        "updated_at",
+    )
+    _dict_converters = {
+        "id": str,
+        "booking_id": str,
+        "amount": float,
+    }
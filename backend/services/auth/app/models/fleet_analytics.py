@@ -3,24 +3,42 @@ Fleet performance analytics models
 """
 
 import uuid
-from datetime import datetime, date
-from typing import Optional
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Optional
 from sqlalchemy import (
+    BigInteger,
     Column,
+    Computed,
     String,
     DateTime,
     Integer,
-    Float,
-    Boolean,
     ForeignKey,
     Date,
     Text,
+    Index,
+    MetaData,
+    PrimaryKeyConstraint,
+    Table,
+    UniqueConstraint,
+    text,
+    DDL,
+    FetchedValue,
+    event,
 )
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
 from enum import Enum
 
 from app.core.database import Base
+from app.models.trip_status import GPSLocation
+from app.utils.ids import uuid7
+
+if TYPE_CHECKING:
+    from app.models.fleet import Fleet
+    from app.models.simple_driver import SimpleDriver
+    from app.models.simple_vehicle import SimpleVehicle
+    from app.models.user_profile import UserProfile
 
 
 class MetricTypeEnum(str, Enum):
@@ -39,54 +57,160 @@ class MetricTypeEnum(str, Enum):
 
 
 class PerformanceMetric(Base):
-    """Store performance metrics for vehicles and fleet"""
+    """
+    Performance metrics for vehicles and fleet, one row per reading
+
+    Read-only: superseded by PerformanceMeasures and kept for existing
+    readers of the table.
+    """
 
     __tablename__ = "performance_metrics"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    vehicle_id = Column(
-        UUID(as_uuid=True),
-        ForeignKey("vehicles.id", ondelete="CASCADE"),
-        nullable=True,  # Null for fleet-wide metrics
-        index=True,
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), server_default=text("gen_random_uuid()")
     )
-    fleet_id = Column(
-        UUID(as_uuid=True),
-        ForeignKey("fleets.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+    # Null for fleet-wide metrics
+    vehicle_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("vehicles.id", ondelete="CASCADE"), index=True
     )
-    metric_type = Column(String(50), nullable=False, index=True)
-    metric_value = Column(Float, nullable=False)
-    metric_unit = Column(String(20), nullable=True)  # km, liters, KES, hours, etc.
+    fleet_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("fleets.id", ondelete="CASCADE")
+    )
+    metric_type: Mapped[str] = mapped_column(String(50))
+    metric_value: Mapped[float]
+    # km, liters, KES, hours, etc.
+    metric_unit: Mapped[Optional[str]] = mapped_column(String(20))
 
     # Time period
-    date_recorded = Column(Date, nullable=False, index=True)
-    period_start = Column(DateTime, nullable=True)
-    period_end = Column(DateTime, nullable=True)
+    date_recorded: Mapped[date]
+    period_start: Mapped[Optional[datetime]]
+    period_end: Mapped[Optional[datetime]]
 
     # Context
-    route_id = Column(String(100), nullable=True, index=True)
-    driver_id = Column(
-        UUID(as_uuid=True), ForeignKey("drivers.id", ondelete="SET NULL"), nullable=True
+    route_id: Mapped[Optional[str]] = mapped_column(String(100), index=True)
+    driver_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("drivers.id", ondelete="SET NULL")
     )
 
     # Additional data
-    notes = Column(Text, nullable=True)
-    recorded_by = Column(
-        UUID(as_uuid=True), ForeignKey("user_profiles.id"), nullable=False
+    notes: Mapped[Optional[str]] = mapped_column(Text)
+    recorded_by: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("user_profiles.id")
     )
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),  # update_updated_at_column trigger
     )
 
     # Relationships
-    vehicle = relationship("SimpleVehicle")
-    fleet = relationship("Fleet")
-    driver = relationship("SimpleDriver")
-    recorder = relationship("UserProfile")
+    vehicle: Mapped[Optional["SimpleVehicle"]] = relationship(lazy="raise_on_sql")
+    fleet: Mapped["Fleet"] = relationship(lazy="raise_on_sql")
+    driver: Mapped[Optional["SimpleDriver"]] = relationship(lazy="raise_on_sql")
+    recorder: Mapped["UserProfile"] = relationship(lazy="raise_on_sql")
+
+    # Monthly range partitions on date_recorded; PostgreSQL requires the
+    # partition key in the primary key, the mapper keeps identity on id.
+    # Dashboard reads filter by fleet and day, then metric type; the
+    # included value lets aggregates skip the heap. Rows arrive in date
+    # order, so plain date scans use a BRIN range summary of a few pages
+    # instead of a btree entry per row
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "date_recorded"),
+        Index(
+            "ix_perf_fleet_date_type",
+            "fleet_id",
+            "date_recorded",
+            "metric_type",
+            postgresql_include=["metric_value"],
+        ),
+        Index(
+            "ix_perf_date_brin",
+            "date_recorded",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        {"postgresql_partition_by": "RANGE (date_recorded)"},
+    )
+    # Server-side timestamps are loaded on access, not RETURNed per insert
+    __mapper_args__ = {"primary_key": [id], "eager_defaults": False}
+
+
+def _measure_index(name: str, metric: MetricTypeEnum) -> Index:
+    """Partial index on one measure for the fleet/day reads that use it"""
+    return Index(
+        name,
+        "fleet_id",
+        "date_recorded",
+        text(f"((measures->>'{metric.value}')::float)"),
+        postgresql_where=text(f"measures ? '{metric.value}'"),
+    )
+
+
+class PerformanceMeasures(Base):
+    """Performance metrics for a vehicle (or the whole fleet) on one day"""
+
+    __tablename__ = "performance_metrics_v2"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), default=uuid7)
+    fleet_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("fleets.id", ondelete="CASCADE")
+    )
+    # Null for fleet-wide metrics
+    vehicle_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("vehicles.id", ondelete="CASCADE")
+    )
+    date_recorded: Mapped[date]
+
+    # Metric type -> value, e.g. {"fuel_efficiency": 9.5, "trip_count": 12}
+    measures: Mapped[dict] = mapped_column(JSONB, server_default=text("'{}'"))
+    # Metric type -> unit, period, route, driver and notes of that reading
+    details: Mapped[dict] = mapped_column(JSONB, server_default=text("'{}'"))
+
+    # Last manager to record a metric on this row
+    recorded_by: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("user_profiles.id")
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),  # update_updated_at_column trigger
+    )
+
+    # Relationships
+    vehicle: Mapped[Optional["SimpleVehicle"]] = relationship(lazy="raise_on_sql")
+    fleet: Mapped["Fleet"] = relationship(lazy="raise_on_sql")
+    recorder: Mapped["UserProfile"] = relationship(lazy="raise_on_sql")
+
+    # One row per vehicle and day, fleet-wide rows included (NULLS NOT
+    # DISTINCT); recording a metric merges it into the row's measures.
+    # Monthly range partitions on date_recorded, see PerformanceMetric.
+    # Dashboard averages read a measure from the partial index holding
+    # only the rows that carry it
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "date_recorded"),
+        UniqueConstraint(
+            "fleet_id",
+            "vehicle_id",
+            "date_recorded",
+            name="uq_perf_v2_fleet_vehicle_date",
+            postgresql_nulls_not_distinct=True,
+        ),
+        Index("ix_perf_v2_fleet_date", "fleet_id", "date_recorded"),
+        Index("ix_perf_v2_vehicle", "vehicle_id"),
+        _measure_index("ix_perf_v2_fuel", MetricTypeEnum.FUEL_EFFICIENCY),
+        _measure_index("ix_perf_v2_on_time", MetricTypeEnum.ON_TIME_PERFORMANCE),
+        {"postgresql_partition_by": "RANGE (date_recorded)"},
+    )
+    __mapper_args__ = {"primary_key": [id], "eager_defaults": False}
 
 
 class RoutePerformance(Base):
@@ -94,48 +218,69 @@ class RoutePerformance(Base):
 
     __tablename__ = "route_performance"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    fleet_id = Column(
-        UUID(as_uuid=True),
-        ForeignKey("fleets.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid7
+    )
+    fleet_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("fleets.id", ondelete="CASCADE"), index=True
     )
-    route_name = Column(String(200), nullable=False, index=True)
-    route_code = Column(String(50), nullable=True, index=True)
+    route_name: Mapped[str] = mapped_column(String(200), index=True)
+    route_code: Mapped[Optional[str]] = mapped_column(String(50), index=True)
 
     # Performance metrics
-    total_trips = Column(Integer, default=0, nullable=False)
-    total_distance_km = Column(Float, default=0.0, nullable=False)
-    total_revenue = Column(Integer, default=0, nullable=False)  # In cents
-    total_passengers = Column(Integer, default=0, nullable=False)
-    average_trip_time_minutes = Column(Float, nullable=True)
-    on_time_percentage = Column(Float, nullable=True)
+    total_trips: Mapped[int] = mapped_column(default=0)
+    total_distance_km: Mapped[float] = mapped_column(default=0.0)
+    total_revenue: Mapped[int] = mapped_column(BigInteger, default=0)  # In cents
+    total_passengers: Mapped[int] = mapped_column(default=0)
+    average_trip_time_minutes: Mapped[Optional[float]]
+    on_time_percentage: Mapped[Optional[float]]
 
     # Efficiency metrics
-    fuel_consumption_liters = Column(Float, nullable=True)
-    fuel_efficiency_km_per_liter = Column(Float, nullable=True)
-    maintenance_cost = Column(Integer, default=0, nullable=False)  # In cents
+    fuel_consumption_liters: Mapped[Optional[float]]
+    fuel_efficiency_km_per_liter: Mapped[Optional[float]]
+    maintenance_cost: Mapped[int] = mapped_column(BigInteger, default=0)  # In cents
 
     # Time period
-    date_recorded = Column(Date, nullable=False, index=True)
-    period_start = Column(DateTime, nullable=False)
-    period_end = Column(DateTime, nullable=False)
+    date_recorded: Mapped[date]
+    period_start: Mapped[datetime]
+    period_end: Mapped[datetime]
 
     # Metadata
-    recorded_by = Column(
-        UUID(as_uuid=True), ForeignKey("user_profiles.id"), nullable=False
+    recorded_by: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("user_profiles.id")
     )
-    notes = Column(Text, nullable=True)
+    notes: Mapped[Optional[str]] = mapped_column(Text)
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),  # update_updated_at_column trigger
     )
 
     # Relationships
-    fleet = relationship("Fleet")
-    recorder = relationship("UserProfile")
+    fleet: Mapped["Fleet"] = relationship(lazy="raise_on_sql")
+    recorder: Mapped["UserProfile"] = relationship(lazy="raise_on_sql")
+
+    # One record per route and day; codeless routes (NULL route_code)
+    # never conflict. Date scans use a BRIN range summary, see
+    # PerformanceMetric
+    __table_args__ = (
+        UniqueConstraint(
+            "fleet_id",
+            "route_code",
+            "date_recorded",
+            name="uq_route_perf_fleet_code_date",
+        ),
+        Index(
+            "ix_route_perf_date_brin",
+            "date_recorded",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
 
 class VehiclePerformanceSummary(Base):
@@ -143,63 +288,138 @@ class VehiclePerformanceSummary(Base):
 
     __tablename__ = "vehicle_performance_summary"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    vehicle_id = Column(
-        UUID(as_uuid=True),
-        ForeignKey("vehicles.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+    # Declared in physical layout order: 16/8-byte columns, then 4-byte,
+    # then variable-length, so rows carry no alignment padding
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), default=uuid7)
+    vehicle_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("vehicles.id", ondelete="CASCADE")
+    )
+    fleet_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("fleets.id", ondelete="CASCADE"), index=True
+    )
+
+    # Driver assignment
+    primary_driver_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("drivers.id", ondelete="SET NULL")
     )
-    fleet_id = Column(
-        UUID(as_uuid=True),
-        ForeignKey("fleets.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+
+    # Measured values
+    total_distance_km: Mapped[float] = mapped_column(default=0.0)
+    active_hours: Mapped[float] = mapped_column(default=0.0)
+    fuel_consumed_liters: Mapped[Optional[float]]
+    utilization_rate: Mapped[Optional[float]]  # Percentage
+    average_speed_kmh: Mapped[Optional[float]]
+    profit_margin: Mapped[Optional[float]]  # Percentage
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),  # update_updated_at_column trigger
     )
 
+    # Amounts in cents
+    total_revenue: Mapped[int] = mapped_column(BigInteger, default=0)
+    fuel_cost: Mapped[Optional[int]] = mapped_column(BigInteger)
+    maintenance_cost: Mapped[int] = mapped_column(BigInteger, default=0)
+    gross_revenue: Mapped[int] = mapped_column(BigInteger, default=0)
+    operating_cost: Mapped[int] = mapped_column(BigInteger, default=0)
+    net_profit: Mapped[int] = mapped_column(BigInteger, default=0)
+
     # Summary period
-    summary_date = Column(Date, nullable=False, index=True)
-    period_type = Column(String(20), nullable=False)  # daily, weekly, monthly
+    summary_date: Mapped[date]
 
     # Operational metrics
-    trips_completed = Column(Integer, default=0, nullable=False)
-    total_distance_km = Column(Float, default=0.0, nullable=False)
-    total_revenue = Column(Integer, default=0, nullable=False)  # In cents
-    total_passengers = Column(Integer, default=0, nullable=False)
-    active_hours = Column(Float, default=0.0, nullable=False)
-
-    # Efficiency metrics
-    fuel_consumed_liters = Column(Float, nullable=True)
-    fuel_cost = Column(Integer, nullable=True)  # In cents
-    maintenance_cost = Column(Integer, default=0, nullable=False)  # In cents
-    utilization_rate = Column(Float, nullable=True)  # Percentage
+    trips_completed: Mapped[int] = mapped_column(default=0)
+    total_passengers: Mapped[int] = mapped_column(default=0)
 
     # Performance indicators
-    average_speed_kmh = Column(Float, nullable=True)
-    on_time_trips = Column(Integer, default=0, nullable=False)
-    delayed_trips = Column(Integer, default=0, nullable=False)
-    cancelled_trips = Column(Integer, default=0, nullable=False)
+    on_time_trips: Mapped[int] = mapped_column(default=0)
+    delayed_trips: Mapped[int] = mapped_column(default=0)
+    cancelled_trips: Mapped[int] = mapped_column(default=0)
 
-    # Financial metrics
-    gross_revenue = Column(Integer, default=0, nullable=False)  # In cents
-    operating_cost = Column(Integer, default=0, nullable=False)  # In cents
-    net_profit = Column(Integer, default=0, nullable=False)  # In cents
-    profit_margin = Column(Float, nullable=True)  # Percentage
+    period_type: Mapped[str] = mapped_column(String(20))  # daily, weekly, monthly
 
-    # Driver assignment
-    primary_driver_id = Column(
-        UUID(as_uuid=True), ForeignKey("drivers.id", ondelete="SET NULL"), nullable=True
+    # Relationships
+    vehicle: Mapped["SimpleVehicle"] = relationship(lazy="raise_on_sql")
+    fleet: Mapped["Fleet"] = relationship(lazy="raise_on_sql")
+    primary_driver: Mapped[Optional["SimpleDriver"]] = relationship(lazy="raise_on_sql")
+
+    # Monthly range partitions on summary_date, see PerformanceMetric.
+    # One summary per vehicle, day and period type. Per-vehicle history
+    # lookups read these totals from the index alone; date scans use a
+    # BRIN range summary
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "summary_date"),
+        UniqueConstraint(
+            "vehicle_id",
+            "summary_date",
+            "period_type",
+            name="uq_vps_vehicle_date_period",
+        ),
+        Index(
+            "ix_vps_vehicle_date",
+            "vehicle_id",
+            "summary_date",
+            postgresql_include=["total_revenue", "total_distance_km", "active_hours"],
+        ),
+        Index(
+            "ix_vps_date_brin",
+            "summary_date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        {"postgresql_partition_by": "RANGE (summary_date)"},
     )
-
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    __mapper_args__ = {"primary_key": [id], "eager_defaults": False}
+
+
+# A partitioned table rejects rows no partition accepts; the DEFAULT partition
+# catches them until the monthly partitions are created (see
+# FleetAnalyticsService.ensure_monthly_partitions)
+for _partitioned in (
+    PerformanceMetric.__table__,
+    PerformanceMeasures.__table__,
+    VehiclePerformanceSummary.__table__,
+    GPSLocation.__table__,
+):
+    event.listen(
+        _partitioned,
+        "after_create",
+        DDL("CREATE TABLE %(table)s_default PARTITION OF %(table)s DEFAULT").execute_if(
+            dialect="postgresql"
+        ),
     )
 
-    # Relationships
-    vehicle = relationship("SimpleVehicle")
-    fleet = relationship("Fleet")
-    primary_driver = relationship("SimpleDriver")
+PARTITIONED_TABLES = {
+    PerformanceMetric.__tablename__: "date_recorded",
+    PerformanceMeasures.__tablename__: "date_recorded",
+    VehiclePerformanceSummary.__tablename__: "summary_date",
+    GPSLocation.__tablename__: "recorded_at",
+}
+
+
+# Materialized views are created by SQL migrations and kept out of
+# Base.metadata so create_all never tries to create them as tables
+view_metadata = MetaData()
+
+
+class VehicleDailySummary(Base):
+    """Read-only per-vehicle daily totals from mv_vehicle_daily_summary"""
+
+    __table__ = Table(
+        "mv_vehicle_daily_summary",
+        view_metadata,
+        Column("vehicle_id", UUID(as_uuid=True), primary_key=True),
+        Column("summary_date", Date, primary_key=True),
+        Column("fleet_id", UUID(as_uuid=True), nullable=False),
+        Column("trips_completed", Integer, nullable=False),
+        Column("cancelled_trips", Integer, nullable=False),
+        Column("total_passengers", Integer, nullable=False),
+        Column("total_revenue", BigInteger, nullable=False),  # In cents
+    )
 
 
 class FleetKPI(Base):
@@ -207,49 +427,76 @@ class FleetKPI(Base):
 
     __tablename__ = "fleet_kpis"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    fleet_id = Column(
-        UUID(as_uuid=True),
-        ForeignKey("fleets.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid7
+    )
+    fleet_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("fleets.id", ondelete="CASCADE"), index=True
     )
 
     # KPI identification
-    kpi_name = Column(String(100), nullable=False, index=True)
-    kpi_category = Column(
-        String(50), nullable=False, index=True
-    )  # operational, financial, safety, etc.
+    kpi_name: Mapped[str] = mapped_column(String(100), index=True)
+    # operational, financial, safety, etc.
+    kpi_category: Mapped[str] = mapped_column(String(50), index=True)
 
     # Values
-    current_value = Column(Float, nullable=False)
-    target_value = Column(Float, nullable=True)
-    previous_value = Column(Float, nullable=True)
-
-    # Performance
-    achievement_percentage = Column(Float, nullable=True)
-    trend = Column(String(20), nullable=True)  # improving, declining, stable
+    current_value: Mapped[float]
+    target_value: Mapped[Optional[float]]
+    previous_value: Mapped[Optional[float]]
+
+    # Performance, derived by PostgreSQL from the values above
+    achievement_percentage: Mapped[Optional[float]] = mapped_column(
+        Computed(
+            "CASE WHEN target_value > 0 THEN current_value / target_value * 100 END",
+            persisted=True,
+        ),
+    )
+    trend: Mapped[Optional[str]] = mapped_column(
+        String(20),
+        Computed(
+            "CASE WHEN current_value > previous_value THEN 'improving' "
+            "WHEN current_value < previous_value THEN 'declining' "
+            "WHEN current_value = previous_value THEN 'stable' END",
+            persisted=True,
+        ),
+    )
 
     # Time period
-    measurement_date = Column(Date, nullable=False, index=True)
-    period_type = Column(
-        String(20), nullable=False
-    )  # daily, weekly, monthly, quarterly
+    measurement_date: Mapped[date] = mapped_column(index=True)
+    # daily, weekly, monthly, quarterly
+    period_type: Mapped[str] = mapped_column(String(20))
 
     # Metadata
-    unit = Column(String(20), nullable=True)
-    description = Column(Text, nullable=True)
-    calculation_method = Column(Text, nullable=True)
+    unit: Mapped[Optional[str]] = mapped_column(String(20))
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    calculation_method: Mapped[Optional[str]] = mapped_column(Text)
 
-    recorded_by = Column(
-        UUID(as_uuid=True), ForeignKey("user_profiles.id"), nullable=False
+    recorded_by: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("user_profiles.id")
     )
 
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),  # update_updated_at_column trigger
     )
 
     # Relationships
-    fleet = relationship("Fleet")
-    recorder = relationship("UserProfile")
+    fleet: Mapped["Fleet"] = relationship(lazy="raise_on_sql")
+    recorder: Mapped["UserProfile"] = relationship(lazy="raise_on_sql")
+
+    # One measurement per KPI, day and period type
+    __table_args__ = (
+        UniqueConstraint(
+            "fleet_id",
+            "kpi_name",
+            "measurement_date",
+            "period_type",
+            name="uq_fleet_kpi_name_date_period",
+        ),
+        Index("ix_fleet_kpi_achievement", "achievement_percentage"),
+    )
+    __mapper_args__ = {"eager_defaults": False}
@@ -0,0 +1,163 @@
+"""
+Shared model mixins
+"""
+
+import enum
+from operator import attrgetter, methodcaller
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
+
+from sqlalchemy import Text, Uuid, cast, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+# For models whose response schemas still carry dates as ISO strings
+isoformat = methodcaller("isoformat")
+# For Enum columns serialized as their string value
+enum_value = attrgetter("value")
+
+
+def one_of(column: str, values: type[enum.Enum]) -> str:
+    """Build a CHECK expression limiting a string column to an enum's values"""
+    allowed = ", ".join(f"'{member.value}'" for member in values)
+    return f"{column} IN ({allowed})"
+
+
+class ModelMixin:
+    """Generates to_dict from a declared field list instead of a dict literal"""
+
+    # Attribute names emitted by to_dict, in order (at least two)
+    _dict_fields: ClassVar[Tuple[str, ...]] = ()
+    # Per-field converters (str for UUIDs, float for decimals); None values
+    # are never converted. Dates and datetimes are left for the response
+    # serializer to encode unless a model opts into isoformat.
+    _dict_converters: ClassVar[Dict[str, Callable[[Any], Any]]] = {}
+
+    _dict_getter: ClassVar[Callable[[Any], Tuple[Any, ...]]]
+    _dict_plan: ClassVar[Tuple[Tuple[str, Optional[Callable[[Any], Any]]], ...]]
+    _dump_plan: ClassVar[Tuple[Tuple[str, Optional[Callable[[Any], Any]]], ...]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get("_dict_fields"):
+            cls._dict_getter = attrgetter(*cls._dict_fields)
+            cls._dict_plan = tuple(
+                (name, cls._dict_converters.get(name)) for name in cls._dict_fields
+            )
+            if "to_dict" not in cls.__dict__:
+                cls.to_dict = _compile_to_dict(cls._dict_plan, cls._dict_getter)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert model to dictionary"""
+        return _convert(self._dict_plan, self._dict_getter(self))
+
+    @classmethod
+    def dump_rows(
+        cls,
+        db: Session,
+        whereclause=None,
+        *,
+        order_by=None,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Serialize matching rows the way to_dict would, without ORM instances
+
+        Selects exactly the to_dict columns with Core, so list endpoints skip
+        instance construction and the identity map. Every field in
+        _dict_fields must be a column of the model's table.
+
+        Args:
+            db: Database session
+            whereclause: Optional filter, e.g. Query.whereclause
+            order_by: Optional ordering clause
+            offset: Rows to skip
+            limit: Maximum rows to return
+
+        Returns:
+            List of dictionaries in to_dict format
+        """
+        stmt = cls._dump_select()
+        if whereclause is not None:
+            stmt = stmt.where(whereclause)
+        if order_by is not None:
+            stmt = stmt.order_by(order_by)
+        stmt = stmt.offset(offset).limit(limit)
+
+        plan = cls._dump_plan
+        return [_convert(plan, row) for row in db.execute(stmt)]
+
+    @classmethod
+    def _dump_select(cls) -> Select:
+        """Return the cached select of the to_dict columns"""
+        stmt = cls.__dict__.get("_dump_stmt")
+        if stmt is None:
+            # Built on first use; the table is not mapped yet at subclass time.
+            # UUIDs that to_dict turns into strings are cast to text in SQL:
+            # the driver returns the text as is instead of parsing a UUID
+            # object for the converter to format back
+            columns = cls.__table__.c
+            selected = []
+            plan = []
+            for name, convert in cls._dict_plan:
+                column = columns[name]
+                if convert is str and isinstance(column.type, Uuid):
+                    selected.append(cast(column, Text).label(name))
+                    convert = None
+                else:
+                    selected.append(column)
+                plan.append((name, convert))
+            stmt = select(*selected)
+            cls._dump_plan = tuple(plan)
+            cls._dump_stmt = stmt
+        return stmt
+
+
+# Converters written inline in generated to_dict functions
+_INLINE_CONVERTERS = {str: "str({})", float: "float({})", isoformat: "{}.isoformat()"}
+
+
+def _compile_to_dict(plan, getter) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Generate a straight-line to_dict for a field plan
+
+    The generated function builds the dict in one literal, reading loaded
+    fields from the instance __dict__ (skipping the instrumented attribute
+    descriptors) with each converter applied inline, so a call runs no
+    per-field loop or lookups. Expired or deferred fields fall back to
+    loading every field through the descriptors.
+    """
+    namespace = {"_convert": _convert, "_plan": plan, "_getter": getter}
+    items = []
+    for index, (name, convert) in enumerate(plan):
+        key = repr(name)
+        if convert is None:
+            items.append(f"{key}: state[{key}]")
+            continue
+        template = _INLINE_CONVERTERS.get(convert)
+        if template is None:
+            namespace[f"_convert_{index}"] = convert
+            template = f"_convert_{index}({{}})"
+        items.append(
+            f"{key}: None if (value := state[{key}]) is None"
+            f" else {template.format('value')}"
+        )
+    source = (
+        "def to_dict(self):\n"
+        '    """Convert model to dictionary"""\n'
+        "    state = self.__dict__\n"
+        "    try:\n"
+        f"        return {{{', '.join(items)}}}\n"
+        "    except KeyError:\n"
+        "        return _convert(_plan, _getter(self))\n"
+    )
+    exec(source, namespace)
+    return namespace["to_dict"]
+
+
+def _convert(plan, values) -> Dict[str, Any]:
+    """Pair field names with values, applying converters to non-None values"""
+    return {
+        name: value if convert is None or value is None else convert(value)
+        for (name, convert), value in zip(plan, values)
+    }
@@ -4,26 +4,35 @@ Payment models for M-Pesa integration and payment processing
 
 import enum
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional, Union
 from sqlalchemy import (
+    BigInteger,
     Column,
+    Numeric,
+    cast,
     String,
     DateTime,
     Text,
     Boolean,
     Integer,
+    LargeBinary,
+    SmallInteger,
+    TypeDecorator,
     ForeignKey,
     Index,
     CheckConstraint,
     UniqueConstraint,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID, ENUM as SQLEnum
-from sqlalchemy import DECIMAL
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from app.core.database import Base
+from app.models.mixins import one_of
+from app.utils.ids import uuid7
 
 
 class PaymentStatus(str, enum.Enum):
@@ -38,6 +47,18 @@ class PaymentStatus(str, enum.Enum):
     REFUNDED = "refunded"
 
 
+class PaymentStatusCode(enum.IntEnum):
+    """Stored codes of PaymentStatus values; append, never renumber"""
+
+    PENDING = 0
+    PROCESSING = 1
+    COMPLETED = 2
+    FAILED = 3
+    CANCELLED = 4
+    EXPIRED = 5
+    REFUNDED = 6
+
+
 class PaymentMethod(str, enum.Enum):
     """Payment method enumeration"""
 
@@ -58,6 +79,17 @@ class RefundStatus(str, enum.Enum):
     CANCELLED = "cancelled"
 
 
+class RefundStatusCode(enum.IntEnum):
+    """Stored codes of RefundStatus values; append, never renumber"""
+
+    PENDING = 0
+    APPROVED = 1
+    PROCESSING = 2
+    COMPLETED = 3
+    FAILED = 4
+    CANCELLED = 5
+
+
 class RefundReason(str, enum.Enum):
     """Refund reason enumeration"""
 
@@ -70,54 +102,137 @@ class RefundReason(str, enum.Enum):
     OTHER = "other"
 
 
+def to_cents(amount: Union[Decimal, int, float, str]) -> int:
+    """Convert a KES amount to integer cents, rounding half up"""
+    cents = Decimal(str(amount)) * 100
+    return int(cents.to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_cents(cents: Optional[int]) -> Optional[Decimal]:
+    """Convert integer cents back to a two-place KES amount"""
+    return None if cents is None else Decimal(cents).scaleb(-2)
+
+
+class StatusCode(TypeDecorator):
+    """
+    A string status stored as its SMALLINT code
+
+    Values bound and loaded are the status strings ("completed"), so
+    comparisons such as PaymentTransaction.status == "completed" send the
+    code and API responses are unchanged.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, codes: type[enum.IntEnum]):
+        super().__init__()
+        self.codes = codes
+        self._by_value = {member.name.lower(): member.value for member in codes}
+        self._by_code = {code: value for value, code in self._by_value.items()}
+
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        try:
+            # Enum members hash by name, look them up by their string value
+            return self._by_value[getattr(value, "value", value)]
+        except KeyError:
+            raise ValueError(f"Unknown {self.codes.__name__} value: {value!r}")
+
+    def process_result_value(self, value, dialect) -> Optional[str]:
+        return None if value is None else self._by_code[value]
+
+
+def _code_range(column: str, codes: type[enum.IntEnum]) -> str:
+    """Build a CHECK expression limiting a code column to an enum's codes"""
+    return f"{column} BETWEEN {min(codes)} AND {max(codes)}"
+
+
 class PaymentTransaction(Base):
     """Enhanced payment transaction model for M-Pesa integration"""
 
     __tablename__ = "payment_transactions"
 
+    # Columns are declared fixed-width first and variable-length last, the
+    # order PostgreSQL lays them out in, so rows carry no alignment padding
+
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Foreign keys
     booking_id = Column(UUID(as_uuid=True), ForeignKey("bookings.id"), nullable=False)
 
-    # M-Pesa specific fields
-    checkout_request_id = Column(String(100), unique=True, nullable=True, index=True)
-    merchant_request_id = Column(String(100), nullable=True)
-    phone_number = Column(String(15), nullable=False)
-    amount = Column(DECIMAL(10, 2), nullable=False)
+    amount_cents = Column(BigInteger, nullable=False)
+
+    # Timestamps
+    transaction_date = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+    expires_at = Column(DateTime(timezone=True), nullable=True)  # Payment timeout
 
     # Transaction tracking
+    status = Column(
+        StatusCode(PaymentStatusCode),
+        default=PaymentStatus.PENDING.value,
+        nullable=False,
+    )
+    phone_number = Column(String(15), nullable=False)
     mpesa_receipt_number = Column(String(100), nullable=True, unique=True)
-    transaction_date = Column(DateTime(timezone=True), nullable=True)
-    status = Column(SQLEnum(PaymentStatus), default="pending", nullable=False)
+    payment_reference = Column(String(50), unique=True, nullable=False, index=True)
+
+    # M-Pesa specific fields
+    checkout_request_id = Column(String(100), unique=True, nullable=True, index=True)
+    merchant_request_id = Column(String(100), nullable=True)
 
     # Payment metadata
     account_reference = Column(String(50), nullable=True)
     transaction_desc = Column(Text, nullable=True)
-    payment_reference = Column(String(50), unique=True, nullable=False, index=True)
 
     # Gateway response data
-    gateway_response = Column(Text, nullable=True)
+    gateway_response = Column(JSONB, nullable=True)
     failure_reason = Column(Text, nullable=True)
 
-    # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    # Relationships
+    booking = relationship(
+        "Booking", back_populates="payment_transactions", lazy="raise_on_sql"
+    )
+    receipts = relationship(
+        "PaymentReceipt", back_populates="payment", lazy="raise_on_sql"
+    )
+    refunds = relationship(
+        "RefundTransaction", back_populates="original_payment", lazy="raise_on_sql"
     )
-    expires_at = Column(DateTime(timezone=True), nullable=True)  # Payment timeout
 
-    # Relationships
-    booking = relationship("Booking", back_populates="payment_transactions")
-    receipts = relationship("PaymentReceipt", back_populates="payment")
-    refunds = relationship("RefundTransaction", back_populates="original_payment")
+    @hybrid_property
+    def amount(self) -> Optional[Decimal]:
+        """Amount in KES, stored as integer cents"""
+        return from_cents(self.amount_cents)
+
+    @amount.setter
+    def amount(self, value) -> None:
+        self.amount_cents = to_cents(value)
+
+    @amount.expression
+    def amount(cls):
+        return cast(cls.amount_cents, Numeric(12, 2)) / 100
 
     # Constraints
     __table_args__ = (
-        CheckConstraint("amount > 0", name="check_positive_amount"),
+        CheckConstraint("amount_cents > 0", name="check_positive_amount"),
+        CheckConstraint(
+            _code_range("status", PaymentStatusCode), name="ck_payment_status"
+        ),
         Index("idx_payment_status_created", "status", "created_at"),
         Index("idx_payment_phone_created", "phone_number", "created_at"),
+        Index(
+            "ix_payment_gateway_gin",
+            "gateway_response",
+            postgresql_using="gin",
+            postgresql_ops={"gateway_response": "jsonb_path_ops"},
+        ),
     )
 
 
@@ -127,7 +242,7 @@ class PaymentReceipt(Base):
     __tablename__ = "payment_receipts"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Foreign keys
     payment_id = Column(
@@ -149,8 +264,8 @@ class PaymentReceipt(Base):
     sms_sent = Column(Boolean, default=False)
     sms_sent_at = Column(DateTime(timezone=True), nullable=True)
 
-    # Verification
-    verification_hash = Column(String(256), nullable=True)
+    # Verification (raw SHA-256 digest)
+    verification_hash = Column(LargeBinary(32), nullable=True)
     verification_count = Column(Integer, default=0)
     last_verified_at = Column(DateTime(timezone=True), nullable=True)
 
@@ -167,6 +282,10 @@ class PaymentReceipt(Base):
     __table_args__ = (
         Index("idx_receipt_number", "receipt_number"),
         Index("idx_receipt_payment_id", "payment_id"),
+        Index("ix_receipt_hash", "verification_hash"),
+        CheckConstraint(
+            "octet_length(verification_hash) = 32", name="ck_receipt_hash_length"
+        ),
     )
 
 
@@ -176,7 +295,11 @@ class RefundTransaction(Base):
     __tablename__ = "refund_transactions"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
 
     # Foreign keys
     original_payment_id = Column(
@@ -185,8 +308,8 @@ class RefundTransaction(Base):
     booking_id = Column(UUID(as_uuid=True), ForeignKey("bookings.id"), nullable=False)
 
     # Refund details
-    refund_amount = Column(DECIMAL(10, 2), nullable=False)
-    refund_reason = Column(SQLEnum(RefundReason), nullable=False)
+    refund_amount_cents = Column(BigInteger, nullable=False)
+    refund_reason = Column(String(30), nullable=False)  # RefundReason value
     refund_notes = Column(Text, nullable=True)
 
     # M-Pesa B2C details
@@ -202,7 +325,11 @@ class RefundTransaction(Base):
     approved_at = Column(DateTime(timezone=True), nullable=True)
 
     # Status tracking
-    status = Column(SQLEnum(RefundStatus), default="pending", nullable=False)
+    status = Column(
+        StatusCode(RefundStatusCode),
+        default=RefundStatus.PENDING.value,
+        nullable=False,
+    )
     processed_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
 
@@ -223,14 +350,37 @@ class RefundTransaction(Base):
     )
 
     # Relationships
-    original_payment = relationship("PaymentTransaction", back_populates="refunds")
-    booking = relationship("Booking")
-    approved_by_user = relationship("UserProfile", foreign_keys=[approved_by])
-    processed_by_user = relationship("UserProfile", foreign_keys=[processed_by])
+    original_payment = relationship(
+        "PaymentTransaction", back_populates="refunds", lazy="raise_on_sql"
+    )
+    booking = relationship("Booking", lazy="raise_on_sql")
+    approved_by_user = relationship(
+        "UserProfile", foreign_keys=[approved_by], lazy="raise_on_sql"
+    )
+    processed_by_user = relationship(
+        "UserProfile", foreign_keys=[processed_by], lazy="raise_on_sql"
+    )
+
+    @hybrid_property
+    def refund_amount(self) -> Optional[Decimal]:
+        """Refund amount in KES, stored as integer cents"""
+        return from_cents(self.refund_amount_cents)
+
+    @refund_amount.setter
+    def refund_amount(self, value) -> None:
+        self.refund_amount_cents = to_cents(value)
+
+    @refund_amount.expression
+    def refund_amount(cls):
+        return cast(cls.refund_amount_cents, Numeric(12, 2)) / 100
 
     # Constraints
     __table_args__ = (
-        CheckConstraint("refund_amount > 0", name="check_positive_refund_amount"),
+        CheckConstraint("refund_amount_cents > 0", name="check_positive_refund_amount"),
+        CheckConstraint(
+            _code_range("status", RefundStatusCode), name="ck_refund_status"
+        ),
+        CheckConstraint(one_of("refund_reason", RefundReason), name="ck_refund_reason"),
         Index("idx_refund_status_created", "status", "created_at"),
         Index("idx_refund_original_payment", "original_payment_id"),
     )
@@ -242,14 +392,18 @@ class PaymentWebhookLog(Base):
     __tablename__ = "payment_webhook_logs"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
 
     # Webhook details
     checkout_request_id = Column(String(100), nullable=True, index=True)
     webhook_type = Column(String(50), nullable=False)  # 'stk_push', 'b2c', etc.
 
     # Request data
-    raw_payload = Column(Text, nullable=False)
+    raw_payload = Column(JSONB, nullable=False)
     headers = Column(Text, nullable=True)
 
     # Processing status
@@ -265,4 +419,17 @@ class PaymentWebhookLog(Base):
     __table_args__ = (
         Index("idx_webhook_checkout_request", "checkout_request_id"),
         Index("idx_webhook_processed", "processed", "received_at"),
+        # Append-only log: a BRIN range summary covers time-window scans
+        Index(
+            "ix_webhook_received_brin",
+            "received_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_webhook_payload_result",
+            text("(raw_payload #>> '{Body,stkCallback,ResultCode}')"),
+        ),
     )
+    # Logs are write-only here; don't RETURN received_at on insert
+    __mapper_args__ = {"eager_defaults": False}
@@ -2,44 +2,79 @@
 Simple Driver model that matches the actual database schema
 """
 
-import uuid
-from datetime import datetime, date
-from sqlalchemy import Column, String, DateTime, Boolean, Date, ForeignKey
+from sqlalchemy import (
+    Column,
+    String,
+    DateTime,
+    Boolean,
+    Date,
+    FetchedValue,
+    ForeignKey,
+    Index,
+)
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func, text
 
 from app.core.database import Base
+from app.models.mixins import ModelMixin, isoformat
+from app.utils.ids import uuid7
 
 
-class SimpleDriver(Base):
+class SimpleDriver(ModelMixin, Base):
     """Simple Driver model that matches the actual database schema"""
 
     __tablename__ = "drivers"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), nullable=True)
     driver_code = Column(String(20), unique=True, nullable=False)
     license_number = Column(String(50), nullable=False)
     license_expiry = Column(Date, nullable=True)
     fleet_id = Column(UUID(as_uuid=True), ForeignKey("fleets.id"), nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),  # update_updated_at_column trigger
+    )
+
+    # Relationships; the trips foreign key cascades deletes in the database
+    trips = relationship("Trip", back_populates="driver", passive_deletes=True)
+
+    # Duplicate-license checks are pure equality on the normalized value;
+    # assignment lookups only look at a fleet's active drivers
+    __table_args__ = (
+        Index("ix_drivers_license_number", "license_number", postgresql_using="hash"),
+        Index(
+            "ix_drivers_fleet_active",
+            "fleet_id",
+            postgresql_where=text("is_active = true"),
+        ),
+    )
 
     def __repr__(self):
         return f"<Driver(id={self.id}, driver_code='{self.driver_code}')>"
 
-    def to_dict(self):
-        """Convert driver to dictionary"""
-        return {
-            "id": str(self.id),
-            "user_id": str(self.user_id) if self.user_id else None,
-            "driver_code": self.driver_code,
-            "license_number": self.license_number,
-            "license_expiry": (
-                self.license_expiry.isoformat() if self.license_expiry else None
-            ),
-            "fleet_id": str(self.fleet_id) if self.fleet_id else None,
-            "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+    _dict_fields = (
+        "id",
+        "user_id",
+        "driver_code",
+        "license_number",
+        "license_expiry",
+        "fleet_id",
+        "is_active",
+        "created_at",
+        "updated_at",
+    )
+    _dict_converters = {
+        "id": str,
+        "user_id": str,
+        "license_expiry": isoformat,
+        "fleet_id": str,
+        "created_at": isoformat,
+        "updated_at": isoformat,
+    }
@@ -2,13 +2,29 @@
 Simple Vehicle model that matches the actual database schema
 """
 
-import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, ForeignKey
+from sqlalchemy import (
+    Column,
+    String,
+    DateTime,
+    Boolean,
+    FetchedValue,
+    Integer,
+    ForeignKey,
+    Index,
+    and_,
+    select,
+    update,
+)
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session, relationship
+from sqlalchemy.sql import func
 from enum import Enum
+from typing import List, Optional
 
 from app.core.database import Base
+from app.models.mixins import ModelMixin, isoformat
+from app.models.vehicle_status import VehicleDocument
+from app.utils.ids import uuid7
 
 
 class VehicleStatus(str, Enum):
@@ -19,12 +35,12 @@ class VehicleStatus(str, Enum):
     INACTIVE = "inactive"
 
 
-class SimpleVehicle(Base):
+class SimpleVehicle(ModelMixin, Base):
     """Simple Vehicle model that matches the actual database schema"""
 
     __tablename__ = "vehicles"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     fleet_id = Column(UUID(as_uuid=True), ForeignKey("fleets.id"), nullable=True)
 
     # Basic Information
@@ -43,25 +59,87 @@ class SimpleVehicle(Base):
     status = Column(String(20), default=VehicleStatus.ACTIVE.value, nullable=False)
 
     # System Fields
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),  # update_updated_at_column trigger
+    )
+
+    # Relationships; the trips foreign key cascades deletes in the database
+    trips = relationship("Trip", back_populates="vehicle", passive_deletes=True)
+
+    # PostgreSQL does not index foreign keys; deleting a fleet looks up its
+    # vehicles through this one
+    __table_args__ = (Index("idx_vehicles_fleet_id", "fleet_id"),)
 
     def __repr__(self):
         return f"<Vehicle(id={self.id}, license_plate='{self.license_plate}', fleet_number='{self.fleet_number}')>"
 
-    def to_dict(self):
-        """Convert vehicle to dictionary"""
-        return {
-            "id": str(self.id),
-            "fleet_id": str(self.fleet_id) if self.fleet_id else None,
-            "fleet_number": self.fleet_number,
-            "license_plate": self.license_plate,
-            "capacity": self.capacity,
-            "vehicle_model": self.vehicle_model,
-            "year_manufactured": self.year_manufactured,
-            "gps_device_id": self.gps_device_id,
-            "sim_number": self.sim_number,
-            "status": self.status,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+    @classmethod
+    def refresh_compliance_statuses(
+        cls, db: Session, vehicle_ids: Optional[List[str]] = None
+    ) -> int:
+        """
+        Mark vehicles whose insurance has lapsed as inactive
+
+        A vehicle's insurance has lapsed when the latest expiry among its
+        active insurance documents is in the past. The check and the status
+        change run as one UPDATE rather than per loaded vehicle; loaded
+        instances are not synchronized, so callers commit or refresh them.
+
+        Args:
+            db: Database session
+            vehicle_ids: Limit the refresh to these vehicles, all if None
+
+        Returns:
+            Number of vehicles marked inactive
+        """
+        insurance_expiry = (
+            select(func.max(VehicleDocument.expiry_date))
+            .where(
+                and_(
+                    VehicleDocument.vehicle_id == cls.id,
+                    VehicleDocument.document_type == "insurance",
+                    VehicleDocument.is_active == True,
+                )
+            )
+            .scalar_subquery()
+        )
+        stmt = (
+            update(cls)
+            .where(
+                and_(
+                    cls.status != VehicleStatus.INACTIVE.value,
+                    insurance_expiry <= func.current_date(),
+                )
+            )
+            .values(status=VehicleStatus.INACTIVE.value)
+            .execution_options(synchronize_session=False)
+        )
+        if vehicle_ids is not None:
+            stmt = stmt.where(cls.id.in_(vehicle_ids))
+        return db.execute(stmt).rowcount
+
+    _dict_fields = (
+        "id",
+        "fleet_id",
+        "fleet_number",
+        "license_plate",
+        "capacity",
+        "vehicle_model",
+        "year_manufactured",
+        "gps_device_id",
+        "sim_number",
+        "status",
+        "created_at",
+        "updated_at",
+    )
+    _dict_converters = {
+        "id": str,
+        "fleet_id": str,
+        "created_at": isoformat,
+        "updated_at": isoformat,
+    }
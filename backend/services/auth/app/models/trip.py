@@ -9,36 +9,33 @@ from sqlalchemy import (
     DateTime,
     Integer,
     Numeric,
+    SmallInteger,
     Text,
     ForeignKey,
     Time,
-    ARRAY,
     CheckConstraint,
+    Index,
+    TypeDecorator,
+    type_coerce,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-import uuid
-import enum
+from operator import methodcaller
+from typing import Iterable, List, Optional
 
 from app.core.database import Base
+from app.models.mixins import ModelMixin, isoformat, one_of
+from app.models.trip_status import TripStatusEnum
+from app.utils.ids import uuid7
 
 
-class TripStatus(str, enum.Enum):
-    """Trip status enumeration"""
-
-    SCHEDULED = "scheduled"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    CANCELLED = "cancelled"
-
-
-class Route(Base):
+class Route(ModelMixin, Base):
     """Route model for trip planning"""
 
     __tablename__ = "routes"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Route Information
     name = Column(String(255), nullable=False)
@@ -59,33 +56,39 @@ class Route(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
-    # Relationships
-    trips = relationship("Trip", back_populates="route", cascade="all, delete-orphan")
+    # Relationships; both foreign keys cascade deletes in the database
+    trips = relationship("Trip", back_populates="route", passive_deletes=True)
     trip_templates = relationship(
-        "TripTemplate", back_populates="route", cascade="all, delete-orphan"
+        "TripTemplate", back_populates="route", passive_deletes=True
     )
 
-    def to_dict(self):
-        return {
-            "id": str(self.id),
-            "name": self.name,
-            "origin": self.origin,
-            "destination": self.destination,
-            "distance_km": float(self.distance_km) if self.distance_km else None,
-            "estimated_duration_minutes": self.estimated_duration_minutes,
-            "base_fare": float(self.base_fare),
-            "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+    _dict_fields = (
+        "id",
+        "name",
+        "origin",
+        "destination",
+        "distance_km",
+        "estimated_duration_minutes",
+        "base_fare",
+        "is_active",
+        "created_at",
+        "updated_at",
+    )
+    _dict_converters = {
+        "id": str,
+        "distance_km": float,
+        "base_fare": float,
+        "created_at": isoformat,
+        "updated_at": isoformat,
+    }
 
 
-class Trip(Base):
+class Trip(ModelMixin, Base):
     """Trip model for scheduled transportation services"""
 
     __tablename__ = "trips"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Foreign Keys
     route_id = Column(
@@ -98,7 +101,6 @@ class Trip(Base):
         UUID(as_uuid=True),
         ForeignKey("vehicles.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     driver_id = Column(
         UUID(as_uuid=True),
@@ -106,6 +108,11 @@ class Trip(Base):
         nullable=False,
         index=True,
     )
+    fleet_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("fleets.id", ondelete="CASCADE"),
+        nullable=False,
+    )
 
     # Schedule Information
     scheduled_departure = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -119,8 +126,18 @@ class Trip(Base):
     available_seats = Column(Integer, nullable=False)
     # Status
     status = Column(
-        String(20), nullable=False, default=TripStatus.SCHEDULED.value, index=True
-    )
+        String(20), nullable=False, default=TripStatusEnum.SCHEDULED.value
+    )  # TripStatusEnum value
+
+    # Display fields copied from the route, vehicle and driver when the trip
+    # is scheduled (see take_snapshot), so trip listings read no other table.
+    # They keep the names the trip was scheduled under
+    route_name_snapshot = Column(String(255), nullable=True)
+    origin_snapshot = Column(String(255), nullable=True)
+    destination_snapshot = Column(String(255), nullable=True)
+    vehicle_number_snapshot = Column(String(20), nullable=True)
+    vehicle_plate_snapshot = Column(String(20), nullable=True)
+    driver_code_snapshot = Column(String(20), nullable=True)
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -130,6 +147,8 @@ class Trip(Base):
 
     # Relationships
     route = relationship("Route", back_populates="trips")
+    vehicle = relationship("SimpleVehicle", back_populates="trips")
+    driver = relationship("SimpleDriver", back_populates="trips")
 
     # Constraints
     __table_args__ = (
@@ -145,43 +164,107 @@ class Trip(Base):
             "available_seats <= total_seats AND available_seats >= 0",
             name="valid_seat_count",
         ),
+        CheckConstraint(one_of("status", TripStatusEnum), name="valid_trip_status"),
+        # Fleet listings filter by status and a departure range; vehicle
+        # schedules and conflict checks by vehicle and departure. These
+        # replace the single-column fleet_id, vehicle_id and status indexes
+        Index("ix_trips_fleet_status_dep", "fleet_id", "status", "scheduled_departure"),
+        Index("ix_trips_vehicle_dep", "vehicle_id", "scheduled_departure"),
     )
 
-    def to_dict(self):
-        return {
-            "id": str(self.id),
-            "route_id": str(self.route_id),
-            "vehicle_id": str(self.vehicle_id),
-            "driver_id": str(self.driver_id),
-            "scheduled_departure": (
-                self.scheduled_departure.isoformat()
-                if self.scheduled_departure
-                else None
-            ),
-            "scheduled_arrival": (
-                self.scheduled_arrival.isoformat() if self.scheduled_arrival else None
-            ),
-            "actual_departure": (
-                self.actual_departure.isoformat() if self.actual_departure else None
-            ),
-            "actual_arrival": (
-                self.actual_arrival.isoformat() if self.actual_arrival else None
-            ),
-            "fare": float(self.fare),
-            "total_seats": self.total_seats,
-            "available_seats": self.available_seats,
-            "status": self.status,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
-
-
-class TripTemplate(Base):
+    _dict_fields = (
+        "id",
+        "route_id",
+        "vehicle_id",
+        "driver_id",
+        "scheduled_departure",
+        "scheduled_arrival",
+        "actual_departure",
+        "actual_arrival",
+        "fare",
+        "total_seats",
+        "available_seats",
+        "status",
+        "created_at",
+        "updated_at",
+    )
+    _dict_converters = {
+        "id": str,
+        "route_id": str,
+        "vehicle_id": str,
+        "driver_id": str,
+        "scheduled_departure": isoformat,
+        "scheduled_arrival": isoformat,
+        "actual_departure": isoformat,
+        "actual_arrival": isoformat,
+        "fare": float,
+        "created_at": isoformat,
+        "updated_at": isoformat,
+    }
+
+    def take_snapshot(self, route=None, vehicle=None, driver=None) -> None:
+        """
+        Copy display fields from the trip's route, vehicle and driver
+
+        Args:
+            route: Route the trip runs, if being set
+            vehicle: SimpleVehicle assigned, if being set
+            driver: SimpleDriver assigned, if being set
+        """
+        if route is not None:
+            self.route_name_snapshot = route.name
+            self.origin_snapshot = route.origin
+            self.destination_snapshot = route.destination
+        if vehicle is not None:
+            self.vehicle_number_snapshot = vehicle.fleet_number
+            self.vehicle_plate_snapshot = vehicle.license_plate
+        if driver is not None:
+            self.driver_code_snapshot = driver.driver_code
+
+
+# Weekdays 1 (Monday) to 7 (Sunday) for every 7-bit mask, day d on bit d - 1
+_WEEKDAYS_BY_MASK = tuple(
+    tuple(day for day in range(1, 8) if mask >> (day - 1) & 1) for mask in range(128)
+)
+
+
+class WeekdayMask(TypeDecorator):
+    """
+    A set of weekdays stored as a SMALLINT bitmask
+
+    Values bound and loaded are lists of weekday numbers ([1, 2, 3, 4, 5]),
+    so the schemas and API responses keep their days_of_week lists while
+    the row stores one 2-byte integer.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return weekday_mask(value)
+
+    def process_result_value(self, value, dialect) -> Optional[List[int]]:
+        return None if value is None else list(_WEEKDAYS_BY_MASK[value])
+
+
+def weekday_mask(days: Iterable[int]) -> int:
+    """Pack weekday numbers 1-7 into their bitmask"""
+    mask = 0
+    for day in days:
+        if not 1 <= day <= 7:
+            raise ValueError(f"Weekday must be between 1 and 7: {day!r}")
+        mask |= 1 << (day - 1)
+    return mask
+
+
+class TripTemplate(ModelMixin, Base):
     """Trip template for recurring trip scheduling"""
 
     __tablename__ = "trip_templates"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Foreign Keys
     route_id = Column(
@@ -199,8 +282,8 @@ class TripTemplate(Base):
     departure_time = Column(Time, nullable=False)
     fare = Column(Numeric(10, 2), nullable=False)
 
-    # Recurrence Pattern
-    days_of_week = Column(ARRAY(Integer), nullable=False)  # [1,2,3,4,5] for weekdays
+    # Recurrence Pattern, [1,2,3,4,5] for weekdays
+    days_of_week = Column("days_mask", WeekdayMask, key="days_of_week", nullable=False)
 
     # Status
     is_active = Column(Boolean, default=True, nullable=False)
@@ -214,21 +297,42 @@ class TripTemplate(Base):
     # Relationships
     route = relationship("Route", back_populates="trip_templates")
 
-    def to_dict(self):
-        return {
-            "id": str(self.id),
-            "route_id": str(self.route_id),
-            "fleet_id": str(self.fleet_id),
-            "template_name": self.template_name,
-            "departure_time": (
-                self.departure_time.strftime("%H:%M:%S")
-                if self.departure_time
-                else None
-            ),
-            "fare": float(self.fare),
-            "days_of_week": self.days_of_week,
-            "is_active": self.is_active,
-            "created_by": str(self.created_by),
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+    # One index per foreign key, so deleting a route, fleet or user finds
+    # the referencing templates without a sequential scan
+    __table_args__ = (
+        Index("idx_trip_templates_route_id", "route_id"),
+        Index("idx_trip_templates_fleet_id", "fleet_id"),
+        Index("ix_trip_templates_created_by", "created_by"),
+        CheckConstraint("days_mask BETWEEN 1 AND 127", name="valid_days_mask"),
+    )
+
+    @classmethod
+    def runs_on(cls, weekday: int):
+        """Filter for templates that run on a weekday (1 Monday to 7 Sunday)"""
+        # Compare the raw mask; binding through WeekdayMask expects a list
+        mask = type_coerce(cls.days_of_week, SmallInteger)
+        return mask.op("&")(weekday_mask([weekday])) != 0
+
+    _dict_fields = (
+        "id",
+        "route_id",
+        "fleet_id",
+        "template_name",
+        "departure_time",
+        "fare",
+        "days_of_week",
+        "is_active",
+        "created_by",
+        "created_at",
+        "updated_at",
+    )
+    _dict_converters = {
+        "id": str,
+        "route_id": str,
+        "fleet_id": str,
+        "departure_time": methodcaller("strftime", "%H:%M:%S"),
+        "fare": float,
+        "created_by": str,
+        "created_at": isoformat,
+        "updated_at": isoformat,
+    }
@@ -2,9 +2,8 @@
 Trip Status Tracking Models for Real-time Updates
 """
 
-import uuid
-from datetime import datetime
-from typing import Optional
+import io
+from typing import Any, Dict, List, Optional
 from sqlalchemy import (
     Column,
     String,
@@ -12,22 +11,35 @@ from sqlalchemy import (
     Text,
     Boolean,
     Integer,
-    Numeric,
+    Float,
     ForeignKey,
-    Enum as SQLEnum,
+    Index,
+    CheckConstraint,
+    FetchedValue,
+    PrimaryKeyConstraint,
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, relationship
+from sqlalchemy.sql import func
 from enum import Enum
 
 from app.core.database import Base
+from app.models.mixins import ModelMixin, isoformat, one_of
+from app.utils import pg_copy
+from app.utils.ids import uuid7
 
 
 class TripStatusEnum(str, Enum):
-    """Trip status enumeration for real-time tracking"""
+    """
+    Trip status enumeration
+
+    The one list of statuses for trips.status and trip_status_updates.status;
+    both CHECK constraints are generated from it.
+    """
 
     SCHEDULED = "scheduled"
     DEPARTED = "departed"
+    IN_PROGRESS = "in_progress"
     IN_TRANSIT = "in_transit"
     ARRIVED = "arrived"
     COMPLETED = "completed"
@@ -35,6 +47,19 @@ class TripStatusEnum(str, Enum):
     DELAYED = "delayed"
 
 
+# Statuses of a trip that still holds its vehicle and driver
+ACTIVE_TRIP_STATUSES = tuple(
+    status.value
+    for status in (
+        TripStatusEnum.SCHEDULED,
+        TripStatusEnum.DEPARTED,
+        TripStatusEnum.IN_PROGRESS,
+        TripStatusEnum.IN_TRANSIT,
+        TripStatusEnum.DELAYED,
+    )
+)
+
+
 class UpdateSourceEnum(str, Enum):
     """Source of status update"""
 
@@ -45,23 +70,22 @@ class UpdateSourceEnum(str, Enum):
     PASSENGER = "passenger"
 
 
-class TripStatusUpdate(Base):
+class TripStatusUpdate(ModelMixin, Base):
     """Track real-time trip status updates"""
 
     __tablename__ = "trip_status_updates"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     trip_id = Column(
         UUID(as_uuid=True),
         ForeignKey("trips.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
-    status = Column(SQLEnum(TripStatusEnum), nullable=False)
+    status = Column(String(20), nullable=False)  # TripStatusEnum value
 
     # Location data
-    location_lat = Column(Numeric(10, 8), nullable=True)
-    location_lng = Column(Numeric(11, 8), nullable=True)
+    location_lat = Column(Float, nullable=True)
+    location_lng = Column(Float, nullable=True)
     location_name = Column(String(255), nullable=True)
 
     # Timing data
@@ -70,8 +94,8 @@ class TripStatusUpdate(Base):
 
     # Update metadata
     update_source = Column(
-        SQLEnum(UpdateSourceEnum), default=UpdateSourceEnum.SYSTEM, nullable=False
-    )
+        String(20), default=UpdateSourceEnum.SYSTEM.value, nullable=False
+    )  # UpdateSourceEnum value
     notes = Column(Text, nullable=True)
     updated_by = Column(
         UUID(as_uuid=True), ForeignKey("user_profiles.id"), nullable=True
@@ -79,44 +103,65 @@ class TripStatusUpdate(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime(timezone=True), default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     # Relationships
     trip = relationship("Trip")
     updater = relationship("UserProfile")
 
-    def to_dict(self):
-        """Convert to dictionary"""
-        return {
-            "id": str(self.id),
-            "trip_id": str(self.trip_id),
-            "status": self.status.value,
-            "location_lat": float(self.location_lat) if self.location_lat else None,
-            "location_lng": float(self.location_lng) if self.location_lng else None,
-            "location_name": self.location_name,
-            "estimated_arrival": (
-                self.estimated_arrival.isoformat() if self.estimated_arrival else None
-            ),
-            "delay_minutes": self.delay_minutes,
-            "update_source": self.update_source.value,
-            "notes": self.notes,
-            "updated_by": str(self.updated_by) if self.updated_by else None,
-            "created_at": self.created_at.isoformat(),
-        }
-
-
-class GPSLocation(Base):
+    # A trip's history and its latest update read in created_at order; the
+    # updated_by index serves the foreign key when a user is deleted. Rows
+    # are appended in created_at order, so fleet-wide time ranges use a BRIN
+    # summary of a few pages instead of a btree entry per update
+    __table_args__ = (
+        CheckConstraint(one_of("status", TripStatusEnum), name="valid_tsu_status"),
+        CheckConstraint(
+            one_of("update_source", UpdateSourceEnum), name="valid_tsu_update_source"
+        ),
+        Index("ix_tsu_trip_created", "trip_id", "created_at"),
+        Index("ix_tsu_updated_by", "updated_by"),
+        Index(
+            "ix_tsu_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+
+    _dict_fields = (
+        "id",
+        "trip_id",
+        "status",
+        "location_lat",
+        "location_lng",
+        "location_name",
+        "estimated_arrival",
+        "delay_minutes",
+        "update_source",
+        "notes",
+        "updated_by",
+        "created_at",
+    )
+    _dict_converters = {
+        "id": str,
+        "trip_id": str,
+        "estimated_arrival": isoformat,
+        "updated_by": str,
+        "created_at": isoformat,
+    }
+
+
+class GPSLocation(ModelMixin, Base):
     """GPS tracking data for vehicles"""
 
     __tablename__ = "gps_locations"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), default=uuid7)
     vehicle_id = Column(
         UUID(as_uuid=True),
         ForeignKey("vehicles.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     trip_id = Column(
         UUID(as_uuid=True),
@@ -126,48 +171,114 @@ class GPSLocation(Base):
     )
 
     # GPS coordinates
-    latitude = Column(Numeric(10, 8), nullable=False)
-    longitude = Column(Numeric(11, 8), nullable=False)
-    altitude = Column(Numeric(8, 2), nullable=True)
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    altitude = Column(Float, nullable=True)
 
     # Movement data
-    speed_kmh = Column(Numeric(5, 2), nullable=True)
-    heading = Column(Numeric(5, 2), nullable=True)  # Compass direction 0-360
+    speed_kmh = Column(Float, nullable=True)
+    heading = Column(Float, nullable=True)  # Compass direction 0-360
     accuracy_meters = Column(Integer, nullable=True)
 
     # Timestamps
     recorded_at = Column(DateTime(timezone=True), nullable=False)
     received_at = Column(
-        DateTime(timezone=True), default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     # Relationships
     vehicle = relationship("SimpleVehicle")
     trip = relationship("Trip")
 
-    def to_dict(self):
-        """Convert to dictionary"""
-        return {
-            "id": str(self.id),
-            "vehicle_id": str(self.vehicle_id),
-            "trip_id": str(self.trip_id) if self.trip_id else None,
-            "latitude": float(self.latitude),
-            "longitude": float(self.longitude),
-            "altitude": float(self.altitude) if self.altitude else None,
-            "speed_kmh": float(self.speed_kmh) if self.speed_kmh else None,
-            "heading": float(self.heading) if self.heading else None,
-            "accuracy_meters": self.accuracy_meters,
-            "recorded_at": self.recorded_at.isoformat(),
-            "received_at": self.received_at.isoformat(),
-        }
-
-
-class NotificationPreference(Base):
+    # Monthly range partitions on recorded_at, like the analytics tables;
+    # PostgreSQL requires the partition key in the primary key, the mapper
+    # keeps identity on id. Track reads filter one vehicle over a time
+    # window, newest first, and prune to the months they cover. Old months
+    # are dropped whole (see FleetAnalyticsService.drop_expired_gps_partitions).
+    # Pings arrive in recorded_at order, so scans over a time range across
+    # vehicles use a BRIN summary, which ingest barely has to maintain
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "recorded_at"),
+        Index("idx_gps_vehicle_time", vehicle_id, recorded_at.desc()),
+        Index(
+            "ix_gps_recorded_brin",
+            "recorded_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        {"postgresql_partition_by": "RANGE (recorded_at)"},
+    )
+    __mapper_args__ = {"primary_key": [id]}
+
+    _dict_fields = (
+        "id",
+        "vehicle_id",
+        "trip_id",
+        "latitude",
+        "longitude",
+        "altitude",
+        "speed_kmh",
+        "heading",
+        "accuracy_meters",
+        "recorded_at",
+        "received_at",
+    )
+    _dict_converters = {
+        "id": str,
+        "vehicle_id": str,
+        "trip_id": str,
+        "recorded_at": isoformat,
+        "received_at": isoformat,
+    }
+
+    # COPY column order; received_at is left to its NOW() default
+    _copy_columns = (
+        ("id", pg_copy.uuid_bytes),
+        ("vehicle_id", pg_copy.uuid_bytes),
+        ("trip_id", pg_copy.uuid_bytes),
+        ("latitude", pg_copy.float8),
+        ("longitude", pg_copy.float8),
+        ("altitude", pg_copy.float8),
+        ("speed_kmh", pg_copy.float8),
+        ("heading", pg_copy.float8),
+        ("accuracy_meters", pg_copy.int4),
+        ("recorded_at", pg_copy.timestamptz),
+    )
+
+    @classmethod
+    def bulk_copy(cls, db: Session, rows: List[Dict[str, Any]]) -> int:
+        """
+        Write GPS readings with one binary COPY
+
+        The stream goes through the session's connection, so it commits or
+        rolls back with the rest of the transaction. Rows without an id get
+        a uuid7 here rather than from the database.
+
+        Args:
+            db: Database session; the caller commits
+            rows: Readings keyed by column name
+
+        Returns:
+            Number of rows written
+        """
+        stream = pg_copy.encode_copy_binary(
+            cls._copy_columns,
+            (row if row.get("id") else {**row, "id": uuid7()} for row in rows),
+        )
+        with db.connection().connection.cursor() as cursor:
+            cursor.copy_expert(
+                pg_copy.copy_sql(cls.__tablename__, cls._copy_columns),
+                io.BytesIO(stream),
+            )
+        return len(rows)
+
+
+class NotificationPreference(ModelMixin, Base):
     """User notification preferences"""
 
     __tablename__ = "notification_preferences"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("user_profiles.id", ondelete="CASCADE"),
@@ -192,31 +303,35 @@ class NotificationPreference(Base):
 
     # Timestamps
     created_at = Column(
-        DateTime(timezone=True), default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
     updated_at = Column(
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),  # update_updated_at_column trigger
         nullable=False,
     )
 
     # Relationships
     user = relationship("UserProfile")
 
-    def to_dict(self):
-        """Convert to dictionary"""
-        return {
-            "id": str(self.id),
-            "user_id": str(self.user_id),
-            "sms_enabled": self.sms_enabled,
-            "email_enabled": self.email_enabled,
-            "push_enabled": self.push_enabled,
-            "trip_status_updates": self.trip_status_updates,
-            "delay_notifications": self.delay_notifications,
-            "cancellation_alerts": self.cancellation_alerts,
-            "booking_confirmations": self.booking_confirmations,
-            "advance_notice_minutes": self.advance_notice_minutes,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-        }
+    _dict_fields = (
+        "id",
+        "user_id",
+        "sms_enabled",
+        "email_enabled",
+        "push_enabled",
+        "trip_status_updates",
+        "delay_notifications",
+        "cancellation_alerts",
+        "booking_confirmations",
+        "advance_notice_minutes",
+        "created_at",
+        "updated_at",
+    )
+    _dict_converters = {
+        "id": str,
+        "user_id": str,
+        "created_at": isoformat,
+        "updated_at": isoformat,
+    }
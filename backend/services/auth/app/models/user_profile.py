@@ -2,14 +2,15 @@
 User Profile Model
 """
 
-from sqlalchemy import Column, String, Boolean, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, Enum, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-import uuid
 import enum
 
 from app.core.database import Base
+from app.models.mixins import ModelMixin, enum_value, isoformat
+from app.utils.ids import uuid7
 
 
 class UserRole(str, enum.Enum):
@@ -20,12 +21,12 @@ class UserRole(str, enum.Enum):
     PASSENGER = "passenger"
 
 
-class UserProfile(Base):
+class UserProfile(ModelMixin, Base):
     """User profile model"""
 
     __tablename__ = "user_profiles"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True), unique=True, nullable=False
     )  # Supabase auth user ID
@@ -57,24 +58,40 @@ class UserProfile(Base):
     # Relationships
     # fleet = relationship("Fleet", back_populates="managers")
 
+    # Partial index for the per-request auth lookup of active users
+    __table_args__ = (
+        Index(
+            "ix_user_profiles_user_id_active",
+            "user_id",
+            postgresql_where=text("is_active = true"),
+        ),
+    )
+
     def __repr__(self):
         return f"<UserProfile(id={self.id}, phone={self.phone}, role={self.role})>"
 
-    def to_dict(self):
-        """Convert model to dictionary"""
-        return {
-            "id": str(self.id),
-            "user_id": str(self.user_id),
-            "phone": self.phone,
-            "first_name": self.first_name,
-            "last_name": self.last_name,
-            "email": self.email,
-            "role": self.role.value,
-            "is_active": self.is_active,
-            "fleet_id": str(self.fleet_id) if self.fleet_id else None,
-            "temporary_access_code": self.temporary_access_code,
-            "created_by_admin_id": self.created_by_admin_id,
-            "last_login": self.last_login.isoformat() if self.last_login else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
+    _dict_fields = (
+        "id",
+        "user_id",
+        "phone",
+        "first_name",
+        "last_name",
+        "email",
+        "role",
+        "is_active",
+        "fleet_id",
+        "temporary_access_code",
+        "created_by_admin_id",
+        "last_login",
+        "created_at",
+        "updated_at",
+    )
+    _dict_converters = {
+        "id": str,
+        "user_id": str,
+        "role": enum_value,
+        "fleet_id": str,
+        "last_login": isoformat,
+        "created_at": isoformat,
+        "updated_at": isoformat,
+    }
@@ -2,13 +2,29 @@
 Vehicle Assignment Model for managing driver-vehicle relationships
 """
 
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import (
+    Column,
+    String,
+    DateTime,
+    Boolean,
+    CheckConstraint,
+    FetchedValue,
+    Text,
+    ForeignKey,
+    Index,
+    Integer,
+    cast,
+    func,
+    text,
+    update,
+)
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Session, relationship
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 
 
 class VehicleAssignment(Base):
@@ -16,7 +32,7 @@ class VehicleAssignment(Base):
 
     __tablename__ = "vehicle_assignments"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     vehicle_id = Column(
         UUID(as_uuid=True),
         ForeignKey("vehicles.id", ondelete="CASCADE"),
@@ -41,12 +57,48 @@ class VehicleAssignment(Base):
     unassigned_at = Column(DateTime, nullable=True)
 
     # Status and metadata
-    is_active = Column(Boolean, default=True, nullable=False, index=True)
+    is_active = Column(Boolean, default=True, nullable=False)
     assignment_notes = Column(Text, nullable=True)
 
     # System fields
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        server_onupdate=FetchedValue(),  # update_updated_at_column trigger
+    )
+
+    # Relationships
+    vehicle = relationship("SimpleVehicle")
+    driver = relationship("SimpleDriver")
+
+    # Active assignment lookups probe only the active rows: a vehicle or
+    # driver has at most one, and fleet listings page through them newest
+    # first. The single-column vehicle_id and driver_id indexes serve
+    # assignment history and foreign key cascades
+    __table_args__ = (
+        CheckConstraint(
+            "is_active OR unassigned_at IS NOT NULL", name="valid_assignment_end"
+        ),
+        Index(
+            "idx_vehicle_assignments_active_vehicle_unique",
+            "vehicle_id",
+            unique=True,
+            postgresql_where=text("is_active = true"),
+        ),
+        Index(
+            "idx_vehicle_assignments_active_driver_unique",
+            "driver_id",
+            unique=True,
+            postgresql_where=text("is_active = true"),
+        ),
+        Index(
+            "ix_va_fleet_active",
+            "fleet_id",
+            "assigned_at",
+            postgresql_where=text("is_active = true"),
+        ),
+    )
 
     def __repr__(self):
         return f"<VehicleAssignment(id={self.id}, vehicle_id={self.vehicle_id}, driver_id={self.driver_id}, active={self.is_active})>"
@@ -80,19 +132,58 @@ class VehicleAssignment(Base):
         )
         return base_dict
 
-    @property
-    def duration_days(self):
-        """Calculate assignment duration in days"""
+    @hybrid_property
+    def duration_days(self) -> int:
+        """Whole days from assignment to unassignment, or to now if active"""
         if not self.assigned_at:
             return 0
 
         end_date = self.unassigned_at or datetime.utcnow()
         return (end_date - self.assigned_at).days
 
-    def unassign(self, notes: str = None):
-        """Unassign the driver from vehicle"""
-        self.is_active = False
-        self.unassigned_at = datetime.utcnow()
+    @duration_days.expression
+    def duration_days(cls):
+        # Timestamps are naive UTC, as written by datetime.utcnow()
+        end_date = func.coalesce(cls.unassigned_at, func.timezone("UTC", func.now()))
+        return func.coalesce(
+            cast(func.extract("day", end_date - cls.assigned_at), Integer), 0
+        )
+
+    @classmethod
+    def unassign(
+        cls, db: Session, assignment_id, manager_id, notes: str = None
+    ) -> bool:
+        """
+        End an active assignment in a single conditional UPDATE
+
+        Concurrent unassigns race on the is_active condition in the database,
+        so exactly one of them ends the assignment.
+
+        Args:
+            db: Database session
+            assignment_id: Assignment UUID
+            manager_id: Manager UUID that must own the assignment
+            notes: Optional unassignment notes, replacing any earlier notes
+
+        Returns:
+            True if an active assignment was ended, False if none matched
+        """
+        values = {
+            "is_active": False,
+            # Timestamps are naive UTC, as written by datetime.utcnow()
+            "unassigned_at": func.timezone("UTC", func.now()),
+        }
         if notes:
-            self.assignment_notes = notes
-        self.updated_at = datetime.utcnow()
+            values["assignment_notes"] = notes
+
+        result = db.execute(
+            update(cls)
+            .where(
+                cls.id == assignment_id,
+                cls.manager_id == manager_id,
+                cls.is_active.is_(True),
+            )
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
@@ -2,8 +2,7 @@
 Vehicle status tracking models for maintenance and compliance
 """
 
-import uuid
-from datetime import datetime
+from datetime import datetime, time
 from typing import Optional
 from sqlalchemy import (
     Column,
@@ -12,14 +11,19 @@ from sqlalchemy import (
     Text,
     Boolean,
     Integer,
+    BigInteger,
     ForeignKey,
+    Index,
     Enum as SQLEnum,
 )
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.sql import and_, func, text
 from sqlalchemy.orm import relationship
 from enum import Enum
 
 from app.core.database import Base
+from app.utils.ids import uuid7
 
 
 class VehicleStatusEnum(str, Enum):
@@ -57,12 +61,11 @@ class VehicleStatusHistory(Base):
 
     __tablename__ = "vehicle_status_history"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     vehicle_id = Column(
         UUID(as_uuid=True),
         ForeignKey("vehicles.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     previous_status = Column(SQLEnum(VehicleStatusEnum), nullable=True)
     new_status = Column(SQLEnum(VehicleStatusEnum), nullable=False)
@@ -74,9 +77,15 @@ class VehicleStatusHistory(Base):
     changed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
-    # Relationships
-    vehicle = relationship("SimpleVehicle")
-    changed_by_user = relationship("UserProfile")
+    # Relationships. These tables are read through AsyncSession, where a
+    # lazy load cannot run; queries name what they need with selectinload or
+    # contains_eager, and anything else raises instead of failing mid-await
+    vehicle = relationship("SimpleVehicle", lazy="raise")
+    changed_by_user = relationship("UserProfile", lazy="raise")
+
+    # A vehicle's history is read newest first; (vehicle_id, changed_at)
+    # also serves the foreign key cascade
+    __table_args__ = (Index("ix_vsh_vehicle_time", "vehicle_id", "changed_at"),)
 
 
 class MaintenanceRecord(Base):
@@ -84,12 +93,11 @@ class MaintenanceRecord(Base):
 
     __tablename__ = "maintenance_records"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     vehicle_id = Column(
         UUID(as_uuid=True),
         ForeignKey("vehicles.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     maintenance_type = Column(SQLEnum(MaintenanceTypeEnum), nullable=False)
     priority = Column(
@@ -111,8 +119,8 @@ class MaintenanceRecord(Base):
     )
 
     # Cost tracking
-    estimated_cost = Column(Integer, nullable=True)  # In cents
-    actual_cost = Column(Integer, nullable=True)  # In cents
+    estimated_cost = Column(BigInteger, nullable=True)  # In cents
+    actual_cost = Column(BigInteger, nullable=True)  # In cents
 
     # Status
     is_completed = Column(Boolean, default=False, nullable=False)
@@ -129,8 +137,21 @@ class MaintenanceRecord(Base):
     )
 
     # Relationships
-    vehicle = relationship("SimpleVehicle")
-    creator = relationship("UserProfile")
+    vehicle = relationship("SimpleVehicle", lazy="raise")
+    creator = relationship("UserProfile", lazy="raise")
+
+    # Fleet dashboards and the pending list only look at open work orders,
+    # a small slice of the table; completed ones are reached by vehicle_id
+    # through ix_maint_vehicle_cost, which also covers per-vehicle cost sums
+    __table_args__ = (
+        Index(
+            "ix_maint_open_priority",
+            "vehicle_id",
+            "priority",
+            postgresql_where=text("NOT is_completed"),
+        ),
+        Index("ix_maint_vehicle_cost", "vehicle_id", "actual_cost"),
+    )
 
 
 class VehicleDocument(Base):
@@ -138,7 +159,7 @@ class VehicleDocument(Base):
 
     __tablename__ = "vehicle_documents"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     vehicle_id = Column(
         UUID(as_uuid=True),
         ForeignKey("vehicles.id", ondelete="CASCADE"),
@@ -157,7 +178,6 @@ class VehicleDocument(Base):
 
     # Status
     is_active = Column(Boolean, default=True, nullable=False)
-    is_expired = Column(Boolean, default=False, nullable=False)
 
     # File storage
     file_path = Column(String(500), nullable=True)  # Path to stored document
@@ -175,8 +195,38 @@ class VehicleDocument(Base):
     )
 
     # Relationships
-    vehicle = relationship("SimpleVehicle")
-    uploader = relationship("UserProfile")
+    vehicle = relationship("SimpleVehicle", lazy="raise")
+    uploader = relationship("UserProfile", lazy="raise")
+
+    @hybrid_property
+    def is_expired(self) -> bool:
+        """Whether the expiry date has passed; computed, never stored"""
+        expiry_date = self.expiry_date
+        if expiry_date is None:
+            return False
+        # Request schemas give a date; the column stores it as midnight
+        if not isinstance(expiry_date, datetime):
+            expiry_date = datetime.combine(expiry_date, time.min)
+        return expiry_date < datetime.utcnow()
+
+    @is_expired.expression
+    def is_expired(cls):
+        # Dates are naive UTC, as written by datetime.utcnow()
+        return and_(
+            cls.expiry_date.isnot(None),
+            cls.expiry_date < func.timezone("UTC", func.now()),
+        )
+
+    # Compliance refreshes look up each vehicle's latest active insurance
+    # expiry; only active insurance documents are indexed
+    __table_args__ = (
+        Index(
+            "ix_vehicle_documents_insurance_expiry",
+            "vehicle_id",
+            "expiry_date",
+            postgresql_where=text("document_type = 'insurance' AND is_active"),
+        ),
+    )
 
 
 class VehicleInspection(Base):
@@ -184,7 +234,7 @@ class VehicleInspection(Base):
 
     __tablename__ = "vehicle_inspections"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     vehicle_id = Column(
         UUID(as_uuid=True),
         ForeignKey("vehicles.id", ondelete="CASCADE"),
@@ -222,5 +272,5 @@ class VehicleInspection(Base):
     )
 
     # Relationships
-    vehicle = relationship("SimpleVehicle")
-    creator = relationship("UserProfile")
+    vehicle = relationship("SimpleVehicle", lazy="raise")
+    creator = relationship("UserProfile", lazy="raise")
@@ -2,20 +2,30 @@
 Authentication schemas for request/response validation
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import Optional
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Optional, Tuple
 from datetime import datetime
+from uuid import UUID
+from app.models.user_profile import UserRole
 from app.utils.phone_validator import PhoneValidator
 
 
+@lru_cache(maxsize=10_000)
+def _cached_validate(phone: str) -> Tuple[bool, Optional[str], Optional[str]]:
+    """PhoneValidator.validate_phone, memoized for retried and resent numbers"""
+    return PhoneValidator.validate_phone(phone)
+
+
 class RegistrationInitiateRequest(BaseModel):
     """Request schema for initiating registration"""
 
     phone: str = Field(..., description="Phone number in any format")
 
-    @validator("phone")
+    @field_validator("phone")
+    @classmethod
     def validate_phone(cls, v):
-        is_valid, normalized, error = PhoneValidator.validate_phone(v)
+        is_valid, normalized, error = _cached_validate(v)
         if not is_valid:
             raise ValueError(error)
         return normalized
@@ -44,14 +54,16 @@ class RegistrationVerifyRequest(BaseModel):
     )
     email: Optional[str] = Field(None, description="User's email address")
 
-    @validator("phone")
+    @field_validator("phone")
+    @classmethod
     def validate_phone(cls, v):
-        is_valid, normalized, error = PhoneValidator.validate_phone(v)
+        is_valid, normalized, error = _cached_validate(v)
         if not is_valid:
             raise ValueError(error)
         return normalized
 
-    @validator("otp")
+    @field_validator("otp")
+    @classmethod
     def validate_otp(cls, v):
         if not v.isdigit():
             raise ValueError("OTP must contain only digits")
@@ -74,9 +86,10 @@ class ResendOTPRequest(BaseModel):
 
     phone: str = Field(..., description="Phone number to resend OTP to")
 
-    @validator("phone")
+    @field_validator("phone")
+    @classmethod
     def validate_phone(cls, v):
-        is_valid, normalized, error = PhoneValidator.validate_phone(v)
+        is_valid, normalized, error = _cached_validate(v)
         if not is_valid:
             raise ValueError(error)
         return normalized
@@ -112,3 +125,15 @@ class UserProfileResponse(BaseModel):
     is_active: bool
     created_at: datetime
     updated_at: datetime
+
+
+class AuthPrincipal(BaseModel):
+    """Authenticated caller resolved from a bearer token"""
+
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+    id: UUID
+    user_id: UUID
+    role: UserRole
+    is_active: bool
+    fleet_id: Optional[UUID] = None
@@ -4,8 +4,14 @@ Pydantic schemas for booking system
 
 from datetime import datetime, date
 from decimal import Decimal
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import Annotated, List, Optional, Dict, Any
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    field_validator,
+)
 from enum import Enum
 
 from app.models.booking import (
@@ -15,6 +21,13 @@ from app.models.booking import (
     SeatPreference,
 )
 
+# Patterns are compiled once by pydantic-core when the models are built
+KENYAN_PHONE_PATTERN = r"^\+254[0-9]{9}$"
+EMAIL_PATTERN = r"^[^@]+@[^@]+\.[^@]+$"
+
+KenyanPhone = Annotated[str, StringConstraints(pattern=KENYAN_PHONE_PATTERN)]
+Email = Annotated[str, StringConstraints(pattern=EMAIL_PATTERN)]
+
 
 # Request Schemas
 class PassengerCreateRequest(BaseModel):
@@ -22,59 +35,49 @@ class PassengerCreateRequest(BaseModel):
 
     first_name: str = Field(..., min_length=2, max_length=100)
     last_name: str = Field(..., min_length=2, max_length=100)
-    phone: str = Field(..., pattern=r"^\+254[0-9]{9}$")
-    email: Optional[str] = Field(None, pattern=r"^[^@]+@[^@]+\.[^@]+$")
+    phone: KenyanPhone
+    email: Optional[Email] = None
     date_of_birth: Optional[date] = None
     national_id: Optional[str] = Field(None, max_length=50)
     preferred_seat_type: SeatPreference = SeatPreference.ANY
 
-    @validator("phone")
-    def validate_phone(cls, v):
-        if not v.startswith("+254"):
-            raise ValueError("Phone number must be in Kenyan format (+254XXXXXXXXX)")
-        return v
-
 
 class BookingCreateRequest(BaseModel):
     """Request schema for creating a booking"""
 
     trip_id: str = Field(..., description="Trip ID to book")
     seats_booked: int = Field(..., ge=1, le=10, description="Number of seats to book")
-    seat_numbers: List[str] = Field(..., min_items=1, max_items=10)
+    seat_numbers: List[str] = Field(..., min_length=1, max_length=10)
     passenger_name: str = Field(..., min_length=2, max_length=200)
-    passenger_phone: str = Field(..., pattern=r"^\+254[0-9]{9}$")
-    passenger_email: Optional[str] = Field(None, pattern=r"^[^@]+@[^@]+\.[^@]+$")
-    emergency_contact: Optional[str] = Field(None, pattern=r"^\+254[0-9]{9}$")
+    passenger_phone: KenyanPhone
+    passenger_email: Optional[Email] = None
+    emergency_contact: Optional[KenyanPhone] = None
     payment_method: PaymentMethod
 
-    @validator("seat_numbers")
-    def validate_seat_numbers(cls, v, values):
-        if "seats_booked" in values and len(v) != values["seats_booked"]:
+    @field_validator("seat_numbers")
+    @classmethod
+    def validate_seat_numbers(cls, v, info):
+        if "seats_booked" in info.data and len(v) != info.data["seats_booked"]:
             raise ValueError("Number of seat numbers must match seats_booked")
         return v
 
-    @validator("passenger_phone", "emergency_contact")
-    def validate_phone_format(cls, v):
-        if v and not v.startswith("+254"):
-            raise ValueError("Phone number must be in Kenyan format (+254XXXXXXXXX)")
-        return v
-
 
 class BookingUpdateRequest(BaseModel):
     """Request schema for updating a booking"""
 
     seats_booked: Optional[int] = Field(None, ge=1, le=10)
-    seat_numbers: Optional[List[str]] = Field(None, min_items=1, max_items=10)
+    seat_numbers: Optional[List[str]] = Field(None, min_length=1, max_length=10)
     passenger_name: Optional[str] = Field(None, min_length=2, max_length=200)
-    passenger_phone: Optional[str] = Field(None, pattern=r"^\+254[0-9]{9}$")
-    passenger_email: Optional[str] = Field(None, pattern=r"^[^@]+@[^@]+\.[^@]+$")
-    emergency_contact: Optional[str] = Field(None, pattern=r"^\+254[0-9]{9}$")
+    passenger_phone: Optional[KenyanPhone] = None
+    passenger_email: Optional[Email] = None
+    emergency_contact: Optional[KenyanPhone] = None
     payment_method: Optional[PaymentMethod] = None
 
-    @validator("seat_numbers")
-    def validate_seat_numbers(cls, v, values):
-        if v and "seats_booked" in values and values["seats_booked"]:
-            if len(v) != values["seats_booked"]:
+    @field_validator("seat_numbers")
+    @classmethod
+    def validate_seat_numbers(cls, v, info):
+        if v and info.data.get("seats_booked"):
+            if len(v) != info.data["seats_booked"]:
                 raise ValueError("Number of seat numbers must match seats_booked")
         return v
 
@@ -87,7 +90,8 @@ class PaymentCreateRequest(BaseModel):
     payment_method: PaymentMethod
     gateway_transaction_id: Optional[str] = Field(None, max_length=100)
 
-    @validator("amount")
+    @field_validator("amount")
+    @classmethod
     def validate_amount(cls, v):
         if v <= 0:
             raise ValueError("Payment amount must be positive")
@@ -106,10 +110,11 @@ class TripSearchRequest(BaseModel):
     page: int = Field(1, ge=1)
     limit: int = Field(20, ge=1, le=100)
 
-    @validator("max_fare")
-    def validate_fare_range(cls, v, values):
-        if v and "min_fare" in values and values["min_fare"]:
-            if v < values["min_fare"]:
+    @field_validator("max_fare")
+    @classmethod
+    def validate_fare_range(cls, v, info):
+        if v and info.data.get("min_fare"):
+            if v < info.data["min_fare"]:
                 raise ValueError("max_fare must be greater than or equal to min_fare")
         return v
 
@@ -124,15 +129,14 @@ class PassengerResponse(BaseModel):
     last_name: str
     phone: str
     email: Optional[str] = None
-    date_of_birth: Optional[str] = None
+    date_of_birth: Optional[date] = None
     national_id: Optional[str] = None
     preferred_seat_type: str
     loyalty_points: int
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BookingResponse(BaseModel):
@@ -154,13 +158,12 @@ class BookingResponse(BaseModel):
     passenger_phone: str
     passenger_email: Optional[str] = None
     emergency_contact: Optional[str] = None
-    booking_date: str
-    payment_deadline: Optional[str] = None
-    created_at: str
-    updated_at: str
+    booking_date: datetime
+    payment_deadline: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaymentResponse(BaseModel):
@@ -175,12 +178,11 @@ class PaymentResponse(BaseModel):
     gateway_transaction_id: Optional[str] = None
     gateway_response: Optional[str] = None
     payment_status: str
-    processed_at: Optional[str] = None
-    created_at: str
-    updated_at: str
+    processed_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SeatAvailabilityResponse(BaseModel):
@@ -198,8 +200,7 @@ class SeatAvailabilityResponse(BaseModel):
     departure_time: str
     arrival_time: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TripSearchResponse(BaseModel):
@@ -219,8 +220,7 @@ class TripSearchResponse(BaseModel):
     available_seats: int
     status: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BookingListResponse(BaseModel):
@@ -232,8 +232,7 @@ class BookingListResponse(BaseModel):
     limit: int
     total_pages: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TripSearchListResponse(BaseModel):
@@ -245,8 +244,7 @@ class TripSearchListResponse(BaseModel):
     limit: int
     total_pages: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Utility Schemas
@@ -260,8 +258,7 @@ class BookingConfirmationResponse(BaseModel):
     total_fare: float
     payment_deadline: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaymentConfirmationResponse(BaseModel):
@@ -274,5 +271,4 @@ class PaymentConfirmationResponse(BaseModel):
     amount: float
     payment_status: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -5,7 +5,7 @@ Payment schemas for API requests and responses
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from enum import Enum
 
 
@@ -63,7 +63,8 @@ class PaymentInitiateRequest(BaseModel):
         ..., gt=0, max_digits=10, decimal_places=2, description="Payment amount"
     )
 
-    @validator("phone_number")
+    @field_validator("phone_number")
+    @classmethod
     def validate_phone_number(cls, v):
         # Remove spaces and special characters
         phone = "".join(filter(str.isdigit, v.replace("+", "")))
@@ -78,7 +79,8 @@ class PaymentInitiateRequest(BaseModel):
 
         return phone
 
-    @validator("amount")
+    @field_validator("amount")
+    @classmethod
     def validate_amount(cls, v):
         if v <= 0:
             raise ValueError("Payment amount must be positive")
@@ -96,17 +98,11 @@ class PaymentStatusRequest(BaseModel):
     )
     payment_reference: Optional[str] = Field(None, description="Payment reference")
 
-    @validator("*", pre=True)
-    def validate_at_least_one(cls, v, values):
-        if not any(
-            [
-                values.get("payment_id"),
-                values.get("checkout_request_id"),
-                values.get("payment_reference"),
-            ]
-        ):
+    @model_validator(mode="after")
+    def validate_at_least_one(self):
+        if not any([self.payment_id, self.checkout_request_id, self.payment_reference]):
             raise ValueError("At least one identifier must be provided")
-        return v
+        return self
 
 
 class RefundInitiateRequest(BaseModel):
@@ -121,7 +117,8 @@ class RefundInitiateRequest(BaseModel):
         None, max_length=500, description="Additional notes"
     )
 
-    @validator("refund_amount")
+    @field_validator("refund_amount")
+    @classmethod
     def validate_refund_amount(cls, v):
         if v <= 0:
             raise ValueError("Refund amount must be positive")
@@ -225,8 +222,7 @@ class MpesaCallbackRequest(BaseModel):
 
     Body: Dict[str, Any]
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow")
 
 
 class MpesaCallbackResponse(BaseModel):
@@ -245,7 +241,8 @@ class ReceiptGenerateRequest(BaseModel):
         default=["email"], description="Delivery methods"
     )
 
-    @validator("delivery_methods")
+    @field_validator("delivery_methods")
+    @classmethod
     def validate_delivery_methods(cls, v):
         valid_methods = ["email", "sms"]
         for method in v:
@@ -268,6 +265,12 @@ class ReceiptResponse(BaseModel):
     verification_hash: Optional[str] = None
     created_at: datetime
 
+    @field_validator("verification_hash", mode="before")
+    @classmethod
+    def hex_verification_hash(cls, v):
+        # Stored as the raw digest; clients see it hex encoded
+        return v.hex() if isinstance(v, bytes) else v
+
 
 class ReceiptVerificationRequest(BaseModel):
     """Request schema for receipt verification"""
@@ -6,18 +6,8 @@ from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date, time
 from decimal import Decimal
-from enum import Enum
 
-
-class TripStatusEnum(str, Enum):
-    """Trip status enumeration"""
-
-    SCHEDULED = "scheduled"
-    ACTIVE = "active"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    CANCELLED = "cancelled"
-    DELAYED = "delayed"
+from app.models.trip_status import TripStatusEnum
 
 
 # Route Schemas
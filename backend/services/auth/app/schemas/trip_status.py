@@ -2,41 +2,25 @@
 Pydantic schemas for Trip Status Tracking
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from enum import Enum
 
+from app.models.trip_status import TripStatusEnum, UpdateSourceEnum
 
-class TripStatusEnum(str, Enum):
-    """Trip status enumeration for real-time tracking"""
-
-    SCHEDULED = "scheduled"
-    DEPARTED = "departed"
-    IN_TRANSIT = "in_transit"
-    ARRIVED = "arrived"
-    COMPLETED = "completed"
-    CANCELLED = "cancelled"
-    DELAYED = "delayed"
-
-
-class UpdateSourceEnum(str, Enum):
-    """Source of status update"""
-
-    SYSTEM = "system"
-    DRIVER = "driver"
-    GPS = "gps"
-    MANUAL = "manual"
-    PASSENGER = "passenger"
+# Readings outside this window come from a wrong device clock and would
+# land in gps_locations_default instead of a monthly partition
+GPS_MAX_READING_AGE = timedelta(days=31)
+GPS_MAX_CLOCK_AHEAD = timedelta(days=1)
 
 
 class TripStatusUpdateRequest(BaseModel):
     """Request to update trip status"""
 
     status: TripStatusEnum
-    location_lat: Optional[Decimal] = Field(None, description="Latitude coordinate")
-    location_lng: Optional[Decimal] = Field(None, description="Longitude coordinate")
+    location_lat: Optional[float] = Field(None, description="Latitude coordinate")
+    location_lng: Optional[float] = Field(None, description="Longitude coordinate")
     location_name: Optional[str] = Field(
         None, max_length=255, description="Location name"
     )
@@ -56,8 +40,8 @@ class TripStatusUpdateResponse(BaseModel):
     id: str
     trip_id: str
     status: TripStatusEnum
-    location_lat: Optional[Decimal]
-    location_lng: Optional[Decimal]
+    location_lat: Optional[float]
+    location_lng: Optional[float]
     location_name: Optional[str]
     estimated_arrival: Optional[datetime]
     delay_minutes: int
@@ -82,11 +66,11 @@ class GPSLocationRequest(BaseModel):
 
     vehicle_id: str
     trip_id: Optional[str] = None
-    latitude: Decimal = Field(..., description="Latitude coordinate")
-    longitude: Decimal = Field(..., description="Longitude coordinate")
-    altitude: Optional[Decimal] = Field(None, description="Altitude in meters")
-    speed_kmh: Optional[Decimal] = Field(None, ge=0, description="Speed in km/h")
-    heading: Optional[Decimal] = Field(
+    latitude: float = Field(..., description="Latitude coordinate")
+    longitude: float = Field(..., description="Longitude coordinate")
+    altitude: Optional[float] = Field(None, description="Altitude in meters")
+    speed_kmh: Optional[float] = Field(None, ge=0, description="Speed in km/h")
+    heading: Optional[float] = Field(
         None, ge=0, le=360, description="Compass heading 0-360"
     )
     accuracy_meters: Optional[int] = Field(
@@ -94,6 +78,26 @@ class GPSLocationRequest(BaseModel):
     )
     recorded_at: datetime = Field(..., description="When GPS reading was taken")
 
+    @field_validator("recorded_at")
+    @classmethod
+    def validate_recorded_at(cls, v):
+        # Naive values are UTC, as written by datetime.utcnow()
+        recorded_at = v if v.tzinfo else v.replace(tzinfo=timezone.utc)
+        now = datetime.now(timezone.utc)
+        if recorded_at > now + GPS_MAX_CLOCK_AHEAD:
+            raise ValueError("GPS reading time is in the future")
+        if recorded_at < now - GPS_MAX_READING_AGE:
+            raise ValueError("GPS reading is too old to record")
+        return v
+
+
+class GPSLocationBatchRequest(BaseModel):
+    """Request to record a batch of GPS locations"""
+
+    locations: List[GPSLocationRequest] = Field(
+        ..., min_length=1, max_length=1000, description="GPS readings to record"
+    )
+
 
 class GPSLocationResponse(BaseModel):
     """Response for GPS location"""
@@ -101,11 +105,11 @@ class GPSLocationResponse(BaseModel):
     id: str
     vehicle_id: str
     trip_id: Optional[str]
-    latitude: Decimal
-    longitude: Decimal
-    altitude: Optional[Decimal]
-    speed_kmh: Optional[Decimal]
-    heading: Optional[Decimal]
+    latitude: float
+    longitude: float
+    altitude: Optional[float]
+    speed_kmh: Optional[float]
+    heading: Optional[float]
     accuracy_meters: Optional[int]
     recorded_at: datetime
     received_at: datetime
@@ -7,6 +7,23 @@ from typing import Optional, List
 from pydantic import BaseModel, Field, field_validator
 import re
 
+# Kenyan license plate patterns:
+# KXX 123X (new format)
+# KXX 123XX (some variations)
+_LICENSE_PLATE_PATTERNS = (
+    re.compile(r"^K[A-Z]{2}[0-9]{3}[A-Z]$"),  # KXX 123X
+    re.compile(r"^K[A-Z]{2}[0-9]{3}[A-Z]{2}$"),  # KXX 123XX
+    re.compile(r"^[A-Z]{3}[0-9]{3}[A-Z]$"),  # XXX 123X (older format)
+)
+_FLEET_NUMBER_RE = re.compile(r"^[A-Za-z0-9\-_]+$")
+_SIM_SEPARATORS = re.compile(r"[\s\-\(\)]")
+# Kenyan mobile number patterns
+_SIM_NUMBER_PATTERNS = (
+    re.compile(r"^254[17][0-9]{8}$"),  # +254 7XX XXX XXX or +254 1XX XXX XXX
+    re.compile(r"^07[0-9]{8}$"),  # 07XX XXX XXX
+    re.compile(r"^01[0-9]{8}$"),  # 01XX XXX XXX
+)
+
 
 class VehicleRegistrationRequest(BaseModel):
     """Simplified vehicle registration request - Essential fields only"""
@@ -48,16 +65,7 @@ class VehicleRegistrationRequest(BaseModel):
         # Remove spaces and convert to uppercase
         v = v.replace(" ", "").upper()
 
-        # Kenyan license plate patterns:
-        # KXX 123X (new format)
-        # KXX 123XX (some variations)
-        patterns = [
-            r"^K[A-Z]{2}[0-9]{3}[A-Z]$",  # KXX 123X
-            r"^K[A-Z]{2}[0-9]{3}[A-Z]{2}$",  # KXX 123XX
-            r"^[A-Z]{3}[0-9]{3}[A-Z]$",  # XXX 123X (older format)
-        ]
-
-        if not any(re.match(pattern, v) for pattern in patterns):
+        if not any(pattern.match(v) for pattern in _LICENSE_PLATE_PATTERNS):
             raise ValueError(
                 "Invalid license plate format. Expected Kenyan format (e.g., KCA123A)"
             )
@@ -72,7 +80,7 @@ class VehicleRegistrationRequest(BaseModel):
             raise ValueError("Fleet number is required")
 
         # Allow alphanumeric characters, hyphens, and underscores
-        if not re.match(r"^[A-Za-z0-9\-_]+$", v):
+        if not _FLEET_NUMBER_RE.match(v):
             raise ValueError(
                 "Fleet number can only contain letters, numbers, hyphens, and underscores"
             )
@@ -87,16 +95,9 @@ class VehicleRegistrationRequest(BaseModel):
             return v
 
         # Remove spaces and special characters
-        v = re.sub(r"[\s\-\(\)]", "", v)
-
-        # Kenyan mobile number patterns
-        patterns = [
-            r"^254[17][0-9]{8}$",  # +254 7XX XXX XXX or +254 1XX XXX XXX
-            r"^07[0-9]{8}$",  # 07XX XXX XXX
-            r"^01[0-9]{8}$",  # 01XX XXX XXX
-        ]
+        v = _SIM_SEPARATORS.sub("", v)
 
-        if not any(re.match(pattern, v) for pattern in patterns):
+        if not any(pattern.match(v) for pattern in _SIM_NUMBER_PATTERNS):
             raise ValueError("Invalid SIM number format. Expected Kenyan mobile format")
 
         return v
@@ -4,7 +4,7 @@ Pydantic schemas for vehicle status and maintenance tracking
 
 from datetime import datetime, date
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -63,8 +63,7 @@ class StatusHistoryResponse(BaseModel):
     changed_at: datetime
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Maintenance Schemas
@@ -141,8 +140,7 @@ class MaintenanceRecordResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Document Schemas
@@ -180,8 +178,7 @@ class VehicleDocumentResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Inspection Schemas
@@ -240,8 +237,7 @@ class VehicleInspectionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # List Response Schemas
@@ -7,7 +7,7 @@ import math
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, func
+from sqlalchemy import and_, or_, desc, func, select
 
 from app.models.vehicle_assignment import VehicleAssignment
 from app.models.simple_vehicle import SimpleVehicle
@@ -17,6 +17,25 @@ from app.models.user_profile import UserProfile
 
 logger = logging.getLogger(__name__)
 
+# Assignment list columns, the AssignmentResponse fields in order; missing
+# drivers and vehicles fall back to the placeholders the response has
+# always used
+_ASSIGNMENT_LIST_COLUMNS = (
+    VehicleAssignment.id,
+    VehicleAssignment.driver_id,
+    VehicleAssignment.vehicle_id,
+    func.coalesce(SimpleDriver.driver_code, "Unknown Driver").label("driver_name"),
+    func.coalesce(
+        SimpleVehicle.fleet_number + " (" + SimpleVehicle.license_plate + ")",
+        "Unknown Vehicle",
+    ).label("vehicle_info"),
+    VehicleAssignment.assigned_at,
+    VehicleAssignment.unassigned_at,
+    VehicleAssignment.is_active,
+    VehicleAssignment.assignment_notes,
+    VehicleAssignment.created_at,
+)
+
 
 class AssignmentService:
     """Service for managing driver-vehicle assignments"""
@@ -184,41 +203,21 @@ class AssignmentService:
             # Get total count
             total_count = query.count()
 
-            # Apply pagination
+            # Apply pagination; one joined Core select returns rows ready for
+            # the orjson response, which encodes UUIDs and datetimes itself
             offset = (page - 1) * limit
-            assignments = (
-                query.order_by(desc(VehicleAssignment.assigned_at))
+            stmt = (
+                select(*_ASSIGNMENT_LIST_COLUMNS)
+                .outerjoin(SimpleDriver, SimpleDriver.id == VehicleAssignment.driver_id)
+                .outerjoin(
+                    SimpleVehicle, SimpleVehicle.id == VehicleAssignment.vehicle_id
+                )
+                .where(query.whereclause)
+                .order_by(desc(VehicleAssignment.assigned_at))
                 .offset(offset)
                 .limit(limit)
-                .all()
             )
-
-            # Get additional info for each assignment
-            assignment_list = []
-            for assignment in assignments:
-                # Get driver info
-                driver = (
-                    db.query(SimpleDriver)
-                    .filter(SimpleDriver.id == assignment.driver_id)
-                    .first()
-                )
-                driver_name = driver.driver_code if driver else "Unknown Driver"
-
-                # Get vehicle info
-                vehicle = (
-                    db.query(SimpleVehicle)
-                    .filter(SimpleVehicle.id == assignment.vehicle_id)
-                    .first()
-                )
-                vehicle_info = (
-                    f"{vehicle.fleet_number} ({vehicle.license_plate})"
-                    if vehicle
-                    else "Unknown Vehicle"
-                )
-
-                assignment_list.append(
-                    assignment.to_response_dict(driver_name, vehicle_info)
-                )
+            assignment_list = [dict(row) for row in db.execute(stmt).mappings()]
 
             total_pages = math.ceil(total_count / limit) if total_count > 0 else 1
 
@@ -257,25 +256,12 @@ class AssignmentService:
             Tuple of (success, response_data)
         """
         try:
-            # Find assignment
-            assignment = (
-                db.query(VehicleAssignment)
-                .filter(
-                    VehicleAssignment.id == assignment_id,
-                    VehicleAssignment.manager_id == manager_id,
-                    VehicleAssignment.is_active == True,
-                )
-                .first()
-            )
-
-            if not assignment:
+            if not VehicleAssignment.unassign(db, assignment_id, manager_id, notes):
                 return False, {
                     "error_code": "ASSIGNMENT_NOT_FOUND",
                     "message": "Assignment not found or already inactive",
                 }
 
-            # Unassign
-            assignment.unassign(notes)
             db.commit()
 
             logger.info(
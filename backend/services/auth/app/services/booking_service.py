@@ -11,9 +11,11 @@ from decimal import Decimal
 import secrets
 import string
 
+from app.core.database import get_by_id
 from app.models.booking import Booking, Passenger, Payment, BookingStatus, PaymentStatus
 from app.models.trip import Trip, Route
 from app.models.simple_vehicle import SimpleVehicle
+from app.utils.phone_validator import PhoneValidator
 from app.schemas.booking import (
     BookingCreateRequest,
     BookingUpdateRequest,
@@ -24,19 +26,13 @@ from app.schemas.booking import (
 
 logger = logging.getLogger(__name__)
 
+# Booking statuses that hold their seats; matches ix_bookings_trip_active
+ACTIVE_BOOKING_STATUSES = (BookingStatus.CONFIRMED.value, BookingStatus.PENDING.value)
+
 
 class BookingService:
     """Service for booking management"""
 
-    @staticmethod
-    def generate_booking_reference() -> str:
-        """Generate unique booking reference"""
-        # Generate BKG-XXXXXXXX format
-        random_part = "".join(
-            secrets.choice(string.ascii_uppercase + string.digits) for _ in range(8)
-        )
-        return f"BKG-{random_part}"
-
     @staticmethod
     def generate_payment_reference() -> str:
         """Generate unique payment reference"""
@@ -111,12 +107,9 @@ class BookingService:
             # Format response
             trips_data = []
             for trip in trips:
-                route = db.query(Route).filter(Route.id == trip.route_id).first()
-                vehicle = (
-                    db.query(SimpleVehicle)
-                    .filter(SimpleVehicle.id == trip.vehicle_id)
-                    .first()
-                )
+                # Trips on one route or vehicle share a single lookup
+                route = get_by_id(db, Route, trip.route_id)
+                vehicle = get_by_id(db, SimpleVehicle, trip.vehicle_id)
 
                 trips_data.append(
                     {
@@ -176,7 +169,7 @@ class BookingService:
                 .filter(
                     and_(
                         Booking.trip_id == trip_id,
-                        Booking.booking_status.in_(["CONFIRMED", "PENDING"]),
+                        Booking.booking_status.in_(ACTIVE_BOOKING_STATUSES),
                     )
                 )
                 .all()
@@ -221,6 +214,21 @@ class BookingService:
             logger.error(f"Error getting seat availability: {str(e)}")
             return False, {"error": f"Failed to get seat availability: {str(e)}"}
 
+    @staticmethod
+    def get_taken_seats(trip_id: str, seat_numbers: List[str], db: Session) -> set:
+        """Return which of the given seats are held by active bookings on a trip"""
+        rows = (
+            db.query(Booking.seat_numbers)
+            .filter(
+                Booking.trip_id == trip_id,
+                Booking.booking_status.in_(ACTIVE_BOOKING_STATUSES),
+                # Array overlap, served by the seat_numbers GIN index
+                Booking.seat_numbers.op("&&")(seat_numbers),
+            )
+            .all()
+        )
+        return {seat for (held,) in rows for seat in held}.intersection(seat_numbers)
+
     @staticmethod
     def create_or_get_passenger(
         request: BookingCreateRequest, db: Session
@@ -284,16 +292,13 @@ class BookingService:
             if trip.available_seats < request.seats_booked:
                 return False, {"error": "Not enough seats available"}
 
-            # Check if requested seats are available
-            success, availability_result = BookingService.get_seat_availability(
-                request.trip_id, db
+            # Check if requested seats exist and are not already held
+            valid_seats = {str(n) for n in range(1, trip.total_seats + 1)}
+            taken_seats = BookingService.get_taken_seats(
+                request.trip_id, request.seat_numbers, db
             )
-            if not success:
-                return False, {"error": "Failed to check seat availability"}
-
-            seat_map = availability_result["seat_map"]
             for seat_number in request.seat_numbers:
-                if seat_map.get(seat_number) != "available":
+                if seat_number not in valid_seats or seat_number in taken_seats:
                     return False, {"error": f"Seat {seat_number} is not available"}
 
             # Create or get passenger
@@ -303,9 +308,6 @@ class BookingService:
             if not success:
                 return False, {"error": error}
 
-            # Generate booking reference
-            booking_reference = BookingService.generate_booking_reference()
-
             # Calculate total fare
             total_fare = trip.fare * request.seats_booked
 
@@ -313,7 +315,6 @@ class BookingService:
             booking = Booking(
                 trip_id=request.trip_id,
                 passenger_id=passenger.id,
-                booking_reference=booking_reference,
                 seats_booked=request.seats_booked,
                 seat_numbers=request.seat_numbers,
                 total_fare=total_fare,
@@ -339,6 +340,8 @@ class BookingService:
             db.commit()
             db.refresh(booking)
 
+            # Reference is assigned by the database sequence on insert
+            booking_reference = booking.booking_reference
             logger.info(f"Created booking: {booking_reference}")
 
             return True, {
@@ -361,7 +364,8 @@ class BookingService:
     ) -> Tuple[bool, Dict[str, Any]]:
         """Get bookings for a passenger"""
         try:
-            # Get passenger
+            # Get passenger; phones are stored in +254XXXXXXXXX format
+            passenger_phone = PhoneValidator.normalize_phone(passenger_phone)
             passenger = (
                 db.query(Passenger).filter(Passenger.phone == passenger_phone).first()
             )
@@ -7,6 +7,7 @@ Generates unique driver IDs in the format DRV-XXXYYY where:
 """
 
 import logging
+import re
 from typing import Tuple, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import func, text
@@ -16,6 +17,8 @@ from app.models.fleet import Fleet
 
 logger = logging.getLogger(__name__)
 
+_DRIVER_ID_RE = re.compile(r"^DRV-[0-9]{3}[A-Z]{3}$")
+
 
 class DriverIDService:
     """Service for generating unique driver IDs"""
@@ -143,8 +146,7 @@ class DriverIDService:
             # Get count of existing drivers in this fleet
             # Using raw SQL to ensure atomicity and handle concurrent requests
             result = db.execute(
-                text(
-                    """
+                text("""
                     SELECT COALESCE(MAX(
                         CAST(
                             SUBSTRING(driver_code FROM 5 FOR 3) AS INTEGER
@@ -153,8 +155,7 @@ class DriverIDService:
                     FROM drivers
                     WHERE fleet_id = :fleet_id
                     AND driver_code ~ '^DRV-[0-9]{3}.*$'
-                """
-                ),
+                """),
                 {"fleet_id": fleet_id},
             )
 
@@ -180,10 +181,7 @@ class DriverIDService:
         Returns:
             True if valid format, False otherwise
         """
-        import re
-
-        pattern = r"^DRV-[0-9]{3}[A-Z]{3}$"
-        return bool(re.match(pattern, driver_id))
+        return bool(_DRIVER_ID_RE.match(driver_id))
 
     @staticmethod
     def extract_fleet_code(driver_id: str) -> Optional[str]:
@@ -122,6 +122,9 @@ class DriverService:
                     "error_code": "PHONE_EXISTS",
                 }
 
+            # Normalize so the equality lookup matches regardless of case
+            license_number = license_number.strip().upper()
+
             # Check if license number is already registered
             existing_license = (
                 db.query(SimpleDriver)
@@ -245,12 +248,11 @@ class DriverService:
             # Get total count
             total_count = query.count()
 
-            # Apply pagination
+            # Apply pagination; rows are serialized without loading instances
             offset = (page - 1) * limit
-            drivers = query.offset(offset).limit(limit).all()
-
-            # Convert to dict
-            drivers_data = [driver.to_dict() for driver in drivers]
+            drivers_data = SimpleDriver.dump_rows(
+                db, query.whereclause, offset=offset, limit=limit
+            )
 
             return True, {
                 "drivers": drivers_data,
@@ -2,19 +2,27 @@
 Fleet performance analytics service
 """
 
+import asyncio
+import logging
 import uuid
 from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict, Any, Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, desc, asc
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import Float, and_, asc, cast, desc, func, or_, text, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.core.config import settings
+from app.core.database import get_async_engine
 from app.models.fleet_analytics import (
-    PerformanceMetric,
+    PerformanceMeasures,
     RoutePerformance,
     VehiclePerformanceSummary,
+    VehicleDailySummary,
     FleetKPI,
+    PARTITIONED_TABLES,
 )
+from app.models.trip_status import GPSLocation
 from app.models.simple_vehicle import SimpleVehicle
 from app.models.simple_driver import SimpleDriver
 from app.models.user_profile import UserProfile
@@ -26,6 +34,60 @@ from app.schemas.fleet_analytics import (
     AnalyticsFilterRequest,
 )
 
+logger = logging.getLogger(__name__)
+
+# Only one worker refreshes at a time; the others skip that round
+_SUMMARY_REFRESH_LOCK = text(
+    "SELECT pg_try_advisory_xact_lock(hashtext('mv_vehicle_daily_summary'))"
+)
+_SUMMARY_REFRESH = text(
+    "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_vehicle_daily_summary"
+)
+
+# Monthly partitions are created this many months ahead of time
+PARTITION_MONTHS_AHEAD = 2
+
+_PARTITION_EXISTS = text("SELECT to_regclass(:name) IS NOT NULL")
+
+# Monthly gps_locations partitions, oldest first
+_GPS_PARTITIONS = text(
+    "SELECT c.relname FROM pg_inherits i "
+    "JOIN pg_class c ON c.oid = i.inhrelid "
+    "WHERE i.inhparent = 'gps_locations'::regclass "
+    "AND c.relname ~ '^gps_locations_[0-9]{4}_[0-9]{2}$' "
+    "ORDER BY c.relname"
+)
+
+
+def _measure(metric_type: str):
+    """A PerformanceMeasures measure as a float, NULL where not recorded"""
+    return cast(PerformanceMeasures.measures[metric_type].astext, Float)
+
+
+def _upsert(model, values: Dict[str, Any], key: Tuple[str, ...]):
+    """
+    Build an INSERT that updates the existing row on a natural key conflict
+
+    Args:
+        model: Mapped class with a unique constraint on `key`
+        values: Column values for the row
+        key: Columns of the unique constraint
+
+    Returns:
+        INSERT ... ON CONFLICT (key) DO UPDATE statement
+    """
+    stmt = pg_insert(model).values(**values)
+    return stmt.on_conflict_do_update(
+        index_elements=key,
+        set_={name: stmt.excluded[name] for name in values if name not in key},
+    )
+
+
+def _add_months(month: date, months: int) -> date:
+    """Return the first day of the month `months` after `month`"""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
 
 class FleetAnalyticsService:
     """Service for fleet performance analytics operations"""
@@ -71,29 +133,49 @@ class FleetAnalyticsService:
                 if not driver:
                     return False, {"error": "Driver not found in this fleet"}
 
-            # Create metric record
-            metric = PerformanceMetric(
-                vehicle_id=request.vehicle_id,
+            # Merge the reading into the vehicle's row for the day; a
+            # metric recorded twice keeps the latest value
+            metric_type = request.metric_type.value
+            reading = {
+                "metric_unit": request.metric_unit,
+                "period_start": (
+                    request.period_start.isoformat() if request.period_start else None
+                ),
+                "period_end": (
+                    request.period_end.isoformat() if request.period_end else None
+                ),
+                "route_id": request.route_id,
+                "driver_id": request.driver_id,
+                "notes": request.notes,
+            }
+            stmt = pg_insert(PerformanceMeasures).values(
                 fleet_id=fleet_id,
-                metric_type=request.metric_type.value,
-                metric_value=request.metric_value,
-                metric_unit=request.metric_unit,
+                vehicle_id=request.vehicle_id,
                 date_recorded=request.date_recorded,
-                period_start=request.period_start,
-                period_end=request.period_end,
-                route_id=request.route_id,
-                driver_id=request.driver_id,
-                notes=request.notes,
+                measures={metric_type: request.metric_value},
+                details={
+                    metric_type: {k: v for k, v in reading.items() if v is not None}
+                },
                 recorded_by=manager_id,
             )
-
-            db.add(metric)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["fleet_id", "vehicle_id", "date_recorded"],
+                set_={
+                    "measures": PerformanceMeasures.measures.op("||")(
+                        stmt.excluded.measures
+                    ),
+                    "details": PerformanceMeasures.details.op("||")(
+                        stmt.excluded.details
+                    ),
+                    "recorded_by": stmt.excluded.recorded_by,
+                },
+            ).returning(PerformanceMeasures.id)
+            metric_id = str(db.execute(stmt).scalar_one())
             db.commit()
-            db.refresh(metric)
 
             return True, {
                 "message": "Performance metric recorded successfully",
-                "metric_id": str(metric.id),
+                "metric_id": metric_id,
             }
 
         except SQLAlchemyError as e:
@@ -121,34 +203,38 @@ class FleetAnalyticsService:
                     request.total_distance_km / request.fuel_consumption_liters
                 )
 
-            # Create route performance record
-            route_perf = RoutePerformance(
-                fleet_id=fleet_id,
-                route_name=request.route_name,
-                route_code=request.route_code,
-                total_trips=request.total_trips,
-                total_distance_km=request.total_distance_km,
-                total_revenue=request.total_revenue,
-                total_passengers=request.total_passengers,
-                average_trip_time_minutes=request.average_trip_time_minutes,
-                on_time_percentage=request.on_time_percentage,
-                fuel_consumption_liters=request.fuel_consumption_liters,
-                fuel_efficiency_km_per_liter=fuel_efficiency,
-                maintenance_cost=request.maintenance_cost,
-                date_recorded=request.period_start.date(),
-                period_start=request.period_start,
-                period_end=request.period_end,
-                recorded_by=manager_id,
-                notes=request.notes,
-            )
-
-            db.add(route_perf)
+            # Re-recording a route for the same day replaces its figures
+            values = {
+                "fleet_id": fleet_id,
+                "route_name": request.route_name,
+                "route_code": request.route_code,
+                "total_trips": request.total_trips,
+                "total_distance_km": request.total_distance_km,
+                "total_revenue": request.total_revenue,
+                "total_passengers": request.total_passengers,
+                "average_trip_time_minutes": request.average_trip_time_minutes,
+                "on_time_percentage": request.on_time_percentage,
+                "fuel_consumption_liters": request.fuel_consumption_liters,
+                "fuel_efficiency_km_per_liter": fuel_efficiency,
+                "maintenance_cost": request.maintenance_cost,
+                "date_recorded": request.period_start.date(),
+                "period_start": request.period_start,
+                "period_end": request.period_end,
+                "recorded_by": manager_id,
+                "notes": request.notes,
+            }
+            route_perf_id = db.execute(
+                _upsert(
+                    RoutePerformance,
+                    values,
+                    ("fleet_id", "route_code", "date_recorded"),
+                ).returning(RoutePerformance.id)
+            ).scalar_one()
             db.commit()
-            db.refresh(route_perf)
 
             return True, {
                 "message": "Route performance recorded successfully",
-                "route_performance_id": str(route_perf.id),
+                "route_performance_id": str(route_perf_id),
             }
 
         except SQLAlchemyError as e:
@@ -169,49 +255,39 @@ class FleetAnalyticsService:
             if not fleet:
                 return False, {"error": "Fleet not found"}
 
-            # Calculate achievement percentage and trend
-            achievement_percentage = None
-            if request.target_value and request.target_value > 0:
-                achievement_percentage = (
-                    request.current_value / request.target_value
-                ) * 100
-
-            trend = None
-            if request.previous_value is not None:
-                if request.current_value > request.previous_value:
-                    trend = "improving"
-                elif request.current_value < request.previous_value:
-                    trend = "declining"
-                else:
-                    trend = "stable"
-
-            # Create KPI record
-            kpi = FleetKPI(
-                fleet_id=fleet_id,
-                kpi_name=request.kpi_name,
-                kpi_category=request.kpi_category,
-                current_value=request.current_value,
-                target_value=request.target_value,
-                previous_value=request.previous_value,
-                achievement_percentage=achievement_percentage,
-                trend=trend,
-                measurement_date=request.measurement_date,
-                period_type=request.period_type.value,
-                unit=request.unit,
-                description=request.description,
-                calculation_method=request.calculation_method,
-                recorded_by=manager_id,
-            )
-
-            db.add(kpi)
+            # achievement_percentage and trend are generated columns;
+            # RETURNING reads them back in the same round trip. Re-recording
+            # a KPI for the same day and period replaces its values
+            values = {
+                "fleet_id": fleet_id,
+                "kpi_name": request.kpi_name,
+                "kpi_category": request.kpi_category,
+                "current_value": request.current_value,
+                "target_value": request.target_value,
+                "previous_value": request.previous_value,
+                "measurement_date": request.measurement_date,
+                "period_type": request.period_type.value,
+                "unit": request.unit,
+                "description": request.description,
+                "calculation_method": request.calculation_method,
+                "recorded_by": manager_id,
+            }
+            kpi = db.execute(
+                _upsert(
+                    FleetKPI,
+                    values,
+                    ("fleet_id", "kpi_name", "measurement_date", "period_type"),
+                ).returning(
+                    FleetKPI.id, FleetKPI.achievement_percentage, FleetKPI.trend
+                )
+            ).one()
             db.commit()
-            db.refresh(kpi)
 
             return True, {
                 "message": "KPI recorded successfully",
                 "kpi_id": str(kpi.id),
-                "achievement_percentage": achievement_percentage,
-                "trend": trend,
+                "achievement_percentage": kpi.achievement_percentage,
+                "trend": kpi.trend,
             }
 
         except SQLAlchemyError as e:
@@ -231,86 +307,123 @@ class FleetAnalyticsService:
     ) -> Dict[str, Any]:
         """Get performance metrics for a fleet"""
         try:
-            # Base query
-            query = db.query(PerformanceMetric).filter(
-                PerformanceMetric.fleet_id == fleet_id
+            # One result per measure: expand each day's measures alongside
+            # the details recorded with them
+            measure = (
+                func.jsonb_each_text(PerformanceMeasures.measures)
+                .table_valued("key", "value", joins_implicitly=True)
+                .alias("measure")
+            )
+            reading = PerformanceMeasures.details[measure.c.key]
+            query = (
+                db.query(
+                    PerformanceMeasures,
+                    measure.c.key,
+                    cast(measure.c.value, Float),
+                    reading,
+                )
+                .select_from(PerformanceMeasures)
+                .join(measure, true())
+                .filter(PerformanceMeasures.fleet_id == fleet_id)
             )
 
             # Apply filters
             if filters.start_date:
                 query = query.filter(
-                    PerformanceMetric.date_recorded >= filters.start_date
+                    PerformanceMeasures.date_recorded >= filters.start_date
                 )
             if filters.end_date:
                 query = query.filter(
-                    PerformanceMetric.date_recorded <= filters.end_date
+                    PerformanceMeasures.date_recorded <= filters.end_date
                 )
             if filters.vehicle_ids:
                 query = query.filter(
-                    PerformanceMetric.vehicle_id.in_(filters.vehicle_ids)
+                    PerformanceMeasures.vehicle_id.in_(filters.vehicle_ids)
                 )
             if filters.driver_ids:
                 query = query.filter(
-                    PerformanceMetric.driver_id.in_(filters.driver_ids)
+                    reading["driver_id"].astext.in_(filters.driver_ids)
                 )
             if filters.metric_types:
                 metric_values = [mt.value for mt in filters.metric_types]
-                query = query.filter(PerformanceMetric.metric_type.in_(metric_values))
+                query = query.filter(measure.c.key.in_(metric_values))
             if filters.route_ids:
-                query = query.filter(PerformanceMetric.route_id.in_(filters.route_ids))
+                query = query.filter(reading["route_id"].astext.in_(filters.route_ids))
 
             # Get total count
             total_count = query.count()
 
             # Apply pagination and ordering
-            metrics = (
-                query.order_by(desc(PerformanceMetric.date_recorded))
+            rows = (
+                query.options(
+                    selectinload(PerformanceMeasures.vehicle),
+                    selectinload(PerformanceMeasures.recorder),
+                )
+                .order_by(desc(PerformanceMeasures.date_recorded), measure.c.key)
                 .offset((page - 1) * limit)
                 .limit(limit)
                 .all()
             )
 
+            # Drivers live in the details, load the page's in one query
+            driver_ids = {
+                details["driver_id"]
+                for _, _, _, details in rows
+                if details and details.get("driver_id")
+            }
+            drivers = {}
+            if driver_ids:
+                drivers = {
+                    str(driver.id): driver
+                    for driver in db.query(SimpleDriver).filter(
+                        SimpleDriver.id.in_(driver_ids)
+                    )
+                }
+
             # Format response
             metrics_data = []
-            for metric in metrics:
+            for row, metric_type, metric_value, details in rows:
+                details = details or {}
+
                 # Get related data
                 vehicle_info = None
-                if metric.vehicle:
-                    vehicle_info = f"{metric.vehicle.fleet_number} ({metric.vehicle.license_plate})"
+                if row.vehicle:
+                    vehicle_info = (
+                        f"{row.vehicle.fleet_number} ({row.vehicle.license_plate})"
+                    )
 
                 driver_name = None
-                if metric.driver:
-                    driver_name = f"{metric.driver.first_name or ''} {metric.driver.last_name or ''}".strip()
+                driver = drivers.get(details.get("driver_id"))
+                if driver:
+                    driver_name = (
+                        f"{driver.first_name or ''} {driver.last_name or ''}".strip()
+                    )
 
                 recorder_name = "Unknown"
-                if metric.recorder:
-                    recorder_name = f"{metric.recorder.first_name or ''} {metric.recorder.last_name or ''}".strip()
+                if row.recorder:
+                    recorder_name = f"{row.recorder.first_name or ''} {row.recorder.last_name or ''}".strip()
                     if not recorder_name:
-                        recorder_name = metric.recorder.phone
+                        recorder_name = row.recorder.phone
 
                 metrics_data.append(
                     {
-                        "id": str(metric.id),
-                        "vehicle_id": (
-                            str(metric.vehicle_id) if metric.vehicle_id else None
-                        ),
+                        "id": str(row.id),
+                        "vehicle_id": str(row.vehicle_id) if row.vehicle_id else None,
                         "vehicle_info": vehicle_info,
-                        "metric_type": metric.metric_type,
-                        "metric_value": metric.metric_value,
-                        "metric_unit": metric.metric_unit,
-                        "date_recorded": metric.date_recorded,
-                        "period_start": metric.period_start,
-                        "period_end": metric.period_end,
-                        "route_id": metric.route_id,
-                        "driver_id": (
-                            str(metric.driver_id) if metric.driver_id else None
-                        ),
+                        "metric_type": metric_type,
+                        "metric_value": metric_value,
+                        "metric_unit": details.get("metric_unit"),
+                        "date_recorded": row.date_recorded,
+                        "period_start": details.get("period_start"),
+                        "period_end": details.get("period_end"),
+                        "route_id": details.get("route_id"),
+                        "driver_id": details.get("driver_id"),
                         "driver_name": driver_name,
-                        "notes": metric.notes,
-                        "recorded_by": str(metric.recorded_by),
+                        "notes": details.get("notes"),
+                        "recorded_by": str(row.recorded_by),
                         "recorder_name": recorder_name,
-                        "created_at": metric.created_at,
-                        "updated_at": metric.updated_at,
+                        "created_at": row.created_at,
+                        "updated_at": row.updated_at,
                     }
                 )
 
@@ -362,7 +475,8 @@ class FleetAnalyticsService:
 
             # Apply pagination and ordering
             route_performances = (
-                query.order_by(desc(RoutePerformance.date_recorded))
+                query.options(selectinload(RoutePerformance.recorder))
+                .order_by(desc(RoutePerformance.date_recorded))
                 .offset((page - 1) * limit)
                 .limit(limit)
                 .all()
@@ -446,7 +560,8 @@ class FleetAnalyticsService:
 
             # Apply pagination and ordering
             kpis = (
-                query.order_by(desc(FleetKPI.measurement_date))
+                query.options(selectinload(FleetKPI.recorder))
+                .order_by(desc(FleetKPI.measurement_date))
                 .offset((page - 1) * limit)
                 .limit(limit)
                 .all()
@@ -546,78 +661,62 @@ class FleetAnalyticsService:
                 .count()
             )
 
-            # Today's performance metrics
-            today_metrics = (
-                db.query(PerformanceMetric)
+            # Today's performance metrics, one row per vehicle
+            (
+                total_trips_today,
+                total_revenue_today,
+                total_passengers_today,
+                total_distance_today,
+            ) = (
+                db.query(
+                    func.sum(_measure("trip_count")),
+                    func.sum(_measure("revenue")),
+                    func.sum(_measure("passenger_count")),
+                    func.sum(_measure("distance_traveled")),
+                )
                 .filter(
                     and_(
-                        PerformanceMetric.fleet_id == fleet_id,
-                        PerformanceMetric.date_recorded == target_date,
+                        PerformanceMeasures.fleet_id == fleet_id,
+                        PerformanceMeasures.date_recorded == target_date,
                     )
                 )
-                .all()
+                .one()
             )
-
-            total_trips_today = 0
-            total_revenue_today = 0
-            total_passengers_today = 0
-            total_distance_today = 0.0
-
-            for metric in today_metrics:
-                if metric.metric_type == "trip_count":
-                    total_trips_today += int(metric.metric_value)
-                elif metric.metric_type == "revenue":
-                    total_revenue_today += int(metric.metric_value)
-                elif metric.metric_type == "passenger_count":
-                    total_passengers_today += int(metric.metric_value)
-                elif metric.metric_type == "distance_traveled":
-                    total_distance_today += metric.metric_value
+            total_trips_today = int(total_trips_today or 0)
+            total_revenue_today = int(total_revenue_today or 0)
+            total_passengers_today = int(total_passengers_today or 0)
+            total_distance_today = total_distance_today or 0.0
 
             # Calculate efficiency metrics
             fleet_utilization_rate = None
             if total_vehicles > 0:
                 fleet_utilization_rate = (active_vehicles / total_vehicles) * 100
 
-            # Get average fuel efficiency
-            fuel_efficiency_metrics = (
-                db.query(PerformanceMetric)
+            # Weekly averages, served by the per-measure partial indexes
+            week_start = target_date - timedelta(days=7)
+            average_fuel_efficiency = (
+                db.query(func.avg(_measure("fuel_efficiency")))
                 .filter(
                     and_(
-                        PerformanceMetric.fleet_id == fleet_id,
-                        PerformanceMetric.metric_type == "fuel_efficiency",
-                        PerformanceMetric.date_recorded
-                        >= target_date - timedelta(days=7),
+                        PerformanceMeasures.fleet_id == fleet_id,
+                        PerformanceMeasures.measures.has_key("fuel_efficiency"),
+                        PerformanceMeasures.date_recorded >= week_start,
                     )
                 )
-                .all()
+                .scalar()
             )
-
-            average_fuel_efficiency = None
-            if fuel_efficiency_metrics:
-                total_efficiency = sum(m.metric_value for m in fuel_efficiency_metrics)
-                average_fuel_efficiency = total_efficiency / len(
-                    fuel_efficiency_metrics
-                )
-
-            # Get on-time performance
-            on_time_metrics = (
-                db.query(PerformanceMetric)
+            on_time_performance = (
+                db.query(func.avg(_measure("on_time_performance")))
                 .filter(
                     and_(
-                        PerformanceMetric.fleet_id == fleet_id,
-                        PerformanceMetric.metric_type == "on_time_performance",
-                        PerformanceMetric.date_recorded
-                        >= target_date - timedelta(days=7),
+                        PerformanceMeasures.fleet_id == fleet_id,
+                        PerformanceMeasures.measures.has_key("on_time_performance"),
+                        PerformanceMeasures.date_recorded >= week_start,
                     )
                 )
-                .all()
+                .scalar()
             )
 
-            on_time_performance = None
-            if on_time_metrics:
-                total_on_time = sum(m.metric_value for m in on_time_metrics)
-                on_time_performance = total_on_time / len(on_time_metrics)
-
             # Financial metrics (simplified)
             total_operating_cost = 0
             net_profit_today = total_revenue_today - total_operating_cost
@@ -625,20 +724,33 @@ class FleetAnalyticsService:
             if total_revenue_today > 0:
                 profit_margin = (net_profit_today / total_revenue_today) * 100
 
-            # Top performing vehicles (mock data for now)
+            # Top performing vehicles, read from the daily summary view
+            top_vehicles = (
+                db.query(
+                    VehicleDailySummary.vehicle_id,
+                    SimpleVehicle.fleet_number,
+                    VehicleDailySummary.trips_completed,
+                    VehicleDailySummary.total_revenue,
+                )
+                .join(SimpleVehicle, SimpleVehicle.id == VehicleDailySummary.vehicle_id)
+                .filter(
+                    and_(
+                        VehicleDailySummary.fleet_id == fleet_id,
+                        VehicleDailySummary.summary_date == target_date,
+                    )
+                )
+                .order_by(desc(VehicleDailySummary.total_revenue))
+                .limit(5)
+                .all()
+            )
             top_performing_vehicles = [
                 {
-                    "vehicle_id": "sample",
-                    "fleet_number": "KCS-001",
-                    "trips": 12,
-                    "revenue": 15000,
-                },
-                {
-                    "vehicle_id": "sample",
-                    "fleet_number": "KCS-002",
-                    "trips": 10,
-                    "revenue": 12000,
-                },
+                    "vehicle_id": str(row.vehicle_id),
+                    "fleet_number": row.fleet_number,
+                    "trips": row.trips_completed,
+                    "revenue": row.total_revenue / 100,
+                }
+                for row in top_vehicles
             ]
 
             # Top performing routes (mock data for now)
@@ -686,3 +798,165 @@ class FleetAnalyticsService:
 
         except Exception as e:
             return {"error": f"Error generating dashboard: {str(e)}"}
+
+    @staticmethod
+    async def refresh_vehicle_daily_summary() -> bool:
+        """
+        Refresh mv_vehicle_daily_summary without blocking readers
+
+        Returns:
+            True if refreshed, False if another worker held the refresh lock
+        """
+        async with get_async_engine().begin() as conn:
+            if not await conn.scalar(_SUMMARY_REFRESH_LOCK):
+                return False
+            await conn.execute(_SUMMARY_REFRESH)
+        return True
+
+    @staticmethod
+    async def create_month_partition(table: str, start: date) -> bool:
+        """
+        Create one monthly partition, moving in rows the DEFAULT partition
+        already holds for that month
+
+        PostgreSQL refuses CREATE TABLE ... PARTITION OF while the DEFAULT
+        partition has rows in the new range (e.g. a GPS reading stamped by a
+        client clock months ahead), so the partition is built detached, the
+        month's rows are moved into it and it is then attached.
+
+        Args:
+            table: Partitioned table name
+            start: First day of the month
+
+        Returns:
+            True if created, False if the partition already existed
+        """
+        partition = f"{table}_{start:%Y_%m}"
+        end = _add_months(start, 1)
+        key = PARTITIONED_TABLES[table]
+        async with get_async_engine().begin() as conn:
+            if await conn.scalar(_PARTITION_EXISTS, {"name": partition}):
+                return False
+            await conn.execute(
+                text(
+                    f"CREATE TABLE {partition} (LIKE {table} "
+                    f"INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+                )
+            )
+            await conn.execute(
+                text(
+                    f"WITH moved AS (DELETE FROM {table}_default "
+                    f"WHERE {key} >= '{start}' AND {key} < '{end}' RETURNING *) "
+                    f"INSERT INTO {partition} SELECT * FROM moved"
+                )
+            )
+            await conn.execute(
+                text(
+                    f"ALTER TABLE {table} ATTACH PARTITION {partition} "
+                    f"FOR VALUES FROM ('{start}') TO ('{end}')"
+                )
+            )
+        return True
+
+    @staticmethod
+    async def ensure_monthly_partitions(
+        months_ahead: int = PARTITION_MONTHS_AHEAD,
+    ) -> List[str]:
+        """
+        Create the current and upcoming monthly analytics and GPS partitions
+
+        Each partition is created in its own transaction, so one failure
+        does not hold back the other tables and months.
+
+        Args:
+            months_ahead: Number of months after the current one to create
+
+        Returns:
+            Names of the created partitions
+        """
+        this_month = date.today().replace(day=1)
+        created = []
+        for table in PARTITIONED_TABLES:
+            for offset in range(months_ahead + 1):
+                start = _add_months(this_month, offset)
+                partition = f"{table}_{start:%Y_%m}"
+                try:
+                    if await FleetAnalyticsService.create_month_partition(table, start):
+                        created.append(partition)
+                except SQLAlchemyError as e:
+                    logger.error("Creating partition %s failed: %s", partition, e)
+        return created
+
+    @staticmethod
+    async def drop_expired_gps_partitions(
+        retention_months: int = settings.GPS_RETENTION_MONTHS,
+    ) -> List[str]:
+        """
+        Drop monthly GPS location partitions older than the retention period
+
+        Dropping a partition discards its month of readings at once, without
+        the row-by-row DELETE and vacuum a plain table needs.
+
+        Args:
+            retention_months: Full months kept before the current one; 0
+                keeps everything
+
+        Returns:
+            Names of the dropped partitions
+        """
+        if retention_months <= 0:
+            return []
+
+        cutoff = _add_months(date.today().replace(day=1), -retention_months)
+        oldest_kept = f"{GPSLocation.__tablename__}_{cutoff:%Y_%m}"
+        dropped = []
+        async with get_async_engine().begin() as conn:
+            for name in (await conn.scalars(_GPS_PARTITIONS)).all():
+                # YYYY_MM suffixes sort in month order
+                if name >= oldest_kept:
+                    break
+                await conn.execute(text(f"DROP TABLE {name}"))
+                dropped.append(name)
+        return dropped
+
+    @staticmethod
+    async def run_partition_maintenance(interval_seconds: float) -> None:
+        """
+        Keep analytics and GPS partitions current and apply GPS retention
+
+        Runs every interval until cancelled.
+
+        Args:
+            interval_seconds: Seconds to wait between rounds
+        """
+        while True:
+            try:
+                created = await FleetAnalyticsService.ensure_monthly_partitions()
+                if created:
+                    logger.info("Created partitions: %s", created)
+            except Exception as e:
+                logger.error("Analytics partition maintenance failed: %s", e)
+            try:
+                dropped = await FleetAnalyticsService.drop_expired_gps_partitions()
+                if dropped:
+                    logger.info("Dropped expired GPS partitions: %s", dropped)
+            except Exception as e:
+                logger.error("GPS partition retention failed: %s", e)
+            await asyncio.sleep(interval_seconds)
+
+    @staticmethod
+    async def run_summary_refresh(interval_seconds: float) -> None:
+        """
+        Keep the daily summary view current
+
+        Runs every interval until cancelled.
+
+        Args:
+            interval_seconds: Seconds to wait between rounds
+        """
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await FleetAnalyticsService.refresh_vehicle_daily_summary()
+            except Exception as e:
+                logger.error("Vehicle daily summary refresh failed: %s", e)
@@ -4,6 +4,7 @@ JWT Token Service for authentication and authorization
 
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Dict, Any
 import jwt
 from jwt.exceptions import InvalidTokenError, ExpiredSignatureError
@@ -14,6 +15,12 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _verification_key(algorithm: str, key: str) -> Any:
+    """Prepare a verification key once instead of on every decode"""
+    return jwt.get_algorithm_by_name(algorithm).prepare_key(key)
+
+
 class JWTService:
     """Service for handling JWT token operations"""
 
@@ -116,9 +123,8 @@ class JWTService:
             ExpiredSignatureError: If token is expired
         """
         try:
-            payload = jwt.decode(
-                token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-            )
+            key = _verification_key(settings.JWT_ALGORITHM, settings.JWT_SECRET_KEY)
+            payload = jwt.decode(token, key, algorithms=[settings.JWT_ALGORITHM])
 
             # Validate required fields
             if not payload.get("sub"):
@@ -91,8 +91,9 @@ class LoginService:
                 }
 
             # Update rate limiting
-            redis_client.incr(rate_limit_key)
-            redis_client.expire(rate_limit_key, settings.RATE_LIMIT_WINDOW_MINUTES * 60)
+            redis_client.incr_with_expiry(
+                rate_limit_key, settings.RATE_LIMIT_WINDOW_MINUTES * 60
+            )
 
             # Calculate expiry times
             expires_at = datetime.utcnow() + timedelta(
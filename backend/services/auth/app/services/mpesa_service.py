@@ -3,19 +3,19 @@ M-Pesa Daraja API service for STK Push and B2C transactions
 """
 
 import base64
-import json
 import logging
 import secrets
 import string
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Dict, Optional, Tuple
 import httpx
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.models.payment import PaymentTransaction, PaymentStatus, PaymentWebhookLog
+from app.models.payment import PaymentTransaction, PaymentStatus
 from app.models.booking import Booking
+from app.services.webhook_bulk import log_webhook, new_webhook_log
 
 logger = logging.getLogger(__name__)
 
@@ -186,7 +186,7 @@ class MpesaService:
                         "MerchantRequestID"
                     )
                     payment_transaction.status = "processing"
-                    payment_transaction.gateway_response = json.dumps(response_data)
+                    payment_transaction.gateway_response = response_data
 
                     db.commit()
 
@@ -206,7 +206,7 @@ class MpesaService:
                     error_message = response_data.get("errorMessage", "STK Push failed")
                     payment_transaction.status = "failed"
                     payment_transaction.failure_reason = error_message
-                    payment_transaction.gateway_response = json.dumps(response_data)
+                    payment_transaction.gateway_response = response_data
 
                     db.commit()
 
@@ -274,16 +274,9 @@ class MpesaService:
         self, callback_data: Dict, db: Session
     ) -> Tuple[bool, Dict]:
         """Handle STK Push callback from M-Pesa"""
+        # Written after processing, outside the payment transaction
+        webhook_log = new_webhook_log("stk_push", callback_data)
         try:
-            # Log the webhook
-            webhook_log = PaymentWebhookLog(
-                webhook_type="stk_push",
-                raw_payload=json.dumps(callback_data),
-                processed=False,
-            )
-            db.add(webhook_log)
-            db.flush()
-
             # Extract callback data
             stk_callback = callback_data.get("Body", {}).get("stkCallback", {})
             checkout_request_id = stk_callback.get("CheckoutRequestID")
@@ -307,7 +300,7 @@ class MpesaService:
                 )
                 return False, {"error": "Payment not found"}
 
-            webhook_log.checkout_request_id = checkout_request_id
+            webhook_log["checkout_request_id"] = checkout_request_id
 
             # Process callback based on result code
             if result_code == 0:  # Success
@@ -323,7 +316,7 @@ class MpesaService:
                 payment.status = "completed"
                 payment.mpesa_receipt_number = metadata_dict.get("MpesaReceiptNumber")
                 payment.transaction_date = datetime.utcnow()
-                payment.gateway_response = json.dumps(callback_data)
+                payment.gateway_response = callback_data
 
                 # Update booking status
                 booking = (
@@ -334,8 +327,8 @@ class MpesaService:
                     booking.amount_paid = payment.amount
                     booking.booking_status = "CONFIRMED"
 
-                webhook_log.processed = True
-                webhook_log.processed_at = datetime.utcnow()
+                webhook_log["processed"] = True
+                webhook_log["processed_at"] = datetime.now(timezone.utc)
 
                 db.commit()
 
@@ -352,10 +345,10 @@ class MpesaService:
             else:  # Failed
                 payment.status = "failed"
                 payment.failure_reason = result_desc
-                payment.gateway_response = json.dumps(callback_data)
+                payment.gateway_response = callback_data
 
-                webhook_log.processed = True
-                webhook_log.processed_at = datetime.utcnow()
+                webhook_log["processed"] = True
+                webhook_log["processed_at"] = datetime.now(timezone.utc)
 
                 db.commit()
 
@@ -371,10 +364,13 @@ class MpesaService:
 
         except Exception as e:
             db.rollback()
-            if "webhook_log" in locals():
-                webhook_log.processing_error = str(e)
-                db.commit()
+            webhook_log["processed"] = False
+            webhook_log["processed_at"] = None
+            webhook_log["processing_error"] = str(e)
 
             error_msg = f"Error handling STK callback: {str(e)}"
             logger.error(error_msg)
             return False, {"error": error_msg}
+
+        finally:
+            log_webhook(db, webhook_log)
@@ -16,6 +16,7 @@ from app.models.payment import (
     RefundTransaction,
     RefundStatus,
     RefundReason,
+    from_cents,
 )
 from app.models.booking import Booking
 from app.models.trip import Trip
@@ -173,7 +174,7 @@ class PaymentService:
                 expires_at=payment.expires_at,
             )
 
-            return True, response.dict()
+            return True, response.model_dump()
 
         except Exception as e:
             logger.error(f"Error getting payment status: {str(e)}")
@@ -262,7 +263,7 @@ class PaymentService:
                 has_prev=page > 1,
             )
 
-            return True, response.dict()
+            return True, response.model_dump()
 
         except Exception as e:
             logger.error(f"Error listing payments: {str(e)}")
@@ -284,10 +285,12 @@ class PaymentService:
 
             # Calculate metrics
             total_payments = base_query.count()
-            total_amount = base_query.filter(
-                PaymentTransaction.status == "completed"
-            ).with_entities(func.sum(PaymentTransaction.amount)).scalar() or Decimal(
-                "0"
+            # Summed as int8 cents in the database
+            total_amount = from_cents(
+                base_query.filter(PaymentTransaction.status == "completed")
+                .with_entities(func.sum(PaymentTransaction.amount_cents))
+                .scalar()
+                or 0
             )
 
             successful_payments = base_query.filter(
@@ -320,10 +323,12 @@ class PaymentService:
             )
 
             today_payments = today_query.count()
-            today_amount = today_query.filter(
-                PaymentTransaction.status == "completed"
-            ).with_entities(func.sum(PaymentTransaction.amount)).scalar() or Decimal(
-                "0"
+            # Summed as int8 cents in the database
+            today_amount = from_cents(
+                today_query.filter(PaymentTransaction.status == "completed")
+                .with_entities(func.sum(PaymentTransaction.amount_cents))
+                .scalar()
+                or 0
             )
 
             # Recent payments
@@ -363,7 +368,7 @@ class PaymentService:
                 recent_payments=recent_payments,
             )
 
-            return True, response.dict()
+            return True, response.model_dump()
 
         except Exception as e:
             logger.error(f"Error getting payment dashboard: {str(e)}")
@@ -476,7 +481,7 @@ class PaymentService:
                 updated_at=refund.updated_at,
             )
 
-            return True, response.dict()
+            return True, response.model_dump()
 
         except Exception as e:
             db.rollback()
@@ -547,7 +552,7 @@ class PaymentService:
                 updated_at=refund.updated_at,
             )
 
-            return True, response.dict()
+            return True, response.model_dump()
 
         except Exception as e:
             logger.error(f"Error getting refund status: {str(e)}")
@@ -621,7 +626,7 @@ class PaymentService:
                 expires_at=payment.expires_at,
             )
 
-            return True, response.dict()
+            return True, response.model_dump()
 
         except Exception as e:
             logger.error(f"Error querying payment status: {str(e)}")
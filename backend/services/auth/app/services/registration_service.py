@@ -84,8 +84,9 @@ class RegistrationService:
                 }
 
             # Update rate limiting
-            redis_client.incr(rate_limit_key)
-            redis_client.expire(rate_limit_key, settings.RATE_LIMIT_WINDOW_MINUTES * 60)
+            redis_client.incr_with_expiry(
+                rate_limit_key, settings.RATE_LIMIT_WINDOW_MINUTES * 60
+            )
 
             # Calculate expiry times
             expires_at = datetime.utcnow() + timedelta(
@@ -314,8 +315,7 @@ class RegistrationService:
                 }
 
             # Update resend rate limiting
-            redis_client.incr(resend_key)
-            redis_client.expire(resend_key, 3600)  # 1 hour
+            redis_client.incr_with_expiry(resend_key, 3600)  # 1 hour
 
             expires_at = datetime.utcnow() + timedelta(
                 minutes=settings.OTP_EXPIRE_MINUTES
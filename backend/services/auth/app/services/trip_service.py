@@ -6,10 +6,12 @@ import logging
 from datetime import datetime, date, timedelta, time
 from typing import List, Dict, Any, Tuple, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, text
+from sqlalchemy import Float, and_, cast, or_, func, select, text
 from decimal import Decimal
 
-from app.models.trip import Route, Trip, TripTemplate, TripStatus
+from app.core.database import get_by_id
+from app.models.trip import Route, Trip, TripTemplate
+from app.models.trip_status import ACTIVE_TRIP_STATUSES, TripStatusEnum
 from app.models.simple_vehicle import SimpleVehicle
 from app.models.simple_driver import SimpleDriver
 from app.models.vehicle_assignment import VehicleAssignment
@@ -25,6 +27,38 @@ from app.schemas.trip import (
 
 logger = logging.getLogger(__name__)
 
+# Trip list columns in response order, read from trips alone through the
+# display snapshots; trips scheduled before them fall back to the same
+# placeholders the response has always used
+_TRIP_LIST_COLUMNS = (
+    Trip.id,
+    Trip.route_id,
+    func.coalesce(Trip.route_name_snapshot, "Unknown Route").label("route_name"),
+    func.coalesce(Trip.origin_snapshot, "Unknown").label("origin_name"),
+    func.coalesce(Trip.destination_snapshot, "Unknown").label("destination_name"),
+    Trip.vehicle_id,
+    func.coalesce(
+        Trip.vehicle_number_snapshot + " (" + Trip.vehicle_plate_snapshot + ")",
+        "Unknown Vehicle",
+    ).label("vehicle_info"),
+    Trip.driver_id,
+    func.coalesce("Driver " + Trip.driver_code_snapshot, "Unknown Driver").label(
+        "driver_name"
+    ),
+    Trip.fleet_id,
+    Trip.scheduled_departure,
+    Trip.scheduled_arrival,
+    Trip.actual_departure,
+    Trip.actual_arrival,
+    # orjson has no Decimal encoding
+    cast(Trip.fare, Float).label("fare"),
+    Trip.total_seats,
+    Trip.available_seats,
+    Trip.status,
+    Trip.created_at,
+    Trip.updated_at,
+)
+
 
 class TripService:
     """Service class for trip and route management"""
@@ -156,12 +190,7 @@ class TripService:
                         and_(
                             Trip.vehicle_id == request.vehicle_id,
                             Trip.fleet_id == fleet_id,
-                            Trip.status.in_(
-                                [
-                                    TripStatus.SCHEDULED.value,
-                                    TripStatus.IN_PROGRESS.value,
-                                ]
-                            ),
+                            Trip.status.in_(ACTIVE_TRIP_STATUSES),
                             or_(
                                 and_(
                                     Trip.scheduled_departure <= request.start_datetime,
@@ -204,12 +233,7 @@ class TripService:
                         and_(
                             Trip.driver_id == request.driver_id,
                             Trip.fleet_id == fleet_id,
-                            Trip.status.in_(
-                                [
-                                    TripStatus.SCHEDULED.value,
-                                    TripStatus.IN_PROGRESS.value,
-                                ]
-                            ),
+                            Trip.status.in_(ACTIVE_TRIP_STATUSES),
                             or_(
                                 and_(
                                     Trip.scheduled_departure <= request.start_datetime,
@@ -377,6 +401,7 @@ class TripService:
                 booked_seats=0,
                 notes=request.notes,
             )
+            trip.take_snapshot(route, vehicle, driver)
 
             db.add(trip)
             db.commit()
@@ -424,85 +449,17 @@ class TripService:
             # Get total count
             total_count = query.count()
 
-            # Apply pagination
+            # Apply pagination; one Core select over trips returns rows ready for
+            # the orjson response, which encodes UUIDs and datetimes itself
             offset = (page - 1) * limit
-            trips = (
-                query.order_by(Trip.scheduled_departure.desc())
+            stmt = (
+                select(*_TRIP_LIST_COLUMNS)
+                .where(query.whereclause)
+                .order_by(Trip.scheduled_departure.desc())
                 .offset(offset)
                 .limit(limit)
-                .all()
             )
-
-            # Format response with related data
-            trips_data = []
-            for trip in trips:
-                # Get route info
-                route = db.query(Route).filter(Route.id == trip.route_id).first()
-
-                # Get vehicle info
-                vehicle = (
-                    db.query(SimpleVehicle)
-                    .filter(SimpleVehicle.id == trip.vehicle_id)
-                    .first()
-                )
-                vehicle_info = (
-                    f"{vehicle.fleet_number} ({vehicle.license_plate})"
-                    if vehicle
-                    else "Unknown Vehicle"
-                )
-
-                # Get driver info
-                driver = (
-                    db.query(SimpleDriver)
-                    .filter(SimpleDriver.id == trip.driver_id)
-                    .first()
-                )
-                driver_name = (
-                    f"Driver {driver.driver_code}" if driver else "Unknown Driver"
-                )
-
-                trip_data = {
-                    "id": str(trip.id),
-                    "route_id": str(trip.route_id),
-                    "route_name": route.route_name if route else "Unknown Route",
-                    "route_code": route.route_code if route else "Unknown",
-                    "origin_name": route.origin_name if route else "Unknown",
-                    "destination_name": route.destination_name if route else "Unknown",
-                    "vehicle_id": str(trip.vehicle_id),
-                    "vehicle_info": vehicle_info,
-                    "driver_id": str(trip.driver_id),
-                    "driver_name": driver_name,
-                    "assignment_id": (
-                        str(trip.assignment_id) if trip.assignment_id else None
-                    ),
-                    "fleet_id": str(trip.fleet_id),
-                    "trip_code": trip.trip_code,
-                    "scheduled_departure": trip.scheduled_departure.isoformat(),
-                    "scheduled_arrival": (
-                        trip.scheduled_arrival.isoformat()
-                        if trip.scheduled_arrival
-                        else None
-                    ),
-                    "actual_departure": (
-                        trip.actual_departure.isoformat()
-                        if trip.actual_departure
-                        else None
-                    ),
-                    "actual_arrival": (
-                        trip.actual_arrival.isoformat() if trip.actual_arrival else None
-                    ),
-                    "fare": float(trip.fare),
-                    "total_seats": trip.total_seats,
-                    "available_seats": trip.available_seats,
-                    "booked_seats": trip.booked_seats,
-                    "status": trip.status,
-                    "notes": trip.notes,
-                    "cancellation_reason": trip.cancellation_reason,
-                    "created_by": str(trip.created_by),
-                    "created_at": trip.created_at.isoformat(),
-                    "updated_at": trip.updated_at.isoformat(),
-                }
-                trips_data.append(trip_data)
+            trips_data = [dict(row) for row in db.execute(stmt).mappings()]
 
             total_pages = (total_count + limit - 1) // limit
 
@@ -538,7 +495,10 @@ class TripService:
                 return False, {"error": "Trip not found"}
 
             # Check if trip can be modified (not completed or cancelled)
-            if trip.status in [TripStatus.COMPLETED.value, TripStatus.CANCELLED.value]:
+            if trip.status in [
+                TripStatusEnum.COMPLETED.value,
+                TripStatusEnum.CANCELLED.value,
+            ]:
                 return False, {"error": "Cannot modify completed or cancelled trips"}
 
             # If updating vehicle or driver, check availability
@@ -581,6 +541,14 @@ class TripService:
             update_data = request.model_dump(exclude_unset=True)
             for field, value in update_data.items():
                 setattr(trip, field, value)
+            if request.vehicle_id:
+                trip.take_snapshot(
+                    vehicle=get_by_id(db, SimpleVehicle, request.vehicle_id)
+                )
+            if request.driver_id:
+                trip.take_snapshot(
+                    driver=get_by_id(db, SimpleDriver, request.driver_id)
+                )
 
             db.commit()
             db.refresh(trip)
@@ -617,14 +585,14 @@ class TripService:
             if not trip:
                 return False, {"error": "Trip not found"}
 
-            if trip.status == TripStatus.CANCELLED.value:
+            if trip.status == TripStatusEnum.CANCELLED.value:
                 return False, {"error": "Trip is already cancelled"}
 
-            if trip.status == TripStatus.COMPLETED.value:
+            if trip.status == TripStatusEnum.COMPLETED.value:
                 return False, {"error": "Cannot cancel completed trip"}
 
             # Update trip status
-            trip.status = TripStatus.CANCELLED.value
+            trip.status = TripStatusEnum.CANCELLED.value
             trip.cancellation_reason = cancellation_reason
             trip.available_seats = 0  # No more bookings allowed
 
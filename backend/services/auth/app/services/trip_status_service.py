@@ -5,13 +5,15 @@ Trip Status Service for Real-time Trip Tracking
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any, Tuple, List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, func
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, bindparam, desc, func, insert, or_, select, text
 from math import ceil
 from decimal import Decimal
 
+from app.core.database import get_by_id, load_options
 from app.models.trip import Trip
 from app.models.trip_status import (
+    ACTIVE_TRIP_STATUSES,
     TripStatusUpdate,
     GPSLocation,
     NotificationPreference,
@@ -19,18 +21,43 @@ from app.models.trip_status import (
     UpdateSourceEnum,
 )
 from app.models.simple_vehicle import SimpleVehicle
-from app.models.simple_driver import SimpleDriver
 from app.models.user_profile import UserProfile
 from app.models.booking import Booking
 from app.schemas.trip_status import (
     TripStatusUpdateRequest,
     GPSLocationRequest,
+    GPSLocationBatchRequest,
     NotificationPreferenceRequest,
     DelayAlertRequest,
 )
 
 logger = logging.getLogger(__name__)
 
+# GPS batches smaller than this go through a plain multi-row INSERT
+GPS_COPY_MIN_ROWS = 20
+
+# Lookup statements are built once at import; each call only binds values
+_TRIP_BY_ID = select(Trip).where(Trip.id == bindparam("trip_id"))
+_TRIP_UPDATES_PAGE = (
+    select(TripStatusUpdate)
+    .where(TripStatusUpdate.trip_id == bindparam("trip_id"))
+    .order_by(desc(TripStatusUpdate.created_at))
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit"))
+)
+_LATEST_TRIP_UPDATE = (
+    select(TripStatusUpdate)
+    .where(TripStatusUpdate.trip_id == bindparam("trip_id"))
+    .order_by(desc(TripStatusUpdate.created_at))
+    .limit(1)
+)
+_LATEST_VEHICLE_LOCATION = (
+    select(GPSLocation)
+    .where(GPSLocation.vehicle_id == bindparam("vehicle_id"))
+    .order_by(desc(GPSLocation.recorded_at))
+    .limit(1)
+)
+
 
 class TripStatusService:
     """Service for managing real-time trip status updates"""
@@ -56,7 +83,7 @@ class TripStatusService:
         """
         try:
             # Get trip
-            trip = db.query(Trip).filter(Trip.id == trip_id).first()
+            trip = db.scalar(_TRIP_BY_ID, {"trip_id": trip_id})
 
             if not trip:
                 return False, {
@@ -67,13 +94,13 @@ class TripStatusService:
             # Create status update record
             status_update = TripStatusUpdate(
                 trip_id=trip_id,
-                status=request.status,
+                status=request.status.value,
                 location_lat=request.location_lat,
                 location_lng=request.location_lng,
                 location_name=request.location_name,
                 estimated_arrival=request.estimated_arrival,
                 delay_minutes=request.delay_minutes or 0,
-                update_source=request.update_source,
+                update_source=request.update_source.value,
                 notes=request.notes,
                 updated_by=updated_by,
             )
@@ -129,7 +156,7 @@ class TripStatusService:
         """Get trip status update history with pagination"""
         try:
             # Check if trip exists
-            trip = db.query(Trip).filter(Trip.id == trip_id).first()
+            trip = db.scalar(_TRIP_BY_ID, {"trip_id": trip_id})
             if not trip:
                 return False, {
                     "error_code": "TRIP_NOT_FOUND",
@@ -148,14 +175,10 @@ class TripStatusService:
             total_pages = ceil(total_count / limit) if total_count > 0 else 1
 
             # Get status updates
-            status_updates = (
-                db.query(TripStatusUpdate)
-                .filter(TripStatusUpdate.trip_id == trip_id)
-                .order_by(desc(TripStatusUpdate.created_at))
-                .offset(offset)
-                .limit(limit)
-                .all()
-            )
+            status_updates = db.scalars(
+                _TRIP_UPDATES_PAGE,
+                {"trip_id": trip_id, "offset": offset, "limit": limit},
+            ).all()
 
             # Convert to response format
             status_updates_data = []
@@ -164,11 +187,8 @@ class TripStatusService:
 
                 # Add updater name if available
                 if update.updated_by:
-                    updater = (
-                        db.query(UserProfile)
-                        .filter(UserProfile.id == update.updated_by)
-                        .first()
-                    )
+                    # One lookup per distinct updater, not per update
+                    updater = get_by_id(db, UserProfile, update.updated_by)
                     update_data["updated_by_name"] = (
                         updater.full_name if updater else "Unknown User"
                     )
@@ -211,7 +231,7 @@ class TripStatusService:
 
             # Verify trip exists if provided
             if request.trip_id:
-                trip = db.query(Trip).filter(Trip.id == request.trip_id).first()
+                trip = db.scalar(_TRIP_BY_ID, {"trip_id": request.trip_id})
                 if not trip:
                     return False, {
                         "error_code": "TRIP_NOT_FOUND",
@@ -253,6 +273,84 @@ class TripStatusService:
                 "message": f"Failed to record GPS location: {str(e)}",
             }
 
+    @staticmethod
+    def record_gps_locations(
+        request: GPSLocationBatchRequest,
+        db: Session = None,
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Record a batch of GPS locations
+
+        Small batches go through one INSERT, which insertmanyvalues sends
+        as multi-row VALUES pages; larger ones are streamed with a binary
+        COPY. Pings are superseded within seconds, so the commit does not
+        wait for the WAL flush (synchronous_commit off for this
+        transaction only).
+
+        Args:
+            request: GPS readings, for any number of vehicles and trips
+            db: Database session
+
+        Returns:
+            Tuple of (success, response_data)
+        """
+        try:
+            locations = request.locations
+
+            # Verify every referenced vehicle and trip in one query each
+            vehicle_ids = {location.vehicle_id for location in locations}
+            found = {
+                str(vehicle_id)
+                for (vehicle_id,) in db.query(SimpleVehicle.id).filter(
+                    SimpleVehicle.id.in_(vehicle_ids)
+                )
+            }
+            if found != vehicle_ids:
+                return False, {
+                    "error_code": "VEHICLE_NOT_FOUND",
+                    "message": f"Vehicles not found: {', '.join(sorted(vehicle_ids - found))}",
+                }
+
+            trip_ids = {location.trip_id for location in locations if location.trip_id}
+            if trip_ids:
+                found = {
+                    str(trip_id)
+                    for (trip_id,) in db.query(Trip.id).filter(Trip.id.in_(trip_ids))
+                }
+                if found != trip_ids:
+                    return False, {
+                        "error_code": "TRIP_NOT_FOUND",
+                        "message": f"Trips not found: {', '.join(sorted(trip_ids - found))}",
+                    }
+
+            # id comes from uuid7 per row; received_at is left to the
+            # server default and never sent
+            rows = [location.model_dump() for location in locations]
+            db.execute(text("SET LOCAL synchronous_commit = OFF"))
+            if len(rows) < GPS_COPY_MIN_ROWS:
+                db.execute(insert(GPSLocation), rows)
+            else:
+                GPSLocation.bulk_copy(db, rows)
+            db.commit()
+
+            logger.info(
+                f"{len(locations)} GPS locations recorded for "
+                f"{len(vehicle_ids)} vehicles"
+            )
+
+            return True, {
+                "message": "GPS locations recorded successfully",
+                "recorded_count": len(locations),
+            }
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"GPS batch recording error: {e}")
+            return False, {
+                "error_code": "RECORDING_FAILED",
+                "message": f"Failed to record GPS locations: {str(e)}",
+            }
+
     @staticmethod
     def get_current_trip_location(
         trip_id: str,
@@ -261,7 +359,7 @@ class TripStatusService:
         """Get current GPS location for a trip"""
         try:
             # Get trip and vehicle
-            trip = db.query(Trip).filter(Trip.id == trip_id).first()
+            trip = db.scalar(_TRIP_BY_ID, {"trip_id": trip_id})
             if not trip:
                 return False, {
                     "error_code": "TRIP_NOT_FOUND",
@@ -269,11 +367,8 @@ class TripStatusService:
                 }
 
             # Get latest GPS location for the trip's vehicle
-            latest_location = (
-                db.query(GPSLocation)
-                .filter(GPSLocation.vehicle_id == trip.vehicle_id)
-                .order_by(desc(GPSLocation.recorded_at))
-                .first()
+            latest_location = db.scalar(
+                _LATEST_VEHICLE_LOCATION, {"vehicle_id": trip.vehicle_id}
             )
 
             if not latest_location:
@@ -301,13 +396,21 @@ class TripStatusService:
     ) -> Tuple[bool, Dict[str, Any]]:
         """Get real-time fleet tracking dashboard data"""
         try:
-            # Get active trips for the fleet
+            # Get active trips for the fleet; routes, vehicles and drivers
+            # load in one IN query each rather than one query per trip
             active_trips = (
                 db.query(Trip)
+                .options(
+                    *load_options(
+                        selectinload(Trip.route),
+                        selectinload(Trip.vehicle),
+                        selectinload(Trip.driver),
+                    )
+                )
                 .filter(
                     and_(
                         Trip.fleet_id == fleet_id,
-                        Trip.status.in_(["scheduled", "departed", "in_transit"]),
+                        Trip.status.in_(ACTIVE_TRIP_STATUSES),
                     )
                 )
                 .all()
@@ -320,7 +423,7 @@ class TripStatusService:
                 .filter(
                     and_(
                         Trip.fleet_id == fleet_id,
-                        Trip.status == "completed",
+                        Trip.status == TripStatusEnum.COMPLETED.value,
                         func.date(Trip.actual_arrival) == today,
                     )
                 )
@@ -332,7 +435,7 @@ class TripStatusService:
                 .filter(
                     and_(
                         Trip.fleet_id == fleet_id,
-                        Trip.status == "cancelled",
+                        Trip.status == TripStatusEnum.CANCELLED.value,
                         func.date(Trip.updated_at) == today,
                     )
                 )
@@ -347,19 +450,11 @@ class TripStatusService:
 
             for trip in active_trips:
                 # Get latest status update
-                latest_update = (
-                    db.query(TripStatusUpdate)
-                    .filter(TripStatusUpdate.trip_id == trip.id)
-                    .order_by(desc(TripStatusUpdate.created_at))
-                    .first()
-                )
+                latest_update = db.scalar(_LATEST_TRIP_UPDATE, {"trip_id": trip.id})
 
                 # Get current location
-                current_location = (
-                    db.query(GPSLocation)
-                    .filter(GPSLocation.vehicle_id == trip.vehicle_id)
-                    .order_by(desc(GPSLocation.recorded_at))
-                    .first()
+                current_location = db.scalar(
+                    _LATEST_VEHICLE_LOCATION, {"vehicle_id": trip.vehicle_id}
                 )
 
                 # Calculate delay
@@ -373,23 +468,15 @@ class TripStatusService:
                 else:
                     on_time_count += 1
 
-                # Get vehicle and driver info
-                vehicle = (
-                    db.query(SimpleVehicle)
-                    .filter(SimpleVehicle.id == trip.vehicle_id)
-                    .first()
-                )
-                driver = (
-                    db.query(SimpleDriver)
-                    .filter(SimpleDriver.id == trip.driver_id)
-                    .first()
-                )
+                route = trip.route
+                vehicle = trip.vehicle
+                driver = trip.driver
 
                 trip_data = {
                     "trip_id": str(trip.id),
                     "trip_code": trip.trip_code,
                     "current_status": (
-                        latest_update.status.value if latest_update else trip.status
+                        latest_update.status if latest_update else trip.status
                     ),
                     "scheduled_departure": trip.scheduled_departure.isoformat(),
                     "scheduled_arrival": (
@@ -411,9 +498,9 @@ class TripStatusService:
                     "current_location": (
                         current_location.to_dict() if current_location else None
                     ),
-                    "route_name": f"Route {trip.route_id}",  # TODO: Get actual route name
-                    "origin_name": "Origin",  # TODO: Get from route
-                    "destination_name": "Destination",  # TODO: Get from route
+                    "route_name": route.name if route else "Unknown Route",
+                    "origin_name": route.origin if route else "Unknown",
+                    "destination_name": route.destination if route else "Unknown",
                     "vehicle_info": (
                         f"{vehicle.fleet_number} ({vehicle.license_plate})"
                         if vehicle
@@ -464,7 +551,7 @@ class TripStatusService:
         """Create delay alert and notify passengers"""
         try:
             # Get trip
-            trip = db.query(Trip).filter(Trip.id == request.trip_id).first()
+            trip = db.scalar(_TRIP_BY_ID, {"trip_id": request.trip_id})
             if not trip:
                 return False, {
                     "error_code": "TRIP_NOT_FOUND",
@@ -474,10 +561,10 @@ class TripStatusService:
             # Create status update for delay
             status_update = TripStatusUpdate(
                 trip_id=request.trip_id,
-                status=TripStatusEnum.DELAYED,
+                status=TripStatusEnum.DELAYED.value,
                 delay_minutes=request.delay_minutes,
                 estimated_arrival=request.estimated_arrival,
-                update_source=UpdateSourceEnum.MANUAL,
+                update_source=UpdateSourceEnum.MANUAL.value,
                 notes=request.reason,
                 updated_by=manager_id,
             )
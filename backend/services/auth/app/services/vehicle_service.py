@@ -6,7 +6,6 @@ import logging
 from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, func
-from datetime import datetime
 
 from app.models.simple_vehicle import SimpleVehicle, VehicleStatus
 from app.models.fleet import Fleet
@@ -321,10 +320,9 @@ class VehicleService:
                 if hasattr(vehicle, field):
                     setattr(vehicle, field, value)
 
-            vehicle.updated_at = datetime.utcnow()
-
-            # Update compliance status
-            vehicle.update_status_based_on_compliance()
+            # Update compliance status; the UPDATE sees the flushed fields
+            db.flush()
+            SimpleVehicle.refresh_compliance_statuses(db, [vehicle.id])
 
             db.commit()
             db.refresh(vehicle)
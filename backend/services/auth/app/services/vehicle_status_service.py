@@ -3,12 +3,14 @@ Vehicle status and maintenance tracking service
 """
 
 import logging
-from datetime import datetime, date
+from datetime import date
 from typing import Dict, Any, Tuple, List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, selectinload
+from sqlalchemy import and_, or_, desc, func, select
 from math import ceil
 
+from app.core.database import load_options
 from app.models.simple_vehicle import SimpleVehicle
 from app.models.vehicle_status import (
     VehicleStatusHistory,
@@ -28,13 +30,13 @@ class VehicleStatusService:
     """Service for managing vehicle status and maintenance"""
 
     @staticmethod
-    def change_vehicle_status(
+    async def change_vehicle_status(
         vehicle_id: str,
         new_status: VehicleStatusEnum,
         manager_id: str,
         reason: Optional[str] = None,
         notes: Optional[str] = None,
-        db: Session = None,
+        db: AsyncSession = None,
     ) -> Tuple[bool, Dict[str, Any]]:
         """
         Change vehicle status and record history
@@ -53,8 +55,10 @@ class VehicleStatusService:
         try:
             # Get vehicle
             vehicle = (
-                db.query(SimpleVehicle).filter(SimpleVehicle.id == vehicle_id).first()
-            )
+                await db.execute(
+                    select(SimpleVehicle).where(SimpleVehicle.id == vehicle_id)
+                )
+            ).scalar_one_or_none()
 
             if not vehicle:
                 return False, {
@@ -63,7 +67,11 @@ class VehicleStatusService:
                 }
 
             # Get manager profile
-            manager = db.query(UserProfile).filter(UserProfile.id == manager_id).first()
+            manager = (
+                await db.execute(
+                    select(UserProfile).where(UserProfile.id == manager_id)
+                )
+            ).scalar_one_or_none()
             if not manager:
                 return False, {
                     "error_code": "MANAGER_NOT_FOUND",
@@ -92,10 +100,9 @@ class VehicleStatusService:
 
             # Update vehicle status
             vehicle.status = new_status.value
-            vehicle.updated_at = datetime.utcnow()
 
             db.add(status_history)
-            db.commit()
+            await db.commit()
 
             return True, {
                 "message": "Vehicle status updated successfully",
@@ -107,26 +114,28 @@ class VehicleStatusService:
 
         except Exception as e:
             logger.error(f"Status change error: {e}")
-            db.rollback()
+            await db.rollback()
             return False, {
                 "error_code": "STATUS_CHANGE_FAILED",
                 "message": "Failed to change vehicle status",
             }
 
     @staticmethod
-    def get_vehicle_status_history(
+    async def get_vehicle_status_history(
         vehicle_id: str,
         manager_id: str,
         page: int = 1,
         limit: int = 20,
-        db: Session = None,
+        db: AsyncSession = None,
     ) -> Tuple[bool, Dict[str, Any]]:
         """Get vehicle status history with pagination"""
         try:
             # Verify access
             vehicle = (
-                db.query(SimpleVehicle).filter(SimpleVehicle.id == vehicle_id).first()
-            )
+                await db.execute(
+                    select(SimpleVehicle).where(SimpleVehicle.id == vehicle_id)
+                )
+            ).scalar_one_or_none()
 
             if not vehicle:
                 return False, {
@@ -134,7 +143,11 @@ class VehicleStatusService:
                     "message": "Vehicle not found",
                 }
 
-            manager = db.query(UserProfile).filter(UserProfile.id == manager_id).first()
+            manager = (
+                await db.execute(
+                    select(UserProfile).where(UserProfile.id == manager_id)
+                )
+            ).scalar_one_or_none()
             if not manager or str(vehicle.fleet_id) != str(manager.fleet_id):
                 return False, {
                     "error_code": "ACCESS_DENIED",
@@ -144,24 +157,35 @@ class VehicleStatusService:
             # Get status history with pagination
             offset = (page - 1) * limit
 
-            query = (
-                db.query(VehicleStatusHistory)
-                .filter(VehicleStatusHistory.vehicle_id == vehicle_id)
-                .order_by(desc(VehicleStatusHistory.changed_at))
+            query = select(VehicleStatusHistory).where(
+                VehicleStatusHistory.vehicle_id == vehicle_id
             )
 
-            total_count = query.count()
-            history_records = query.offset(offset).limit(limit).all()
+            total_count = await db.scalar(
+                select(func.count()).select_from(query.subquery())
+            )
+            history_records = (
+                (
+                    await db.execute(
+                        query.options(
+                            *load_options(
+                                selectinload(VehicleStatusHistory.changed_by_user)
+                            )
+                        )
+                        .order_by(desc(VehicleStatusHistory.changed_at))
+                        .offset(offset)
+                        .limit(limit)
+                    )
+                )
+                .scalars()
+                .all()
+            )
 
             # Format response
             history_list = []
             for record in history_records:
                 # Get user name
-                user = (
-                    db.query(UserProfile)
-                    .filter(UserProfile.id == record.changed_by)
-                    .first()
-                )
+                user = record.changed_by_user
                 user_name = (
                     f"{user.first_name} {user.last_name}"
                     if user and user.first_name
@@ -201,18 +225,20 @@ class VehicleStatusService:
             }
 
     @staticmethod
-    def create_maintenance_record(
+    async def create_maintenance_record(
         vehicle_id: str,
         manager_id: str,
         maintenance_data: Dict[str, Any],
-        db: Session = None,
+        db: AsyncSession = None,
     ) -> Tuple[bool, Dict[str, Any]]:
         """Create a new maintenance record"""
         try:
             # Verify access
             vehicle = (
-                db.query(SimpleVehicle).filter(SimpleVehicle.id == vehicle_id).first()
-            )
+                await db.execute(
+                    select(SimpleVehicle).where(SimpleVehicle.id == vehicle_id)
+                )
+            ).scalar_one_or_none()
 
             if not vehicle:
                 return False, {
@@ -220,7 +246,11 @@ class VehicleStatusService:
                     "message": "Vehicle not found",
                 }
 
-            manager = db.query(UserProfile).filter(UserProfile.id == manager_id).first()
+            manager = (
+                await db.execute(
+                    select(UserProfile).where(UserProfile.id == manager_id)
+                )
+            ).scalar_one_or_none()
             if not manager or str(vehicle.fleet_id) != str(manager.fleet_id):
                 return False, {
                     "error_code": "ACCESS_DENIED",
@@ -233,7 +263,7 @@ class VehicleStatusService:
             )
 
             db.add(maintenance_record)
-            db.commit()
+            await db.commit()
 
             # Format response
             vehicle_info = f"{vehicle.fleet_number} ({vehicle.license_plate})"
@@ -284,32 +314,35 @@ class VehicleStatusService:
 
         except Exception as e:
             logger.error(f"Create maintenance record error: {e}")
-            db.rollback()
+            await db.rollback()
             return False, {
                 "error_code": "CREATE_FAILED",
                 "message": "Failed to create maintenance record",
             }
 
     @staticmethod
-    def get_fleet_maintenance_records(
+    async def get_fleet_maintenance_records(
         manager_id: str,
         fleet_id: str,
         page: int = 1,
         limit: int = 20,
         status_filter: Optional[str] = None,
         priority_filter: Optional[str] = None,
-        db: Session = None,
+        db: AsyncSession = None,
     ) -> Tuple[bool, Dict[str, Any]]:
         """Get maintenance records for fleet with filtering"""
         try:
             # Verify manager access
             manager = (
-                db.query(UserProfile)
-                .filter(
-                    and_(UserProfile.id == manager_id, UserProfile.fleet_id == fleet_id)
+                await db.execute(
+                    select(UserProfile).where(
+                        and_(
+                            UserProfile.id == manager_id,
+                            UserProfile.fleet_id == fleet_id,
+                        )
+                    )
                 )
-                .first()
-            )
+            ).scalar_one_or_none()
 
             if not manager:
                 return False, {
@@ -319,40 +352,42 @@ class VehicleStatusService:
 
             # Build query
             query = (
-                db.query(MaintenanceRecord)
+                select(MaintenanceRecord)
                 .join(SimpleVehicle)
-                .filter(SimpleVehicle.fleet_id == fleet_id)
+                .where(SimpleVehicle.fleet_id == fleet_id)
             )
 
             # Apply filters
             if status_filter == "pending":
-                query = query.filter(MaintenanceRecord.is_completed == False)
+                query = query.where(MaintenanceRecord.is_completed == False)
             elif status_filter == "completed":
-                query = query.filter(MaintenanceRecord.is_completed == True)
+                query = query.where(MaintenanceRecord.is_completed == True)
 
             if priority_filter:
-                query = query.filter(MaintenanceRecord.priority == priority_filter)
+                query = query.where(MaintenanceRecord.priority == priority_filter)
+
+            # Pagination
+            offset = (page - 1) * limit
+            total_count = await db.scalar(
+                select(func.count()).select_from(query.subquery())
+            )
 
             # Order by priority and date
-            query = query.order_by(
+            query = query.options(
+                *load_options(contains_eager(MaintenanceRecord.vehicle))
+            ).order_by(
                 MaintenanceRecord.priority.desc(),
                 MaintenanceRecord.scheduled_date.asc().nullslast(),
                 MaintenanceRecord.created_at.desc(),
             )
-
-            # Pagination
-            offset = (page - 1) * limit
-            total_count = query.count()
-            records = query.offset(offset).limit(limit).all()
+            records = (
+                (await db.execute(query.offset(offset).limit(limit))).scalars().all()
+            )
 
             # Format response
             maintenance_list = []
             for record in records:
-                vehicle = (
-                    db.query(SimpleVehicle)
-                    .filter(SimpleVehicle.id == record.vehicle_id)
-                    .first()
-                )
+                vehicle = record.vehicle
                 vehicle_info = (
                     f"{vehicle.fleet_number} ({vehicle.license_plate})"
                     if vehicle
@@ -418,18 +453,20 @@ class VehicleStatusService:
             }
 
     @staticmethod
-    def create_vehicle_document(
+    async def create_vehicle_document(
         vehicle_id: str,
         manager_id: str,
         document_data: Dict[str, Any],
-        db: Session = None,
+        db: AsyncSession = None,
     ) -> Tuple[bool, Dict[str, Any]]:
         """Create a new vehicle document"""
         try:
             # Verify access
             vehicle = (
-                db.query(SimpleVehicle).filter(SimpleVehicle.id == vehicle_id).first()
-            )
+                await db.execute(
+                    select(SimpleVehicle).where(SimpleVehicle.id == vehicle_id)
+                )
+            ).scalar_one_or_none()
 
             if not vehicle:
                 return False, {
@@ -437,7 +474,11 @@ class VehicleStatusService:
                     "message": "Vehicle not found",
                 }
 
-            manager = db.query(UserProfile).filter(UserProfile.id == manager_id).first()
+            manager = (
+                await db.execute(
+                    select(UserProfile).where(UserProfile.id == manager_id)
+                )
+            ).scalar_one_or_none()
             if not manager or str(vehicle.fleet_id) != str(manager.fleet_id):
                 return False, {
                     "error_code": "ACCESS_DENIED",
@@ -450,7 +491,7 @@ class VehicleStatusService:
             )
 
             db.add(document)
-            db.commit()
+            await db.commit()
 
             return True, {
                 "message": "Vehicle document created successfully",
@@ -481,26 +522,28 @@ class VehicleStatusService:
 
         except Exception as e:
             logger.error(f"Create document error: {e}")
-            db.rollback()
+            await db.rollback()
             return False, {
                 "error_code": "CREATE_FAILED",
                 "message": "Failed to create vehicle document",
             }
 
     @staticmethod
-    def get_vehicle_documents(
+    async def get_vehicle_documents(
         vehicle_id: str,
         manager_id: str,
         page: int = 1,
         limit: int = 20,
-        db: Session = None,
+        db: AsyncSession = None,
     ) -> Tuple[bool, Dict[str, Any]]:
         """Get vehicle documents with pagination"""
         try:
             # Verify access
             vehicle = (
-                db.query(SimpleVehicle).filter(SimpleVehicle.id == vehicle_id).first()
-            )
+                await db.execute(
+                    select(SimpleVehicle).where(SimpleVehicle.id == vehicle_id)
+                )
+            ).scalar_one_or_none()
 
             if not vehicle:
                 return False, {
@@ -508,7 +551,11 @@ class VehicleStatusService:
                     "message": "Vehicle not found",
                 }
 
-            manager = db.query(UserProfile).filter(UserProfile.id == manager_id).first()
+            manager = (
+                await db.execute(
+                    select(UserProfile).where(UserProfile.id == manager_id)
+                )
+            ).scalar_one_or_none()
             if not manager or str(vehicle.fleet_id) != str(manager.fleet_id):
                 return False, {
                     "error_code": "ACCESS_DENIED",
@@ -518,14 +565,24 @@ class VehicleStatusService:
             # Get documents with pagination
             offset = (page - 1) * limit
 
-            query = (
-                db.query(VehicleDocument)
-                .filter(VehicleDocument.vehicle_id == vehicle_id)
-                .order_by(desc(VehicleDocument.created_at))
+            query = select(VehicleDocument).where(
+                VehicleDocument.vehicle_id == vehicle_id
             )
 
-            total_count = query.count()
-            documents = query.offset(offset).limit(limit).all()
+            total_count = await db.scalar(
+                select(func.count()).select_from(query.subquery())
+            )
+            documents = (
+                (
+                    await db.execute(
+                        query.order_by(desc(VehicleDocument.created_at))
+                        .offset(offset)
+                        .limit(limit)
+                    )
+                )
+                .scalars()
+                .all()
+            )
 
             # Format response
             document_list = []
@@ -572,21 +629,24 @@ class VehicleStatusService:
             }
 
     @staticmethod
-    def get_fleet_status_dashboard(
+    async def get_fleet_status_dashboard(
         manager_id: str,
         fleet_id: str,
-        db: Session = None,
+        db: AsyncSession = None,
     ) -> Tuple[bool, Dict[str, Any]]:
         """Get fleet status dashboard summary"""
         try:
             # Verify manager access
             manager = (
-                db.query(UserProfile)
-                .filter(
-                    and_(UserProfile.id == manager_id, UserProfile.fleet_id == fleet_id)
+                await db.execute(
+                    select(UserProfile).where(
+                        and_(
+                            UserProfile.id == manager_id,
+                            UserProfile.fleet_id == fleet_id,
+                        )
+                    )
                 )
-                .first()
-            )
+            ).scalar_one_or_none()
 
             if not manager:
                 return False, {
@@ -596,7 +656,13 @@ class VehicleStatusService:
 
             # Get fleet vehicles
             vehicles = (
-                db.query(SimpleVehicle).filter(SimpleVehicle.fleet_id == fleet_id).all()
+                (
+                    await db.execute(
+                        select(SimpleVehicle).where(SimpleVehicle.fleet_id == fleet_id)
+                    )
+                )
+                .scalars()
+                .all()
             )
 
             # Count vehicles by status
@@ -608,32 +674,30 @@ class VehicleStatusService:
             )
 
             # Count pending maintenance
-            pending_maintenance = (
-                db.query(MaintenanceRecord)
+            pending_maintenance = await db.scalar(
+                select(func.count(MaintenanceRecord.id))
                 .join(SimpleVehicle)
-                .filter(
+                .where(
                     and_(
                         SimpleVehicle.fleet_id == fleet_id,
                         MaintenanceRecord.is_completed == False,
                     )
                 )
-                .count()
             )
 
             # Count overdue maintenance (scheduled date passed)
             from datetime import datetime
 
-            overdue_maintenance = (
-                db.query(MaintenanceRecord)
+            overdue_maintenance = await db.scalar(
+                select(func.count(MaintenanceRecord.id))
                 .join(SimpleVehicle)
-                .filter(
+                .where(
                     and_(
                         SimpleVehicle.fleet_id == fleet_id,
                         MaintenanceRecord.is_completed == False,
                         MaintenanceRecord.scheduled_date < datetime.utcnow(),
                     )
                 )
-                .count()
             )
 
             return True, {
@@ -0,0 +1,262 @@
+"""
+Batched persistence for M-Pesa webhook logs
+
+Callbacks push their log record onto a Redis list and a background task
+drains it, writing each batch with a single binary COPY instead of one
+INSERT per callback. A batch is moved to a processing list before it is
+written, so records survive a crash mid-write; if the batch is rejected,
+its records are retried one by one and any that still fail are set aside
+on a dead-letter list.
+"""
+
+import asyncio
+import io
+import logging
+import secrets
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List
+
+import orjson
+from sqlalchemy import insert
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import engine
+from app.core.redis_client import redis_client
+from app.models.payment import PaymentWebhookLog
+from app.utils import pg_copy
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_LOG_QUEUE = "webhooks:payment_logs"
+WEBHOOK_LOG_PROCESSING = "webhooks:payment_logs:processing"
+WEBHOOK_LOG_DEAD_LETTER = "webhooks:payment_logs:dead"
+
+# One worker drains the queue at a time, so the processing list only ever
+# holds the batch being written or one left behind by a crashed worker
+_FLUSH_LOCK = "webhooks:payment_logs:flush_lock"
+_FLUSH_LOCK_SECONDS = 300
+
+# Delete the lock only while it still holds this worker's token; a flush
+# that outlives _FLUSH_LOCK_SECONDS must not release another worker's lock
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+# Batches smaller than this go through a plain multi-row INSERT
+COPY_MIN_ROWS = 20
+
+# COPY column order; id is left to its gen_random_uuid() default
+_COLUMNS = (
+    ("checkout_request_id", pg_copy.text),
+    ("webhook_type", pg_copy.text),
+    ("raw_payload", pg_copy.jsonb),
+    ("headers", pg_copy.text),
+    ("processed", pg_copy.boolean),
+    ("processing_error", pg_copy.text),
+    ("retry_count", pg_copy.int4),
+    ("received_at", pg_copy.timestamptz),
+    ("processed_at", pg_copy.timestamptz),
+)
+
+_COPY_SQL = pg_copy.copy_sql(PaymentWebhookLog.__tablename__, _COLUMNS)
+
+_TIMESTAMP_FIELDS = ("received_at", "processed_at")
+
+
+def new_webhook_log(webhook_type: str, raw_payload: Dict) -> Dict[str, Any]:
+    """
+    Start a webhook log record, stamped with its arrival time
+
+    Args:
+        webhook_type: Webhook kind ('stk_push', 'b2c', ...)
+        raw_payload: Callback body as received
+
+    Returns:
+        Record with every PaymentWebhookLog column COPY writes
+    """
+    return {
+        "checkout_request_id": None,
+        "webhook_type": webhook_type,
+        "raw_payload": raw_payload,
+        "headers": None,
+        "processed": False,
+        "processing_error": None,
+        "retry_count": 0,
+        "received_at": datetime.now(timezone.utc),
+        "processed_at": None,
+    }
+
+
+def encode_copy_binary(rows: Iterable[Dict[str, Any]]) -> bytes:
+    """
+    Encode webhook log records as a COPY binary stream
+
+    Args:
+        rows: Records as built by new_webhook_log
+
+    Returns:
+        Header, one tuple per record and trailer
+    """
+    return pg_copy.encode_copy_binary(_COLUMNS, rows)
+
+
+def bulk_insert_webhooks(conn, rows: List[Dict[str, Any]]) -> None:
+    """
+    COPY webhook log records into payment_webhook_logs
+
+    Args:
+        conn: psycopg2 connection; the caller commits
+        rows: Records as built by new_webhook_log
+    """
+    with conn.cursor() as cursor:
+        cursor.copy_expert(_COPY_SQL, io.BytesIO(encode_copy_binary(rows)))
+
+
+def _write_batch(rows: List[Dict[str, Any]]) -> None:
+    """Write one batch, using COPY once it is large enough to pay off"""
+    if len(rows) < COPY_MIN_ROWS:
+        with engine.begin() as conn:
+            conn.execute(insert(PaymentWebhookLog.__table__), rows)
+        return
+
+    conn = engine.raw_connection()
+    try:
+        bulk_insert_webhooks(conn, rows)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _decode(item: bytes) -> Dict[str, Any]:
+    row = orjson.loads(item)
+    for field in _TIMESTAMP_FIELDS:
+        if row.get(field):
+            row[field] = datetime.fromisoformat(row[field])
+    return row
+
+
+def log_webhook(db: Session, record: Dict[str, Any]) -> None:
+    """
+    Persist a webhook log record
+
+    Queues the record for the batch writer; without the writer, or if
+    Redis is unreachable, inserts it through the session and commits.
+
+    Args:
+        db: Session for the direct insert fallback
+        record: Record as built by new_webhook_log
+    """
+    if settings.WEBHOOK_LOG_FLUSH_SECONDS > 0:
+        try:
+            redis_client.connect_raw().rpush(WEBHOOK_LOG_QUEUE, orjson.dumps(record))
+            return
+        except Exception as e:
+            logger.warning("Webhook log queue unavailable, writing inline: %s", e)
+
+    try:
+        db.add(PaymentWebhookLog(**record))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error("Failed to write webhook log: %s", e)
+
+
+def _claim_batch(client, batch_size: int) -> List[bytes]:
+    """Move up to batch_size records from the queue to the processing list"""
+    with client.pipeline() as pipe:
+        for _ in range(batch_size):
+            pipe.lmove(WEBHOOK_LOG_QUEUE, WEBHOOK_LOG_PROCESSING, "LEFT", "RIGHT")
+        return [item for item in pipe.execute() if item is not None]
+
+
+def _write_one_by_one(client, items: List[bytes]) -> int:
+    """
+    Write records individually after their batch was rejected
+
+    Each record leaves the head of the processing list once it is written,
+    or moves to the dead-letter list if the database rejects it. Connection
+    errors propagate and leave the rest for the next round.
+
+    Returns:
+        Number of records written
+    """
+    written = 0
+    for item in items:
+        try:
+            _write_batch([_decode(item)])
+        except (OperationalError, InterfaceError):
+            raise
+        except Exception as e:
+            logger.error("Dead-lettering webhook log: %s", e)
+            client.lmove(
+                WEBHOOK_LOG_PROCESSING, WEBHOOK_LOG_DEAD_LETTER, "LEFT", "RIGHT"
+            )
+            continue
+        client.lpop(WEBHOOK_LOG_PROCESSING)
+        written += 1
+    return written
+
+
+def _write_items(client, items: List[bytes]) -> int:
+    """Write the processing list's records, then clear it"""
+    try:
+        _write_batch([_decode(item) for item in items])
+    except Exception as e:
+        logger.warning("Webhook log batch failed, writing records singly: %s", e)
+        return _write_one_by_one(client, items)
+    client.delete(WEBHOOK_LOG_PROCESSING)
+    return len(items)
+
+
+def flush_webhook_logs(batch_size: int) -> int:
+    """
+    Drain the webhook log queue in batches
+
+    Records left on the processing list by an interrupted flush are
+    written first.
+
+    Args:
+        batch_size: Maximum records written per statement
+
+    Returns:
+        Number of records written
+    """
+    client = redis_client.connect_raw()
+    token = secrets.token_bytes(16)
+    if not client.set(_FLUSH_LOCK, token, nx=True, ex=_FLUSH_LOCK_SECONDS):
+        return 0
+    try:
+        written = 0
+        leftover = client.lrange(WEBHOOK_LOG_PROCESSING, 0, -1)
+        if leftover:
+            written += _write_items(client, leftover)
+        while True:
+            items = _claim_batch(client, batch_size)
+            if not items:
+                return written
+            written += _write_items(client, items)
+            if len(items) < batch_size:
+                return written
+    finally:
+        client.eval(_RELEASE_LOCK_SCRIPT, 1, _FLUSH_LOCK, token)
+
+
+async def run_webhook_log_flush(interval_seconds: float, batch_size: int) -> None:
+    """
+    Flush queued webhook logs every interval until cancelled
+
+    Args:
+        interval_seconds: Seconds to wait between flushes
+        batch_size: Maximum records written per statement
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await asyncio.to_thread(flush_webhook_logs, batch_size)
+        except Exception as e:
+            logger.error("Webhook log flush failed: %s", e)
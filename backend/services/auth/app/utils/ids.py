@@ -0,0 +1,31 @@
+"""
+Primary key generation utilities
+"""
+
+import os
+import time
+import uuid
+
+_RAND_MASK = (1 << 74) - 1
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7)
+
+    The leading 48 bits are the Unix time in milliseconds, so keys created
+    close together land next to each other in a btree index instead of at
+    random pages.
+
+    Returns:
+        Version 7 UUID
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big") & _RAND_MASK
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # version
+    value |= (rand >> 62) << 64  # rand_a (12 bits)
+    value |= 0x2 << 62  # RFC 4122 variant
+    value |= rand & ((1 << 62) - 1)  # rand_b (62 bits)
+    return uuid.UUID(int=value)
@@ -0,0 +1,97 @@
+"""
+PostgreSQL binary COPY encoding
+
+Bulk writers build a COPY ... FROM STDIN (FORMAT BINARY) stream from
+(column name, encoder) pairs and hand it to psycopg2's copy_expert.
+"""
+
+import struct
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Sequence, Tuple
+
+import orjson
+
+_INT2 = struct.Struct(">h")
+_INT4 = struct.Struct(">i")
+_INT8 = struct.Struct(">q")
+_FLOAT8 = struct.Struct(">d")
+
+COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + _INT4.pack(0) + _INT4.pack(0)
+COPY_TRAILER = _INT2.pack(-1)
+_NULL = _INT4.pack(-1)
+
+# timestamptz is sent as microseconds since the PostgreSQL epoch
+_PG_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+Columns = Sequence[Tuple[str, Callable[[Any], bytes]]]
+
+
+def text(value: str) -> bytes:
+    return value.encode()
+
+
+def jsonb(value: Any) -> bytes:
+    # jsonb binary format: version byte followed by the JSON text
+    return b"\x01" + orjson.dumps(value)
+
+
+def boolean(value: bool) -> bytes:
+    return b"\x01" if value else b"\x00"
+
+
+def int4(value: int) -> bytes:
+    return _INT4.pack(value)
+
+
+def float8(value: float) -> bytes:
+    return _FLOAT8.pack(value)
+
+
+def uuid_bytes(value: Any) -> bytes:
+    return (value if isinstance(value, uuid.UUID) else uuid.UUID(value)).bytes
+
+
+def timestamptz(value: datetime) -> bytes:
+    # Naive values are UTC, as written by datetime.utcnow()
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _PG_EPOCH
+    return _INT8.pack(
+        (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+    )
+
+
+def copy_sql(table: str, columns: Columns) -> str:
+    """Build the COPY FROM STDIN statement for a column list"""
+    return (
+        f"COPY {table} ({', '.join(name for name, _ in columns)}) "
+        f"FROM STDIN (FORMAT BINARY)"
+    )
+
+
+def encode_copy_binary(columns: Columns, rows: Iterable[Dict[str, Any]]) -> bytes:
+    """
+    Encode records as a COPY binary stream
+
+    Args:
+        columns: (column name, encoder) pairs in COPY column order
+        rows: Records keyed by column name; missing or None values are NULL
+
+    Returns:
+        Header, one tuple per record and trailer
+    """
+    buffer = bytearray(COPY_HEADER)
+    field_count = _INT2.pack(len(columns))
+    for row in rows:
+        buffer += field_count
+        for name, encode in columns:
+            value = row.get(name)
+            if value is None:
+                buffer += _NULL
+            else:
+                data = encode(value)
+                buffer += _INT4.pack(len(data))
+                buffer += data
+    buffer += COPY_TRAILER
+    return bytes(buffer)
@@ -6,14 +6,16 @@ import re
 from typing import Optional, Tuple
 from app.core.config import settings
 
+_NON_PHONE_CHARS = re.compile(r"[^\d+]")
+
 
 class PhoneValidator:
     """Phone number validation and formatting"""
 
     # Kenyan phone number patterns
     KENYAN_PATTERNS = [
-        r"^(\+254|254|0)(7[0-9]{8})$",  # Safaricom, Airtel
-        r"^(\+254|254|0)(1[0-9]{8})$",  # Telkom
+        re.compile(r"^(\+254|254|0)(7[0-9]{8})$"),  # Safaricom, Airtel
+        re.compile(r"^(\+254|254|0)(1[0-9]{8})$"),  # Telkom
     ]
 
     @classmethod
@@ -28,7 +30,7 @@ class PhoneValidator:
             Normalized phone number in +254XXXXXXXXX format
         """
         # Remove all non-digit characters except +
-        phone = re.sub(r"[^\d+]", "", phone.strip())
+        phone = _NON_PHONE_CHARS.sub("", phone.strip())
 
         # Handle different formats
         if phone.startswith("+254"):
@@ -68,7 +70,7 @@ class PhoneValidator:
             )
 
         # Check against Kenyan patterns
-        is_valid = any(re.match(pattern, normalized) for pattern in cls.KENYAN_PATTERNS)
+        is_valid = any(pattern.match(normalized) for pattern in cls.KENYAN_PATTERNS)
 
         if not is_valid:
             return False, None, "Invalid Kenyan phone number format"
@@ -5,19 +5,30 @@ Handles user authentication, registration, and authorization
 
 from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer
 import uvicorn
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from sqlalchemy import text
+from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.core.database import engine, Base, init_db, get_db
+from app.core.database import (
+    engine,
+    Base,
+    init_db,
+    get_db,
+    dispose_async_engine,
+)
 from app.api.v1.api import api_router
 from app.core.redis_client import redis_client
 from app.core.supabase_client import supabase_client
 from app.services.admin_service import AdminService
+from app.services.fleet_analytics_service import FleetAnalyticsService
 from app.services.jwt_service import jwt_service
+from app.services.webhook_bulk import run_webhook_log_flush
 from app.middleware.auth_middleware import require_manager
 
 # Security scheme
@@ -57,13 +68,47 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"❌ Supabase connection failed: {e}")
 
+    # Keep analytics and GPS partitions current
+    partition_maintenance = None
+    if settings.PARTITION_MAINTENANCE_SECONDS > 0:
+        partition_maintenance = asyncio.create_task(
+            FleetAnalyticsService.run_partition_maintenance(
+                settings.PARTITION_MAINTENANCE_SECONDS
+            )
+        )
+
+    # Keep the daily summary view current
+    summary_refresh = None
+    if settings.ANALYTICS_SUMMARY_REFRESH_SECONDS > 0:
+        summary_refresh = asyncio.create_task(
+            FleetAnalyticsService.run_summary_refresh(
+                settings.ANALYTICS_SUMMARY_REFRESH_SECONDS
+            )
+        )
+
+    # Batch-write queued M-Pesa webhook logs
+    webhook_log_flush = None
+    if settings.WEBHOOK_LOG_FLUSH_SECONDS > 0:
+        webhook_log_flush = asyncio.create_task(
+            run_webhook_log_flush(
+                settings.WEBHOOK_LOG_FLUSH_SECONDS, settings.WEBHOOK_LOG_BATCH_SIZE
+            )
+        )
+
     print("✅ Auth Service startup complete")
 
     yield
 
     # Shutdown
     print("🛑 Auth Service shutting down...")
+    if partition_maintenance is not None:
+        partition_maintenance.cancel()
+    if summary_refresh is not None:
+        summary_refresh.cancel()
+    if webhook_log_flush is not None:
+        webhook_log_flush.cancel()
     redis_client.close()
+    await dispose_async_engine()
     print("✅ Auth Service shutdown complete")
 
 
@@ -75,6 +120,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -167,12 +213,15 @@ def create_manager_token():
 
 
 @app.get("/debug/test-auth")
-def test_auth(current_user=Depends(require_manager)):
+def test_auth(current_user=Depends(require_manager), db: Session = Depends(get_db)):
     """Test auth middleware"""
+    from app.models.user_profile import UserProfile
+
+    user = db.get(UserProfile, current_user.id)
     return {
         "message": "Auth working!",
         "user_id": str(current_user.id),
-        "phone": current_user.phone,
+        "phone": user.phone if user else None,
         "role": current_user.role.value,
         "fleet_id": str(current_user.fleet_id) if current_user.fleet_id else None,
     }
@@ -282,5 +331,7 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=8000,
+        loop="uvloop",
+        http="httptools",
         reload=True if os.getenv("ENVIRONMENT") == "development" else False,
     )
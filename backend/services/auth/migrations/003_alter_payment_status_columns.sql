@@ -0,0 +1,30 @@
+-- Migration: Store payment and refund statuses as constrained VARCHAR
+-- Description: Replace the payment_status, refund_status and refund_reason enum
+-- columns on the M-Pesa tables with VARCHAR plus CHECK constraints, so new
+-- values no longer need ALTER TYPE and the driver binds plain strings
+
+ALTER TABLE payment_transactions
+    ALTER COLUMN status DROP DEFAULT,
+    ALTER COLUMN status TYPE VARCHAR(20) USING status::text,
+    ALTER COLUMN status SET DEFAULT 'pending',
+    ADD CONSTRAINT ck_payment_status CHECK (status IN (
+        'pending', 'processing', 'completed', 'failed', 'cancelled', 'expired', 'refunded'
+    ));
+
+ALTER TABLE refund_transactions
+    ALTER COLUMN status DROP DEFAULT,
+    ALTER COLUMN status TYPE VARCHAR(20) USING status::text,
+    ALTER COLUMN status SET DEFAULT 'pending',
+    ALTER COLUMN refund_reason TYPE VARCHAR(30) USING refund_reason::text,
+    ADD CONSTRAINT ck_refund_status CHECK (status IN (
+        'pending', 'approved', 'processing', 'completed', 'failed', 'cancelled'
+    )),
+    ADD CONSTRAINT ck_refund_reason CHECK (refund_reason IN (
+        'trip_cancelled_by_operator', 'vehicle_breakdown', 'weather_conditions',
+        'passenger_request', 'duplicate_booking', 'system_error', 'other'
+    ));
+
+-- refund_status and refund_reason are only used by the columns above;
+-- payment_status is kept because the bookings schema's payments table uses it
+DROP TYPE IF EXISTS refund_status;
+DROP TYPE IF EXISTS refund_reason;
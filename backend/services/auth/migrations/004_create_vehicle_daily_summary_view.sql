@@ -0,0 +1,31 @@
+-- Migration: Create vehicle daily summary materialized view
+-- Description: Aggregate trips and booking revenue per vehicle per day inside
+-- the database. The auth service refreshes it CONCURRENTLY on a timer
+-- (ANALYTICS_SUMMARY_REFRESH_SECONDS), so dashboards read pre-computed rows
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_vehicle_daily_summary AS
+SELECT
+    t.vehicle_id,
+    v.fleet_id,
+    t.scheduled_departure::date AS summary_date,
+    COUNT(*) FILTER (WHERE t.status = 'completed') AS trips_completed,
+    COUNT(*) FILTER (WHERE t.status = 'cancelled') AS cancelled_trips,
+    COALESCE(SUM(t.total_seats - t.available_seats), 0)::integer AS total_passengers,
+    COALESCE(SUM(b.revenue_cents), 0)::bigint AS total_revenue -- In cents
+FROM trips t
+JOIN vehicles v ON v.id = t.vehicle_id
+LEFT JOIN (
+    SELECT trip_id, SUM(amount_paid * 100)::bigint AS revenue_cents
+    FROM bookings
+    WHERE booking_status <> 'cancelled'
+    GROUP BY trip_id
+) b ON b.trip_id = t.id
+GROUP BY t.vehicle_id, v.fleet_id, t.scheduled_departure::date;
+
+-- Required by REFRESH ... CONCURRENTLY; also serves per-vehicle lookups
+CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_vehicle_daily_summary
+    ON mv_vehicle_daily_summary (vehicle_id, summary_date);
+
+-- Dashboard reads: one fleet, one day, ranked by revenue
+CREATE INDEX IF NOT EXISTS ix_mv_vehicle_daily_summary_fleet_date
+    ON mv_vehicle_daily_summary (fleet_id, summary_date, total_revenue DESC);
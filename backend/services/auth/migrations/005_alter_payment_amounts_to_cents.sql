@@ -0,0 +1,12 @@
+-- Migration: Store M-Pesa payment and refund amounts as BIGINT cents
+-- Description: Replace DECIMAL(10,2) amounts with integer cents so payment
+-- aggregations sum int8 instead of numeric. The models expose the KES amount
+-- through hybrid properties, so callers keep using amount / refund_amount
+
+ALTER TABLE payment_transactions RENAME COLUMN amount TO amount_cents;
+ALTER TABLE payment_transactions
+    ALTER COLUMN amount_cents TYPE BIGINT USING round(amount_cents * 100)::bigint;
+
+ALTER TABLE refund_transactions RENAME COLUMN refund_amount TO refund_amount_cents;
+ALTER TABLE refund_transactions
+    ALTER COLUMN refund_amount_cents TYPE BIGINT USING round(refund_amount_cents * 100)::bigint;
@@ -0,0 +1,11 @@
+-- Migration: Generate high-insert primary keys in PostgreSQL
+-- Description: The models for these tables no longer send an id; the row ID
+-- comes from gen_random_uuid() and is read back with INSERT ... RETURNING.
+-- gen_random_uuid() is built in from PostgreSQL 13; pgcrypto provides it on
+-- older servers
+
+CREATE EXTENSION IF NOT EXISTS pgcrypto;
+
+ALTER TABLE payment_webhook_logs ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE refund_transactions ALTER COLUMN id SET DEFAULT gen_random_uuid();
+ALTER TABLE performance_metrics ALTER COLUMN id SET DEFAULT gen_random_uuid();
@@ -0,0 +1,16 @@
+-- Migration: Store M-Pesa payloads as JSONB
+-- Description: Webhook payloads and STK gateway responses were JSON text.
+-- JSONB keeps them parsed and lets callbacks be filtered by result code or
+-- containment without scanning and re-parsing every row
+
+ALTER TABLE payment_webhook_logs
+    ALTER COLUMN raw_payload TYPE JSONB USING raw_payload::jsonb;
+
+ALTER TABLE payment_transactions
+    ALTER COLUMN gateway_response TYPE JSONB USING gateway_response::jsonb;
+
+CREATE INDEX IF NOT EXISTS ix_webhook_payload_result
+    ON payment_webhook_logs ((raw_payload #>> '{Body,stkCallback,ResultCode}'));
+
+CREATE INDEX IF NOT EXISTS ix_payment_gateway_gin
+    ON payment_transactions USING gin (gateway_response jsonb_path_ops);
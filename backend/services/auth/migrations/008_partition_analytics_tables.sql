@@ -0,0 +1,84 @@
+-- Migration: Range partition analytics tables by month
+-- Description: Rebuild performance_metrics (on date_recorded) and
+-- vehicle_performance_summary (on summary_date) as monthly RANGE partitioned
+-- tables so date-filtered reads prune to the matching months and old months
+-- can be detached instead of deleted. The primary keys become (id, date) as
+-- PostgreSQL requires the partition key in every unique constraint. The auth
+-- service creates upcoming months on its analytics maintenance loop; rows
+-- outside any month fall into the DEFAULT partition
+
+BEGIN;
+
+-- performance_metrics
+ALTER TABLE performance_metrics RENAME TO performance_metrics_unpartitioned;
+
+CREATE TABLE performance_metrics (
+    LIKE performance_metrics_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+    PRIMARY KEY (id, date_recorded),
+    FOREIGN KEY (vehicle_id) REFERENCES vehicles(id) ON DELETE CASCADE,
+    FOREIGN KEY (fleet_id) REFERENCES fleets(id) ON DELETE CASCADE,
+    FOREIGN KEY (driver_id) REFERENCES drivers(id) ON DELETE SET NULL,
+    FOREIGN KEY (recorded_by) REFERENCES user_profiles(id)
+) PARTITION BY RANGE (date_recorded);
+
+-- vehicle_performance_summary
+ALTER TABLE vehicle_performance_summary RENAME TO vehicle_performance_summary_unpartitioned;
+
+CREATE TABLE vehicle_performance_summary (
+    LIKE vehicle_performance_summary_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+    PRIMARY KEY (id, summary_date),
+    FOREIGN KEY (vehicle_id) REFERENCES vehicles(id) ON DELETE CASCADE,
+    FOREIGN KEY (fleet_id) REFERENCES fleets(id) ON DELETE CASCADE,
+    FOREIGN KEY (primary_driver_id) REFERENCES drivers(id) ON DELETE SET NULL
+) PARTITION BY RANGE (summary_date);
+
+-- One partition per month from the oldest row through two months ahead
+DO $$
+DECLARE
+    target RECORD;
+    oldest DATE;
+    month DATE;
+BEGIN
+    FOR target IN
+        SELECT * FROM (VALUES
+            ('performance_metrics', 'date_recorded'),
+            ('vehicle_performance_summary', 'summary_date')
+        ) AS t(tbl, col)
+    LOOP
+        EXECUTE format('SELECT min(%I) FROM %I', target.col, target.tbl || '_unpartitioned')
+            INTO oldest;
+        month := date_trunc('month', LEAST(COALESCE(oldest, CURRENT_DATE), CURRENT_DATE))::date;
+        WHILE month <= date_trunc('month', CURRENT_DATE + INTERVAL '2 months')::date LOOP
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                target.tbl || '_' || to_char(month, 'YYYY_MM'),
+                target.tbl,
+                month,
+                (month + INTERVAL '1 month')::date
+            );
+            month := (month + INTERVAL '1 month')::date;
+        END LOOP;
+        EXECUTE format('CREATE TABLE %I PARTITION OF %I DEFAULT', target.tbl || '_default', target.tbl);
+    END LOOP;
+END $$;
+
+INSERT INTO performance_metrics SELECT * FROM performance_metrics_unpartitioned;
+INSERT INTO vehicle_performance_summary SELECT * FROM vehicle_performance_summary_unpartitioned;
+
+DROP TABLE performance_metrics_unpartitioned;
+DROP TABLE vehicle_performance_summary_unpartitioned;
+
+-- Indexes on the parent cascade to every partition, present and future
+CREATE INDEX idx_performance_metrics_vehicle_id ON performance_metrics(vehicle_id);
+CREATE INDEX ix_perf_fleet_date_type ON performance_metrics(fleet_id, date_recorded, metric_type) INCLUDE (metric_value);
+CREATE INDEX idx_performance_metrics_route ON performance_metrics(route_id);
+
+CREATE INDEX ix_vps_vehicle_date ON vehicle_performance_summary(vehicle_id, summary_date) INCLUDE (total_revenue, total_distance_km, active_hours);
+CREATE INDEX idx_vehicle_performance_summary_fleet_id ON vehicle_performance_summary(fleet_id);
+CREATE INDEX idx_vehicle_performance_summary_date ON vehicle_performance_summary(summary_date);
+CREATE INDEX idx_vehicle_performance_summary_period ON vehicle_performance_summary(period_type);
+
+CREATE TRIGGER update_performance_metrics_updated_at BEFORE UPDATE ON performance_metrics FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+CREATE TRIGGER update_vehicle_performance_summary_updated_at BEFORE UPDATE ON vehicle_performance_summary FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+COMMIT;
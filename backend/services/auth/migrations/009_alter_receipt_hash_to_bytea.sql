@@ -0,0 +1,10 @@
+-- Migration: Store receipt verification hashes as raw bytes
+-- Description: payment_receipts.verification_hash held SHA-256 digests as
+-- 64-char hex in VARCHAR(256). Keep the 32-byte digest in BYTEA instead and
+-- index it for lookup-by-hash verification
+
+ALTER TABLE payment_receipts
+    ALTER COLUMN verification_hash TYPE BYTEA USING decode(verification_hash, 'hex'),
+    ADD CONSTRAINT ck_receipt_hash_length CHECK (octet_length(verification_hash) = 32);
+
+CREATE INDEX IF NOT EXISTS ix_receipt_hash ON payment_receipts(verification_hash);
@@ -0,0 +1,31 @@
+-- Migration: Server-side timestamps for vehicles, drivers and analytics tables
+-- Description: The ORM no longer computes created_at/updated_at in Python.
+-- Inserts take NOW() from the column default and the existing
+-- update_updated_at_column triggers stamp updates. Existing naive values
+-- were written with datetime.utcnow(), so they are read as UTC
+
+DO $$
+DECLARE
+    tbl TEXT;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY[
+        'vehicles', 'drivers', 'performance_metrics', 'route_performance',
+        'vehicle_performance_summary', 'fleet_kpis'
+    ] LOOP
+        EXECUTE format(
+            'ALTER TABLE %I
+                ALTER COLUMN created_at TYPE TIMESTAMP WITH TIME ZONE USING created_at AT TIME ZONE ''UTC'',
+                ALTER COLUMN created_at SET DEFAULT NOW(),
+                ALTER COLUMN updated_at TYPE TIMESTAMP WITH TIME ZONE USING updated_at AT TIME ZONE ''UTC'',
+                ALTER COLUMN updated_at SET DEFAULT NOW()',
+            tbl
+        );
+        -- Trigger names follow init.sql: update_<table>_updated_at
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', 'update_' || tbl || '_updated_at', tbl);
+        EXECUTE format(
+            'CREATE TRIGGER %I BEFORE UPDATE ON %I FOR EACH ROW EXECUTE FUNCTION update_updated_at_column()',
+            'update_' || tbl || '_updated_at',
+            tbl
+        );
+    END LOOP;
+END $$;
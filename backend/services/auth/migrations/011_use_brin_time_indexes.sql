@@ -0,0 +1,17 @@
+-- Migration: BRIN indexes for time-ordered analytics and webhook columns
+-- Description: Analytics rows and M-Pesa webhook logs are appended in time
+-- order, so a BRIN summary per 32-page range prunes date scans as well as a
+-- btree while staying a few pages in size. Replaces the plain btree indexes
+-- on those date columns
+
+DROP INDEX IF EXISTS idx_route_performance_date;
+DROP INDEX IF EXISTS idx_vehicle_performance_summary_date;
+
+CREATE INDEX IF NOT EXISTS ix_perf_date_brin
+    ON performance_metrics USING brin (date_recorded) WITH (pages_per_range = 32);
+CREATE INDEX IF NOT EXISTS ix_route_perf_date_brin
+    ON route_performance USING brin (date_recorded) WITH (pages_per_range = 32);
+CREATE INDEX IF NOT EXISTS ix_vps_date_brin
+    ON vehicle_performance_summary USING brin (summary_date) WITH (pages_per_range = 32);
+CREATE INDEX IF NOT EXISTS ix_webhook_received_brin
+    ON payment_webhook_logs USING brin (received_at) WITH (pages_per_range = 32);
@@ -0,0 +1,21 @@
+-- Migration: Generate fleet KPI achievement and trend in the database
+-- Description: achievement_percentage and trend were computed by the
+-- application on insert. Recreate them as STORED generated columns so
+-- PostgreSQL derives them from current/target/previous values on every
+-- write, and index achievement for ranking queries
+
+ALTER TABLE fleet_kpis
+    DROP COLUMN achievement_percentage,
+    DROP COLUMN trend;
+
+ALTER TABLE fleet_kpis
+    ADD COLUMN achievement_percentage DOUBLE PRECISION GENERATED ALWAYS AS (
+        CASE WHEN target_value > 0 THEN current_value / target_value * 100 END
+    ) STORED,
+    ADD COLUMN trend VARCHAR(20) GENERATED ALWAYS AS (
+        CASE WHEN current_value > previous_value THEN 'improving'
+             WHEN current_value < previous_value THEN 'declining'
+             WHEN current_value = previous_value THEN 'stable' END
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS ix_fleet_kpi_achievement ON fleet_kpis(achievement_percentage);
@@ -0,0 +1,162 @@
+-- Migration: Reorder payment_transactions and vehicle_performance_summary columns
+-- Description: PostgreSQL stores columns in declaration order and pads each
+-- one to its type's alignment. Rebuild both tables with fixed-width columns
+-- first (widest alignment first) and variable-length columns last so rows
+-- carry no padding. ALTER TABLE cannot reorder columns, so each table is
+-- copied aside, recreated and reloaded
+
+BEGIN;
+
+-- payment_transactions
+CREATE TEMP TABLE payment_transactions_copy ON COMMIT DROP AS
+    SELECT * FROM payment_transactions;
+
+-- CASCADE drops the foreign keys from receipts, refunds and bookings
+DROP TABLE payment_transactions CASCADE;
+
+CREATE TABLE payment_transactions (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    booking_id UUID NOT NULL REFERENCES bookings(id) ON DELETE CASCADE,
+    amount_cents BIGINT NOT NULL,
+
+    transaction_date TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    expires_at TIMESTAMP WITH TIME ZONE,
+
+    status VARCHAR(20) DEFAULT 'pending' NOT NULL,
+    phone_number VARCHAR(15) NOT NULL,
+    mpesa_receipt_number VARCHAR(100) UNIQUE,
+    payment_reference VARCHAR(50) UNIQUE NOT NULL,
+    checkout_request_id VARCHAR(100) UNIQUE,
+    merchant_request_id VARCHAR(100),
+    account_reference VARCHAR(50),
+    transaction_desc TEXT,
+    gateway_response JSONB,
+    failure_reason TEXT,
+
+    CONSTRAINT check_positive_amount CHECK (amount_cents > 0),
+    CONSTRAINT ck_payment_status CHECK (status IN (
+        'pending', 'processing', 'completed', 'failed', 'cancelled', 'expired', 'refunded'
+    ))
+);
+
+INSERT INTO payment_transactions (
+    id, booking_id, amount_cents, transaction_date, created_at, updated_at,
+    expires_at, status, phone_number, mpesa_receipt_number, payment_reference,
+    checkout_request_id, merchant_request_id, account_reference,
+    transaction_desc, gateway_response, failure_reason
+)
+SELECT
+    id, booking_id, amount_cents, transaction_date, created_at, updated_at,
+    expires_at, status, phone_number, mpesa_receipt_number, payment_reference,
+    checkout_request_id, merchant_request_id, account_reference,
+    transaction_desc, gateway_response, failure_reason
+FROM payment_transactions_copy;
+
+CREATE INDEX idx_payment_transactions_booking_id ON payment_transactions(booking_id);
+CREATE INDEX idx_payment_transactions_status_created ON payment_transactions(status, created_at);
+CREATE INDEX idx_payment_transactions_phone_created ON payment_transactions(phone_number, created_at);
+CREATE INDEX ix_payment_gateway_gin ON payment_transactions USING gin (gateway_response jsonb_path_ops);
+
+CREATE TRIGGER update_payment_transactions_updated_at
+    BEFORE UPDATE ON payment_transactions
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+ALTER TABLE payment_receipts
+    ADD FOREIGN KEY (payment_id) REFERENCES payment_transactions(id) ON DELETE CASCADE;
+ALTER TABLE refund_transactions
+    ADD FOREIGN KEY (original_payment_id) REFERENCES payment_transactions(id) ON DELETE CASCADE;
+ALTER TABLE bookings
+    ADD FOREIGN KEY (payment_transaction_id) REFERENCES payment_transactions(id);
+
+GRANT SELECT, INSERT, UPDATE, DELETE ON payment_transactions TO postgres;
+
+-- vehicle_performance_summary
+CREATE TEMP TABLE vehicle_performance_summary_copy ON COMMIT DROP AS
+    SELECT * FROM vehicle_performance_summary;
+
+DROP TABLE vehicle_performance_summary;
+
+CREATE TABLE vehicle_performance_summary (
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
+    vehicle_id UUID NOT NULL REFERENCES vehicles(id) ON DELETE CASCADE,
+    fleet_id UUID NOT NULL REFERENCES fleets(id) ON DELETE CASCADE,
+    primary_driver_id UUID REFERENCES drivers(id) ON DELETE SET NULL,
+
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+
+    summary_date DATE NOT NULL,
+
+    trips_completed INTEGER DEFAULT 0 NOT NULL,
+    total_revenue INTEGER DEFAULT 0 NOT NULL,
+    total_passengers INTEGER DEFAULT 0 NOT NULL,
+    fuel_cost INTEGER,
+    maintenance_cost INTEGER DEFAULT 0 NOT NULL,
+    on_time_trips INTEGER DEFAULT 0 NOT NULL,
+    delayed_trips INTEGER DEFAULT 0 NOT NULL,
+    cancelled_trips INTEGER DEFAULT 0 NOT NULL,
+    gross_revenue INTEGER DEFAULT 0 NOT NULL,
+    operating_cost INTEGER DEFAULT 0 NOT NULL,
+    net_profit INTEGER DEFAULT 0 NOT NULL,
+
+    period_type VARCHAR(20) NOT NULL,
+
+    total_distance_km DECIMAL(10,2) DEFAULT 0.0 NOT NULL,
+    active_hours DECIMAL(8,2) DEFAULT 0.0 NOT NULL,
+    fuel_consumed_liters DECIMAL(10,2),
+    utilization_rate DECIMAL(5,2),
+    average_speed_kmh DECIMAL(8,2),
+    profit_margin DECIMAL(5,2),
+
+    PRIMARY KEY (id, summary_date)
+) PARTITION BY RANGE (summary_date);
+
+-- Same monthly partitions as 008_partition_analytics_tables.sql
+DO $$
+DECLARE
+    month DATE;
+BEGIN
+    SELECT date_trunc('month', LEAST(COALESCE(min(summary_date), CURRENT_DATE), CURRENT_DATE))::date
+        INTO month
+        FROM vehicle_performance_summary_copy;
+    WHILE month <= date_trunc('month', CURRENT_DATE + INTERVAL '2 months')::date LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF vehicle_performance_summary FOR VALUES FROM (%L) TO (%L)',
+            'vehicle_performance_summary_' || to_char(month, 'YYYY_MM'),
+            month,
+            (month + INTERVAL '1 month')::date
+        );
+        month := (month + INTERVAL '1 month')::date;
+    END LOOP;
+END $$;
+CREATE TABLE vehicle_performance_summary_default PARTITION OF vehicle_performance_summary DEFAULT;
+
+INSERT INTO vehicle_performance_summary (
+    id, vehicle_id, fleet_id, primary_driver_id, created_at, updated_at,
+    summary_date, trips_completed, total_revenue, total_passengers, fuel_cost,
+    maintenance_cost, on_time_trips, delayed_trips, cancelled_trips,
+    gross_revenue, operating_cost, net_profit, period_type, total_distance_km,
+    active_hours, fuel_consumed_liters, utilization_rate, average_speed_kmh,
+    profit_margin
+)
+SELECT
+    id, vehicle_id, fleet_id, primary_driver_id, created_at, updated_at,
+    summary_date, trips_completed, total_revenue, total_passengers, fuel_cost,
+    maintenance_cost, on_time_trips, delayed_trips, cancelled_trips,
+    gross_revenue, operating_cost, net_profit, period_type, total_distance_km,
+    active_hours, fuel_consumed_liters, utilization_rate, average_speed_kmh,
+    profit_margin
+FROM vehicle_performance_summary_copy;
+
+CREATE INDEX ix_vps_vehicle_date ON vehicle_performance_summary(vehicle_id, summary_date) INCLUDE (total_revenue, total_distance_km, active_hours);
+CREATE INDEX idx_vehicle_performance_summary_fleet_id ON vehicle_performance_summary(fleet_id);
+CREATE INDEX idx_vehicle_performance_summary_period ON vehicle_performance_summary(period_type);
+CREATE INDEX ix_vps_date_brin ON vehicle_performance_summary USING brin (summary_date) WITH (pages_per_range = 32);
+
+CREATE TRIGGER update_vehicle_performance_summary_updated_at
+    BEFORE UPDATE ON vehicle_performance_summary
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+COMMIT;
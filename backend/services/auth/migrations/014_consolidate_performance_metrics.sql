@@ -0,0 +1,90 @@
+-- Migration: Consolidate performance_metrics into performance_metrics_v2
+-- Description: performance_metrics holds one row per metric reading, so a
+-- vehicle recording ten metric types a day takes ten rows and dashboard
+-- totals group them back by metric_type. performance_metrics_v2 holds one
+-- row per (fleet_id, vehicle_id, date_recorded) with the values in a JSONB
+-- measures column and each reading's unit, period, route, driver and notes
+-- in details. The auth service now upserts into v2, merging new readings
+-- into the day's row; performance_metrics is kept read-only for existing
+-- readers
+
+BEGIN;
+
+CREATE TABLE performance_metrics_v2 (
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
+    fleet_id UUID NOT NULL REFERENCES fleets(id) ON DELETE CASCADE,
+    vehicle_id UUID REFERENCES vehicles(id) ON DELETE CASCADE,
+    date_recorded DATE NOT NULL,
+    measures JSONB DEFAULT '{}' NOT NULL,
+    details JSONB DEFAULT '{}' NOT NULL,
+    recorded_by UUID NOT NULL REFERENCES user_profiles(id),
+
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+
+    PRIMARY KEY (id, date_recorded),
+    -- Fleet-wide rows (NULL vehicle_id) are unique per fleet and day too
+    CONSTRAINT uq_perf_v2_fleet_vehicle_date UNIQUE NULLS NOT DISTINCT (fleet_id, vehicle_id, date_recorded)
+) PARTITION BY RANGE (date_recorded);
+
+-- Same monthly partitions as 008_partition_analytics_tables.sql
+DO $$
+DECLARE
+    month DATE;
+BEGIN
+    SELECT date_trunc('month', LEAST(COALESCE(min(date_recorded), CURRENT_DATE), CURRENT_DATE))::date
+        INTO month
+        FROM performance_metrics;
+    WHILE month <= date_trunc('month', CURRENT_DATE + INTERVAL '2 months')::date LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF performance_metrics_v2 FOR VALUES FROM (%L) TO (%L)',
+            'performance_metrics_v2_' || to_char(month, 'YYYY_MM'),
+            month,
+            (month + INTERVAL '1 month')::date
+        );
+        month := (month + INTERVAL '1 month')::date;
+    END LOOP;
+END $$;
+CREATE TABLE performance_metrics_v2_default PARTITION OF performance_metrics_v2 DEFAULT;
+
+-- A metric recorded more than once on a day keeps its latest reading, as
+-- the upsert does
+INSERT INTO performance_metrics_v2 (
+    fleet_id, vehicle_id, date_recorded, measures, details, recorded_by,
+    created_at, updated_at
+)
+SELECT
+    fleet_id,
+    vehicle_id,
+    date_recorded,
+    jsonb_object_agg(metric_type, metric_value ORDER BY created_at),
+    jsonb_object_agg(
+        metric_type,
+        jsonb_strip_nulls(jsonb_build_object(
+            'metric_unit', metric_unit,
+            'period_start', period_start,
+            'period_end', period_end,
+            'route_id', route_id,
+            'driver_id', driver_id,
+            'notes', notes
+        ))
+        ORDER BY created_at
+    ),
+    (array_agg(recorded_by ORDER BY created_at DESC))[1],
+    min(created_at),
+    max(updated_at)
+FROM performance_metrics
+GROUP BY fleet_id, vehicle_id, date_recorded;
+
+CREATE INDEX ix_perf_v2_fleet_date ON performance_metrics_v2(fleet_id, date_recorded);
+CREATE INDEX ix_perf_v2_vehicle ON performance_metrics_v2(vehicle_id);
+-- Dashboard weekly averages read one measure; each index holds only the
+-- rows that carry it
+CREATE INDEX ix_perf_v2_fuel ON performance_metrics_v2(fleet_id, date_recorded, ((measures->>'fuel_efficiency')::float)) WHERE measures ? 'fuel_efficiency';
+CREATE INDEX ix_perf_v2_on_time ON performance_metrics_v2(fleet_id, date_recorded, ((measures->>'on_time_performance')::float)) WHERE measures ? 'on_time_performance';
+
+CREATE TRIGGER update_performance_metrics_v2_updated_at
+    BEFORE UPDATE ON performance_metrics_v2
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+COMMIT;
@@ -0,0 +1,61 @@
+-- Migration: Unique natural keys on analytics tables
+-- Description: route_performance, vehicle_performance_summary and fleet_kpis
+-- hold one record per route, vehicle or KPI and day but never enforced it.
+-- Add the unique constraints so recording uses INSERT ... ON CONFLICT DO
+-- UPDATE in one statement. Existing duplicates are removed first, keeping the
+-- most recently updated row of each group
+
+BEGIN;
+
+-- route_performance: one record per fleet, route code and day
+DELETE FROM route_performance
+WHERE id IN (
+    SELECT id FROM (
+        SELECT id, row_number() OVER (
+            PARTITION BY fleet_id, route_code, date_recorded
+            ORDER BY updated_at DESC, created_at DESC
+        ) AS rank
+        FROM route_performance
+        WHERE route_code IS NOT NULL
+    ) ranked
+    WHERE rank > 1
+);
+
+ALTER TABLE route_performance
+    ADD CONSTRAINT uq_route_perf_fleet_code_date UNIQUE (fleet_id, route_code, date_recorded);
+
+-- vehicle_performance_summary: one summary per vehicle, day and period type.
+-- summary_date is part of the key, so the constraint is valid on the
+-- partitioned table and cascades to every partition
+DELETE FROM vehicle_performance_summary
+WHERE (id, summary_date) IN (
+    SELECT id, summary_date FROM (
+        SELECT id, summary_date, row_number() OVER (
+            PARTITION BY vehicle_id, summary_date, period_type
+            ORDER BY updated_at DESC, created_at DESC
+        ) AS rank
+        FROM vehicle_performance_summary
+    ) ranked
+    WHERE rank > 1
+);
+
+ALTER TABLE vehicle_performance_summary
+    ADD CONSTRAINT uq_vps_vehicle_date_period UNIQUE (vehicle_id, summary_date, period_type);
+
+-- fleet_kpis: one measurement per KPI, day and period type
+DELETE FROM fleet_kpis
+WHERE id IN (
+    SELECT id FROM (
+        SELECT id, row_number() OVER (
+            PARTITION BY fleet_id, kpi_name, measurement_date, period_type
+            ORDER BY updated_at DESC, created_at DESC
+        ) AS rank
+        FROM fleet_kpis
+    ) ranked
+    WHERE rank > 1
+);
+
+ALTER TABLE fleet_kpis
+    ADD CONSTRAINT uq_fleet_kpi_name_date_period UNIQUE (fleet_id, kpi_name, measurement_date, period_type);
+
+COMMIT;
@@ -0,0 +1,43 @@
+-- Migration: Store payment and refund statuses as SMALLINT codes
+-- Description: status was VARCHAR(20), so every row and every entry of the
+-- (status, created_at) indexes carried the status text. Store the 2-byte code
+-- instead; the auth service maps codes to the same status strings
+-- (PaymentStatusCode / RefundStatusCode in app/models/payment.py), so the API
+-- is unchanged. Changing the column type rebuilds the indexes on it
+
+BEGIN;
+
+-- payment_transactions
+ALTER TABLE payment_transactions DROP CONSTRAINT ck_payment_status;
+ALTER TABLE payment_transactions ALTER COLUMN status DROP DEFAULT;
+ALTER TABLE payment_transactions
+    ALTER COLUMN status TYPE SMALLINT USING CASE status
+        WHEN 'pending' THEN 0
+        WHEN 'processing' THEN 1
+        WHEN 'completed' THEN 2
+        WHEN 'failed' THEN 3
+        WHEN 'cancelled' THEN 4
+        WHEN 'expired' THEN 5
+        WHEN 'refunded' THEN 6
+    END;
+ALTER TABLE payment_transactions ALTER COLUMN status SET DEFAULT 0;
+ALTER TABLE payment_transactions
+    ADD CONSTRAINT ck_payment_status CHECK (status BETWEEN 0 AND 6);
+
+-- refund_transactions
+ALTER TABLE refund_transactions DROP CONSTRAINT ck_refund_status;
+ALTER TABLE refund_transactions ALTER COLUMN status DROP DEFAULT;
+ALTER TABLE refund_transactions
+    ALTER COLUMN status TYPE SMALLINT USING CASE status
+        WHEN 'pending' THEN 0
+        WHEN 'approved' THEN 1
+        WHEN 'processing' THEN 2
+        WHEN 'completed' THEN 3
+        WHEN 'failed' THEN 4
+        WHEN 'cancelled' THEN 5
+    END;
+ALTER TABLE refund_transactions ALTER COLUMN status SET DEFAULT 0;
+ALTER TABLE refund_transactions
+    ADD CONSTRAINT ck_refund_status CHECK (status BETWEEN 0 AND 5);
+
+COMMIT;
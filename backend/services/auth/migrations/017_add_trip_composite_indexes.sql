@@ -0,0 +1,17 @@
+-- Migration: Composite indexes for trip listings and status history
+-- Description: Fleet trip listings and dashboards filter trips by fleet,
+-- status and departure range, which the single-column status index cannot
+-- serve; replace it with (fleet_id, status, scheduled_departure). The
+-- existing (vehicle_id, scheduled_departure) index is renamed to match the
+-- model. Trip status history is read per trip in created_at order, so
+-- (trip_id, created_at) replaces the single-column trip_id index
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_trips_fleet_status_dep
+    ON trips(fleet_id, status, scheduled_departure);
+DROP INDEX CONCURRENTLY IF EXISTS idx_trips_status;
+
+ALTER INDEX IF EXISTS idx_trips_vehicle_date RENAME TO ix_trips_vehicle_dep;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tsu_trip_created
+    ON trip_status_updates(trip_id, created_at);
+DROP INDEX CONCURRENTLY IF EXISTS idx_trip_status_updates_trip_id;
@@ -0,0 +1,13 @@
+-- Migration: Index the remaining unindexed foreign keys
+-- Description: PostgreSQL does not index foreign key columns. Deleting or
+-- re-keying a referenced user_profiles row has to find its referencing
+-- trip_templates and trip_status_updates rows, which without an index is a
+-- sequential scan of each table. vehicles.fleet_id, trip_templates.route_id
+-- and trip_templates.fleet_id are already indexed; IF NOT EXISTS keeps the
+-- statements safe on databases created before those indexes
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_vehicles_fleet_id ON vehicles(fleet_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_trip_templates_route_id ON trip_templates(route_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_trip_templates_fleet_id ON trip_templates(fleet_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_trip_templates_created_by ON trip_templates(created_by);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tsu_updated_by ON trip_status_updates(updated_by);
@@ -0,0 +1,21 @@
+-- Migration: Store trip status update values as constrained VARCHAR
+-- Description: Replace the trip_status_enum and update_source_enum columns on
+-- trip_status_updates with VARCHAR plus CHECK constraints, matching
+-- trips.status in the model, so rows load as plain strings and new values
+-- no longer need ALTER TYPE
+
+ALTER TABLE trip_status_updates
+    ALTER COLUMN status TYPE VARCHAR(20) USING status::text,
+    ALTER COLUMN update_source DROP DEFAULT,
+    ALTER COLUMN update_source TYPE VARCHAR(20) USING update_source::text,
+    ALTER COLUMN update_source SET DEFAULT 'system',
+    ADD CONSTRAINT valid_tsu_status CHECK (status IN (
+        'scheduled', 'departed', 'in_transit', 'arrived', 'completed', 'cancelled', 'delayed'
+    )),
+    ADD CONSTRAINT valid_tsu_update_source CHECK (update_source IN (
+        'system', 'driver', 'gps', 'manual', 'passenger'
+    ));
+
+-- Only used by the columns above
+DROP TYPE IF EXISTS trip_status_enum;
+DROP TYPE IF EXISTS update_source_enum;
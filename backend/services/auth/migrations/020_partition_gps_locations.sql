@@ -0,0 +1,54 @@
+-- Migration: Range partition gps_locations by month
+-- Description: gps_locations takes a row per vehicle ping and is read one
+-- vehicle over a time window. Rebuild it as a monthly RANGE partitioned
+-- table on recorded_at so those reads prune to the months they cover, each
+-- month carries its own small (vehicle_id, recorded_at DESC) index, and
+-- expired months are dropped whole instead of deleted row by row. The
+-- primary key becomes (id, recorded_at) as PostgreSQL requires the
+-- partition key in every unique constraint. The auth service creates
+-- upcoming months and, when GPS_RETENTION_MONTHS is set, drops older ones on its
+-- maintenance loop; rows outside any month fall into the DEFAULT partition
+
+BEGIN;
+
+ALTER TABLE gps_locations RENAME TO gps_locations_unpartitioned;
+
+CREATE TABLE gps_locations (
+    LIKE gps_locations_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+    PRIMARY KEY (id, recorded_at),
+    FOREIGN KEY (vehicle_id) REFERENCES vehicles(id) ON DELETE CASCADE,
+    FOREIGN KEY (trip_id) REFERENCES trips(id) ON DELETE SET NULL
+) PARTITION BY RANGE (recorded_at);
+
+-- Same monthly partitions as 008_partition_analytics_tables.sql
+DO $$
+DECLARE
+    month DATE;
+BEGIN
+    SELECT date_trunc('month', LEAST(COALESCE(min(recorded_at), NOW()), NOW()))::date
+        INTO month
+        FROM gps_locations_unpartitioned;
+    WHILE month <= date_trunc('month', CURRENT_DATE + INTERVAL '2 months')::date LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF gps_locations FOR VALUES FROM (%L) TO (%L)',
+            'gps_locations_' || to_char(month, 'YYYY_MM'),
+            month,
+            (month + INTERVAL '1 month')::date
+        );
+        month := (month + INTERVAL '1 month')::date;
+    END LOOP;
+END $$;
+CREATE TABLE gps_locations_default PARTITION OF gps_locations DEFAULT;
+
+INSERT INTO gps_locations SELECT * FROM gps_locations_unpartitioned;
+
+DROP TABLE gps_locations_unpartitioned;
+
+-- Indexes on the parent cascade to every partition, present and future
+CREATE INDEX idx_gps_vehicle_time ON gps_locations(vehicle_id, recorded_at DESC);
+CREATE INDEX ix_gps_locations_trip_id ON gps_locations(trip_id);
+
+COMMENT ON COLUMN gps_locations.heading IS 'Compass heading in degrees (0-360)';
+COMMENT ON COLUMN gps_locations.accuracy_meters IS 'GPS accuracy in meters';
+
+COMMIT;
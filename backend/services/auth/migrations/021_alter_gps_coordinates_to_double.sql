@@ -0,0 +1,23 @@
+-- Migration: Store GPS coordinates and motion as double precision
+-- Description: gps_locations and trip_status_updates kept coordinates,
+-- altitude, speed and heading as NUMERIC, a variable-length decimal that
+-- PostgreSQL computes in software and psycopg2 decodes into Python Decimal
+-- per value. DOUBLE PRECISION is a fixed 8 bytes, uses hardware arithmetic
+-- and loads as float; its ~15 significant digits keep coordinates well
+-- below a centimetre. ALTER on the partitioned parent rewrites every
+-- partition
+
+BEGIN;
+
+ALTER TABLE gps_locations
+    ALTER COLUMN latitude TYPE DOUBLE PRECISION,
+    ALTER COLUMN longitude TYPE DOUBLE PRECISION,
+    ALTER COLUMN altitude TYPE DOUBLE PRECISION,
+    ALTER COLUMN speed_kmh TYPE DOUBLE PRECISION,
+    ALTER COLUMN heading TYPE DOUBLE PRECISION;
+
+ALTER TABLE trip_status_updates
+    ALTER COLUMN location_lat TYPE DOUBLE PRECISION,
+    ALTER COLUMN location_lng TYPE DOUBLE PRECISION;
+
+COMMIT;
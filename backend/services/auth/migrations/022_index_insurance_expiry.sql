@@ -0,0 +1,9 @@
+-- Migration: Index active insurance expiry dates per vehicle
+-- Description: Vehicle compliance refreshes are now a single UPDATE that
+-- reads each vehicle's latest active insurance expiry. This partial index
+-- holds only active insurance documents, keyed by vehicle and expiry, so the
+-- lookup is an index-only probe per vehicle
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vehicle_documents_insurance_expiry
+    ON vehicle_documents(vehicle_id, expiry_date)
+    WHERE document_type = 'insurance' AND is_active;
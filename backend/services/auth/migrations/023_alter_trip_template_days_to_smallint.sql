@@ -0,0 +1,15 @@
+-- Migration: Store trip template weekdays as SMALLINT[]
+-- Description: days_of_week holds weekday numbers 1-7, which fit SMALLINT's
+-- 2 bytes instead of INTEGER's 4. The GIN index is rebuilt over the new
+-- array type so days_of_week @> ARRAY[day] lookups stay indexed
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_trip_templates_days_of_week;
+
+ALTER TABLE trip_templates
+    ALTER COLUMN days_of_week TYPE SMALLINT[] USING days_of_week::SMALLINT[];
+
+CREATE INDEX idx_trip_templates_days_of_week ON trip_templates USING GIN(days_of_week);
+
+COMMIT;
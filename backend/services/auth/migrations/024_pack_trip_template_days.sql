@@ -0,0 +1,31 @@
+-- Migration: Pack trip template weekdays into a SMALLINT bitmask
+-- Description: Replace the days_of_week SMALLINT[] column and its GIN index
+-- with days_mask, one SMALLINT where weekday d (1 Monday to 7 Sunday) is
+-- bit d - 1. A row stores 2 bytes instead of an array header plus one
+-- element per day, and "runs on Tuesday" is days_mask & 2 <> 0 with no
+-- array decoding. The auth service maps the mask back to the days_of_week
+-- list, so the API is unchanged. Templates with no weekday in 1-7 never
+-- schedule a trip and cannot satisfy valid_days_mask, so they are deleted
+-- before the constraint is added; nothing references trip_templates
+
+BEGIN;
+
+ALTER TABLE trip_templates ADD COLUMN days_mask SMALLINT;
+
+UPDATE trip_templates
+SET days_mask = (
+    SELECT COALESCE(bit_or(1 << (day - 1)), 0)
+    FROM unnest(days_of_week) AS day
+    WHERE day BETWEEN 1 AND 7
+);
+
+DELETE FROM trip_templates WHERE days_mask = 0;
+
+DROP INDEX IF EXISTS idx_trip_templates_days_of_week;
+ALTER TABLE trip_templates DROP COLUMN days_of_week;
+
+ALTER TABLE trip_templates
+    ALTER COLUMN days_mask SET NOT NULL,
+    ADD CONSTRAINT valid_days_mask CHECK (days_mask BETWEEN 1 AND 127);
+
+COMMIT;
@@ -0,0 +1,16 @@
+-- Migration: BRIN indexes for GPS pings and trip status updates
+-- Description: gps_locations and trip_status_updates are appended in time
+-- order, so a BRIN summary per 32-page range prunes time range scans while
+-- staying a few pages in size and costing ingest almost nothing to
+-- maintain. Replaces the plain btree on trip_status_updates.created_at; the
+-- (vehicle_id, recorded_at DESC) and (trip_id, created_at) btrees stay for
+-- per-vehicle and per-trip lookups. On the partitioned gps_locations the
+-- index cascades to every partition
+
+DROP INDEX IF EXISTS idx_trip_status_updates_created_at;
+DROP INDEX IF EXISTS idx_gps_locations_recorded_at;
+
+CREATE INDEX IF NOT EXISTS ix_gps_recorded_brin
+    ON gps_locations USING brin (recorded_at) WITH (pages_per_range = 32);
+CREATE INDEX IF NOT EXISTS ix_tsu_created_brin
+    ON trip_status_updates USING brin (created_at) WITH (pages_per_range = 32);
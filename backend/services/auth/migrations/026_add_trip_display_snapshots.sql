@@ -0,0 +1,31 @@
+-- Migration: Trip display snapshots
+-- Description: Trip listings showed the route name, origin and destination,
+-- the vehicle's fleet number and plate and the driver code through three
+-- joins. The auth service now copies them onto the trip when it is
+-- scheduled, and again when its vehicle or driver is reassigned, and lists
+-- trips from this table alone. Existing trips are backfilled from their
+-- current route, vehicle and driver
+
+BEGIN;
+
+ALTER TABLE trips
+    ADD COLUMN route_name_snapshot VARCHAR(255),
+    ADD COLUMN origin_snapshot VARCHAR(255),
+    ADD COLUMN destination_snapshot VARCHAR(255),
+    ADD COLUMN vehicle_number_snapshot VARCHAR(20),
+    ADD COLUMN vehicle_plate_snapshot VARCHAR(20),
+    ADD COLUMN driver_code_snapshot VARCHAR(20);
+
+UPDATE trips t
+SET route_name_snapshot = r.route_name,
+    origin_snapshot = r.origin_name,
+    destination_snapshot = r.destination_name,
+    vehicle_number_snapshot = v.fleet_number,
+    vehicle_plate_snapshot = v.license_plate,
+    driver_code_snapshot = d.driver_code
+FROM routes r, vehicles v, drivers d
+WHERE r.id = t.route_id
+  AND v.id = t.vehicle_id
+  AND d.id = t.driver_id;
+
+COMMIT;
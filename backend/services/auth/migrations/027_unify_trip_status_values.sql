@@ -0,0 +1,61 @@
+-- Migration: One set of trip status values
+-- Description: trips.status used the trip_status enum (scheduled,
+-- in_progress, completed, cancelled) while trip status updates, which also
+-- set trips.status, allow departed, in_transit, arrived and delayed.
+-- Both columns now take the same values as VARCHAR(20) with CHECK
+-- constraints, as 019_alter_trip_status_update_columns.sql did for
+-- trip_status_updates. mv_vehicle_daily_summary (004) reads trips.status,
+-- which blocks the type change, so it is dropped first and rebuilt with its
+-- indexes afterwards
+
+BEGIN;
+
+DROP MATERIALIZED VIEW IF EXISTS mv_vehicle_daily_summary;
+
+ALTER TABLE trips
+    ALTER COLUMN status DROP DEFAULT,
+    ALTER COLUMN status TYPE VARCHAR(20) USING status::text,
+    ALTER COLUMN status SET DEFAULT 'scheduled',
+    ADD CONSTRAINT valid_trip_status CHECK (status IN (
+        'scheduled', 'departed', 'in_progress', 'in_transit', 'arrived',
+        'completed', 'cancelled', 'delayed'
+    ));
+
+ALTER TABLE trip_status_updates
+    DROP CONSTRAINT valid_tsu_status,
+    ADD CONSTRAINT valid_tsu_status CHECK (status IN (
+        'scheduled', 'departed', 'in_progress', 'in_transit', 'arrived',
+        'completed', 'cancelled', 'delayed'
+    ));
+
+-- No longer used by any column
+DROP TYPE IF EXISTS trip_status;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_vehicle_daily_summary AS
+SELECT
+    t.vehicle_id,
+    v.fleet_id,
+    t.scheduled_departure::date AS summary_date,
+    COUNT(*) FILTER (WHERE t.status = 'completed') AS trips_completed,
+    COUNT(*) FILTER (WHERE t.status = 'cancelled') AS cancelled_trips,
+    COALESCE(SUM(t.total_seats - t.available_seats), 0)::integer AS total_passengers,
+    COALESCE(SUM(b.revenue_cents), 0)::bigint AS total_revenue -- In cents
+FROM trips t
+JOIN vehicles v ON v.id = t.vehicle_id
+LEFT JOIN (
+    SELECT trip_id, SUM(amount_paid * 100)::bigint AS revenue_cents
+    FROM bookings
+    WHERE booking_status <> 'cancelled'
+    GROUP BY trip_id
+) b ON b.trip_id = t.id
+GROUP BY t.vehicle_id, v.fleet_id, t.scheduled_departure::date;
+
+-- Required by REFRESH ... CONCURRENTLY; also serves per-vehicle lookups
+CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_vehicle_daily_summary
+    ON mv_vehicle_daily_summary (vehicle_id, summary_date);
+
+-- Dashboard reads: one fleet, one day, ranked by revenue
+CREATE INDEX IF NOT EXISTS ix_mv_vehicle_daily_summary_fleet_date
+    ON mv_vehicle_daily_summary (fleet_id, summary_date, total_revenue DESC);
+
+COMMIT;
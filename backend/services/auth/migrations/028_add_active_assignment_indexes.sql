@@ -0,0 +1,13 @@
+-- Migration: Partial index for active assignments by fleet
+-- Description: Active assignment listings filter a fleet's active rows
+-- and order them by assigned_at. The is_active index could only narrow the
+-- scan to every fleet's active rows; (fleet_id, assigned_at) over active
+-- rows serves the filter and the order. Per-vehicle and per-driver active
+-- lookups already use the unique partial indexes from init.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_va_fleet_active
+    ON vehicle_assignments(fleet_id, assigned_at) WHERE is_active = true;
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_vehicle_assignments_active;
+-- Created by earlier ORM create_all runs from is_active's index=True
+DROP INDEX CONCURRENTLY IF EXISTS ix_vehicle_assignments_is_active;
@@ -0,0 +1,18 @@
+-- Migration: Indexes for open maintenance and vehicle status history
+-- Description: Maintenance dashboards and the pending list filter open work
+-- orders by fleet vehicle and priority; a partial (vehicle_id, priority)
+-- index over open rows replaces the single-column priority and is_completed
+-- indexes, which matched most of the table. Status history is read per
+-- vehicle newest first, so (vehicle_id, changed_at) replaces the
+-- single-column vehicle_id index
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_maint_open_priority
+    ON maintenance_records(vehicle_id, priority) WHERE NOT is_completed;
+DROP INDEX CONCURRENTLY IF EXISTS idx_maintenance_records_priority;
+DROP INDEX CONCURRENTLY IF EXISTS idx_maintenance_records_completed;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vsh_vehicle_time
+    ON vehicle_status_history(vehicle_id, changed_at);
+DROP INDEX CONCURRENTLY IF EXISTS idx_vehicle_status_history_vehicle_id;
+-- Created by earlier ORM create_all runs from vehicle_id's index=True
+DROP INDEX CONCURRENTLY IF EXISTS ix_vehicle_status_history_vehicle_id;
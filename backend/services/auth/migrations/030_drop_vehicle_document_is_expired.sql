@@ -0,0 +1,8 @@
+-- Migration: Drop the stored vehicle_documents.is_expired flag
+-- Description: Nothing refreshed is_expired once a document was created, so
+-- it stayed false after expiry_date passed. The auth service now derives it
+-- from expiry_date in Python and in SQL (expiry_date < now() in UTC). A
+-- generated column cannot take its place because now() is not immutable;
+-- expiry range queries use idx_vehicle_documents_expiry
+
+ALTER TABLE vehicle_documents DROP COLUMN IF EXISTS is_expired;
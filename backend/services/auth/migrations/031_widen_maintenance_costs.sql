@@ -0,0 +1,16 @@
+-- Migration: Widen maintenance cost columns to BIGINT
+-- Description: estimated_cost and actual_cost are stored in cents, and a
+-- 32-bit INTEGER tops out at about 21 million shillings. Both become BIGINT
+-- (this rewrites maintenance_records, so run it in a quiet window). A
+-- (vehicle_id, actual_cost) index lets per-vehicle cost sums run as
+-- index-only scans and replaces the single-column vehicle_id index
+
+ALTER TABLE maintenance_records
+    ALTER COLUMN estimated_cost TYPE BIGINT,
+    ALTER COLUMN actual_cost TYPE BIGINT;
+
+CREATE INDEX IF NOT EXISTS ix_maint_vehicle_cost
+    ON maintenance_records(vehicle_id, actual_cost);
+DROP INDEX IF EXISTS idx_maintenance_records_vehicle_id;
+-- Created by earlier ORM create_all runs from vehicle_id's index=True
+DROP INDEX IF EXISTS ix_maintenance_records_vehicle_id;
@@ -0,0 +1,17 @@
+-- Migration: Database-side bookkeeping for ending vehicle assignments
+-- Description: Unassigning is now a single conditional UPDATE on is_active
+-- instead of a load, mutate and flush in the auth service. An inactive
+-- assignment must record when it ended, and updated_at is stamped by the
+-- shared update_updated_at_column trigger rather than by the ORM. The
+-- constraint is added NOT VALID and validated separately so the check of
+-- existing rows does not block writes
+
+ALTER TABLE vehicle_assignments
+    ADD CONSTRAINT valid_assignment_end
+    CHECK (is_active OR unassigned_at IS NOT NULL) NOT VALID;
+ALTER TABLE vehicle_assignments VALIDATE CONSTRAINT valid_assignment_end;
+
+DROP TRIGGER IF EXISTS update_vehicle_assignments_updated_at ON vehicle_assignments;
+CREATE TRIGGER update_vehicle_assignments_updated_at
+    BEFORE UPDATE ON vehicle_assignments
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
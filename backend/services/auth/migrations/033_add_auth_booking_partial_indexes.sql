@@ -0,0 +1,16 @@
+-- Migration: Partial and composite indexes for auth, booking and driver lookups
+-- Description: The per-request auth lookup reads active user profiles by
+-- user_id, passenger booking history filters by passenger and status, seat
+-- availability only counts bookings still holding seats, and assignment
+-- lookups only consider active drivers. The booking predicate uses the
+-- booking_status enum values ('pending', 'confirmed'), which BookingService's
+-- seat queries also filter on, so the planner can match it
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_profiles_user_id_active
+    ON user_profiles(user_id) WHERE is_active = true;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bookings_passenger_status
+    ON bookings(passenger_id, booking_status);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bookings_trip_active
+    ON bookings(trip_id) WHERE booking_status IN ('pending', 'confirmed');
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_drivers_fleet_active
+    ON drivers(fleet_id) WHERE is_active = true;
@@ -0,0 +1,7 @@
+-- Migration: GIN index on bookings.seat_numbers
+-- Description: Seat conflict checks look for active bookings whose
+-- seat_numbers overlap the requested seats (seat_numbers && ARRAY[...]);
+-- a GIN index answers the overlap without reading every booking's array
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_bookings_seat_numbers_gin
+    ON bookings USING gin (seat_numbers);
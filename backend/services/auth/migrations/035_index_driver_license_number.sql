@@ -0,0 +1,12 @@
+-- Migration: Hash index on drivers.license_number
+-- Description: Driver registration checks for an existing licence by exact
+-- match on the stripped, upper-cased number. Existing rows are normalized
+-- the same way so the check sees them, and a hash index (smaller than a
+-- btree for pure equality) serves the lookup
+
+UPDATE drivers
+SET license_number = upper(btrim(license_number))
+WHERE license_number <> upper(btrim(license_number));
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_drivers_license_number
+    ON drivers USING hash (license_number);
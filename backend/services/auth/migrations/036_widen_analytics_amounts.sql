@@ -0,0 +1,20 @@
+-- Migration: Widen analytics money columns to BIGINT cents
+-- Description: Route performance and vehicle performance summary amounts are
+-- stored in cents like payments, refunds and maintenance costs, but were
+-- still INTEGER and overflow at about 21.4 million shillings. They become
+-- BIGINT; the values are unchanged. This rewrites both tables (every
+-- vehicle_performance_summary partition), so run it in a quiet window.
+-- Existing columns keep their positions; new databases get the padding-free
+-- layout from init.sql
+
+ALTER TABLE route_performance
+    ALTER COLUMN total_revenue TYPE BIGINT,
+    ALTER COLUMN maintenance_cost TYPE BIGINT;
+
+ALTER TABLE vehicle_performance_summary
+    ALTER COLUMN total_revenue TYPE BIGINT,
+    ALTER COLUMN fuel_cost TYPE BIGINT,
+    ALTER COLUMN maintenance_cost TYPE BIGINT,
+    ALTER COLUMN gross_revenue TYPE BIGINT,
+    ALTER COLUMN operating_cost TYPE BIGINT,
+    ALTER COLUMN net_profit TYPE BIGINT;
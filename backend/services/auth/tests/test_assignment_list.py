@@ -0,0 +1,40 @@
+"""
+Tests for the assignment list select
+"""
+
+import uuid
+from datetime import datetime
+
+import orjson
+from sqlalchemy import select
+
+from app.schemas.assignment import AssignmentResponse
+from app.services.assignment_service import _ASSIGNMENT_LIST_COLUMNS
+
+
+class TestAssignmentListColumns:
+    """Test list rows can be returned without re-validation"""
+
+    def test_columns_match_response(self):
+        """Test the select returns exactly the AssignmentResponse fields"""
+        names = list(select(*_ASSIGNMENT_LIST_COLUMNS).selected_columns.keys())
+        assert names == list(AssignmentResponse.model_fields)
+
+    def test_row_encodes_as_response(self):
+        """Test an encoded row validates as an AssignmentResponse"""
+        row = {
+            "id": uuid.uuid4(),
+            "driver_id": uuid.uuid4(),
+            "vehicle_id": uuid.uuid4(),
+            "driver_name": "DRV-001KM",
+            "vehicle_info": "KM-12 (KDA 123A)",
+            "assigned_at": datetime(2024, 3, 1, 8, 30, 15, 120000),
+            "unassigned_at": None,
+            "is_active": True,
+            "assignment_notes": None,
+            "created_at": datetime(2024, 3, 1, 8, 30, 15, 120000),
+        }
+        response = AssignmentResponse.model_validate_json(orjson.dumps(row))
+
+        assert response.id == str(row["id"])
+        assert response.assigned_at == row["assigned_at"].isoformat()
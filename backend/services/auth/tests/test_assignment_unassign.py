@@ -0,0 +1,55 @@
+"""
+Tests for ending vehicle assignments
+"""
+
+import uuid
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.vehicle_assignment import VehicleAssignment
+
+
+class _RecordingSession:
+    """Session stand-in that records statements and reports a rowcount"""
+
+    def __init__(self, rowcount):
+        self.rowcount = rowcount
+        self.statements = []
+
+    def execute(self, statement):
+        self.statements.append(statement)
+        return SimpleNamespace(rowcount=self.rowcount)
+
+
+def _sql(statement):
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestUnassign:
+    """Test unassigning is one conditional UPDATE"""
+
+    def test_updates_only_active_owned_assignment(self):
+        """Test the UPDATE is guarded by id, manager and is_active"""
+        db = _RecordingSession(rowcount=1)
+
+        assert VehicleAssignment.unassign(db, uuid.uuid4(), uuid.uuid4(), "Leave")
+
+        [statement] = db.statements
+        sql = _sql(statement)
+        assert sql.startswith("UPDATE vehicle_assignments SET")
+        assert "assignment_notes=" in sql
+        assert "vehicle_assignments.manager_id = " in sql
+        assert "vehicle_assignments.is_active IS true" in sql
+
+    def test_keeps_notes_without_new_ones(self):
+        """Test earlier notes are left alone when none are given"""
+        db = _RecordingSession(rowcount=1)
+        VehicleAssignment.unassign(db, uuid.uuid4(), uuid.uuid4())
+
+        assert "assignment_notes" not in _sql(db.statements[0])
+
+    def test_no_match(self):
+        """Test an inactive or foreign assignment reports failure"""
+        db = _RecordingSession(rowcount=0)
+        assert not VehicleAssignment.unassign(db, uuid.uuid4(), uuid.uuid4())
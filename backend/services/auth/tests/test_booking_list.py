@@ -0,0 +1,47 @@
+"""
+Tests for booking list responses
+"""
+
+import orjson
+
+from app.api.v1.endpoints.booking import (
+    _TRIP_SEARCH_LIST_ADAPTER,
+    _list_response,
+)
+
+
+class TestListResponse:
+    """Test list results are serialized through their response model"""
+
+    def test_trip_search_list(self):
+        """Test a service result serializes with only response fields"""
+        trip = {
+            "id": "t1",
+            "route_id": "r1",
+            "route_name": "CBD - Rongai",
+            "origin_name": "CBD",
+            "destination_name": "Rongai",
+            "vehicle_info": "KM-12 (KDA 123A)",
+            "driver_name": "DRV-001KM",
+            "scheduled_departure": "2024-03-01T08:30:00",
+            "fare": 100.0,
+            "total_seats": 14,
+            "available_seats": 3,
+            "status": "scheduled",
+            "internal_note": "not part of the response",
+        }
+        result = {
+            "trips": [trip],
+            "total_count": 1,
+            "page": 1,
+            "limit": 20,
+            "total_pages": 1,
+        }
+
+        response = _list_response(_TRIP_SEARCH_LIST_ADAPTER, result)
+        body = orjson.loads(response.body)
+
+        assert response.media_type == "application/json"
+        assert body["total_count"] == 1
+        assert body["trips"][0]["scheduled_arrival"] is None
+        assert "internal_note" not in body["trips"][0]
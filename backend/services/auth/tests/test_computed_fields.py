@@ -0,0 +1,57 @@
+"""
+Tests for values computed from assignment and document dates
+"""
+
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import select
+
+from app.models.vehicle_assignment import VehicleAssignment
+from app.models.vehicle_status import VehicleDocument
+
+
+class TestDurationDays:
+    """Test assignment duration in Python and SQL"""
+
+    def test_active_assignment(self):
+        """Test an active assignment counts up to now"""
+        assignment = VehicleAssignment(
+            assigned_at=datetime.utcnow() - timedelta(days=3, hours=1)
+        )
+        assert assignment.duration_days == 3
+
+    def test_unassigned(self):
+        """Test an ended assignment counts up to its unassignment"""
+        assigned_at = datetime(2024, 1, 1)
+        assignment = VehicleAssignment(
+            assigned_at=assigned_at, unassigned_at=assigned_at + timedelta(days=40)
+        )
+        assert assignment.duration_days == 40
+
+    def test_filterable(self):
+        """Test the duration can be used in a WHERE clause"""
+        stmt = select(VehicleAssignment.id).where(VehicleAssignment.duration_days > 30)
+        assert "EXTRACT(day FROM" in str(stmt)
+
+
+class TestIsExpired:
+    """Test document expiry in Python and SQL"""
+
+    def test_expiry(self):
+        """Test past, future and missing expiry dates"""
+        now = datetime.utcnow()
+        assert VehicleDocument(expiry_date=now - timedelta(days=1)).is_expired
+        assert not VehicleDocument(expiry_date=now + timedelta(days=1)).is_expired
+        assert not VehicleDocument().is_expired
+
+    def test_expiry_from_date(self):
+        """Test a date from the request schema compares as midnight UTC"""
+        today = datetime.utcnow().date()
+        assert VehicleDocument(expiry_date=today - timedelta(days=1)).is_expired
+        assert VehicleDocument(expiry_date=today).is_expired
+        assert not VehicleDocument(expiry_date=today + timedelta(days=1)).is_expired
+        assert VehicleDocument(expiry_date=date(2020, 1, 1)).is_expired
+
+    def test_not_stored(self):
+        """Test expiry is derived rather than a column"""
+        assert "is_expired" not in VehicleDocument.__table__.columns
@@ -0,0 +1,107 @@
+"""
+Tests for sensitive data encryption utilities
+"""
+
+import base64
+
+import pytest
+
+from app.core import encryption
+from app.core.encryption import EncryptionService
+
+
+@pytest.fixture
+def password_key(monkeypatch):
+    """Configure a non-base64 ENCRYPTION_KEY so the key is derived"""
+    monkeypatch.setenv("ENCRYPTION_KEY", "correct horse battery staple")
+    monkeypatch.delenv("ENCRYPTION_KEY_CACHE_PATH", raising=False)
+    encryption._pbkdf2_key.cache_clear()
+
+
+class TestEncryptionService:
+    """Test encryption round-trips and key derivation"""
+
+    def test_encrypt_decrypt_round_trip(self, password_key):
+        """Test encrypted data decrypts to the original value"""
+        service = EncryptionService()
+        encrypted = service.encrypt("gps-api-key-123")
+
+        assert encrypted != "gps-api-key-123"
+        assert service.decrypt(encrypted) == "gps-api-key-123"
+
+    def test_encrypt_uses_aes_gcm(self, password_key):
+        """Test new ciphertexts are AES-GCM and non-deterministic"""
+        service = EncryptionService()
+        first = service.encrypt("secret")
+        second = service.encrypt("secret")
+
+        assert first.startswith(encryption.AESGCM_PREFIX)
+        assert first != second
+
+    def test_decrypt_legacy_fernet_value(self, password_key):
+        """Test values written by the Fernet implementation still decrypt"""
+        service = EncryptionService()
+        legacy = base64.urlsafe_b64encode(service._fernet.encrypt(b"secret")).decode()
+
+        assert service.decrypt(legacy) == "secret"
+
+    def test_decrypt_plain_fernet_token(self, password_key):
+        """Test Fernet tokens without the extra base64 layer decrypt"""
+        service = EncryptionService()
+        token = service._fernet.encrypt(b"secret").decode()
+
+        assert service.decrypt(token) == "secret"
+
+    def test_tampered_value_not_decrypted(self, password_key):
+        """Test a modified ciphertext fails authentication"""
+        service = EncryptionService()
+        encrypted = service.encrypt("secret")
+        raw = bytearray(
+            base64.urlsafe_b64decode(encrypted[len(encryption.AESGCM_PREFIX) :])
+        )
+        raw[-1] ^= 0x01
+        tampered = encryption.AESGCM_PREFIX + base64.urlsafe_b64encode(raw).decode()
+
+        assert service.decrypt(tampered) != "secret"
+
+    def test_empty_values_pass_through(self, password_key):
+        """Test empty values are not encrypted"""
+        service = EncryptionService()
+        assert service.encrypt("") == ""
+        assert service.decrypt("") == ""
+
+    def test_derived_key_cached_in_process(self, password_key):
+        """Test PBKDF2 runs once for repeated service instances"""
+        first = EncryptionService()
+        second = EncryptionService()
+
+        assert first._key == second._key
+        assert encryption._pbkdf2_key.cache_info().misses == 1
+
+    def test_derived_key_cached_on_disk(self, password_key, monkeypatch, tmp_path):
+        """Test a cached key file is reused instead of re-deriving"""
+        cache_path = tmp_path / "derived_key"
+        monkeypatch.setenv("ENCRYPTION_KEY_CACHE_PATH", str(cache_path))
+
+        first = EncryptionService()
+        assert cache_path.exists()
+        assert cache_path.stat().st_mode & 0o777 == 0o600
+
+        encryption._pbkdf2_key.cache_clear()
+        second = EncryptionService()
+
+        assert second._key == first._key
+        assert encryption._pbkdf2_key.cache_info().misses == 0
+
+    def test_cached_key_ignored_for_other_password(
+        self, password_key, monkeypatch, tmp_path
+    ):
+        """Test a cached key derived from another password is not used"""
+        cache_path = tmp_path / "derived_key"
+        monkeypatch.setenv("ENCRYPTION_KEY_CACHE_PATH", str(cache_path))
+        first = EncryptionService()
+
+        monkeypatch.setenv("ENCRYPTION_KEY", "a different passphrase")
+        second = EncryptionService()
+
+        assert second._key != first._key
@@ -0,0 +1,46 @@
+"""
+Tests for the per-session primary key lookup cache
+"""
+
+import uuid
+
+from app.core.database import get_by_id
+from app.models.simple_vehicle import SimpleVehicle
+from app.models.trip import Route
+
+
+class FakeSession:
+    """Records Session.get calls and answers from a fixed table"""
+
+    def __init__(self, rows):
+        self.info = {}
+        self.rows = rows
+        self.calls = []
+
+    def get(self, model, ident):
+        self.calls.append((model, ident))
+        return self.rows.get((model, str(ident)))
+
+
+class TestGetById:
+    """Test repeated lookups within one session hit the database once"""
+
+    def test_repeated_lookup_reuses_result(self):
+        """Test UUID and string forms of a key share one lookup"""
+        route_id = uuid.uuid4()
+        route = Route(id=route_id)
+        db = FakeSession({(Route, str(route_id)): route})
+
+        assert get_by_id(db, Route, route_id) is route
+        assert get_by_id(db, Route, str(route_id)) is route
+        assert db.calls == [(Route, route_id)]
+
+    def test_misses_are_cached_per_model(self):
+        """Test a missing row is not looked up again, per model"""
+        ident = uuid.uuid4()
+        db = FakeSession({})
+
+        assert get_by_id(db, Route, ident) is None
+        assert get_by_id(db, Route, ident) is None
+        assert get_by_id(db, SimpleVehicle, ident) is None
+        assert db.calls == [(Route, ident), (SimpleVehicle, ident)]
@@ -0,0 +1,35 @@
+"""
+Tests for GPS reading validation
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.trip_status import GPSLocationRequest
+
+
+def _reading(recorded_at):
+    return GPSLocationRequest(
+        vehicle_id="v1", latitude=-1.2921, longitude=36.8219, recorded_at=recorded_at
+    )
+
+
+class TestRecordedAt:
+    """Test readings stamped by a wrong device clock are rejected"""
+
+    def test_recent_reading(self):
+        """Test current readings, naive or aware, are accepted"""
+        _reading(datetime.utcnow())
+        _reading(datetime.now(timezone.utc) - timedelta(days=3))
+
+    def test_future_reading(self):
+        """Test a reading months ahead is rejected"""
+        with pytest.raises(ValidationError):
+            _reading(datetime.now(timezone.utc) + timedelta(days=90))
+
+    def test_stale_reading(self):
+        """Test a reading from a past year is rejected"""
+        with pytest.raises(ValidationError):
+            _reading(datetime(2000, 1, 1))
@@ -0,0 +1,38 @@
+"""
+Tests for primary key generation utilities
+"""
+
+import time
+
+from app.utils.ids import uuid7
+
+
+class TestUUID7:
+    """Test time-ordered UUID generation"""
+
+    def test_version_and_variant(self):
+        """Test generated IDs are RFC 9562 version 7 UUIDs"""
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_embeds_current_time(self):
+        """Test the leading 48 bits carry the Unix time in milliseconds"""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= value.int >> 80 <= after
+
+    def test_ordered_across_milliseconds(self):
+        """Test IDs from later milliseconds sort after earlier ones"""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first < second
+        assert str(first) < str(second)
+
+    def test_uniqueness(self):
+        """Test IDs are unique within the same millisecond"""
+        assert len({uuid7() for _ in range(1000)}) == 1000
@@ -0,0 +1,64 @@
+"""
+Tests for the shared model serialization mixin
+"""
+
+import uuid
+from datetime import datetime, time, timezone
+from decimal import Decimal
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.mixins import _convert
+from app.models.simple_driver import SimpleDriver
+from app.models.trip import Trip, TripTemplate
+
+
+class TestDumpSelect:
+    """Test the Core select behind ModelMixin.dump_rows"""
+
+    def test_uuid_strings_cast_in_sql(self):
+        """Test UUIDs serialized as strings are selected as text"""
+        sql = str(SimpleDriver._dump_select().compile(dialect=postgresql.dialect()))
+
+        assert "CAST(drivers.id AS TEXT) AS id" in sql
+        assert "CAST(drivers.fleet_id AS TEXT) AS fleet_id" in sql
+        assert "drivers.driver_code," in sql
+
+    def test_dump_plan_skips_cast_converters(self):
+        """Test cast columns are not converted again in Python"""
+        SimpleDriver._dump_select()
+        plan = dict(SimpleDriver._dump_plan)
+
+        assert plan["id"] is None
+        assert plan["fleet_id"] is None
+        assert plan["created_at"] is dict(SimpleDriver._dict_plan)["created_at"]
+        assert list(plan) == list(SimpleDriver._dict_fields)
+
+
+class TestGeneratedToDict:
+    """Test the to_dict generated from a model's field plan"""
+
+    def test_matches_field_plan(self):
+        """Test inline and custom converters give the plan's output"""
+        trip = Trip(
+            id=uuid.uuid4(),
+            route_id=uuid.uuid4(),
+            scheduled_departure=datetime(2024, 5, 1, 8, 30, tzinfo=timezone.utc),
+            fare=Decimal("150.00"),
+            total_seats=14,
+        )
+        template = TripTemplate(id=uuid.uuid4(), departure_time=time(6, 15))
+
+        assert trip.to_dict() == _convert(Trip._dict_plan, Trip._dict_getter(trip))
+        assert trip.to_dict()["scheduled_departure"] == "2024-05-01T08:30:00+00:00"
+        assert trip.to_dict()["fare"] == 150.0
+        assert trip.to_dict()["actual_arrival"] is None
+        assert template.to_dict()["departure_time"] == "06:15:00"
+
+    def test_unloaded_fields_load_through_descriptors(self):
+        """Test fields missing from the instance state still serialize"""
+        driver = SimpleDriver(driver_code="D001")
+
+        assert "license_number" not in driver.__dict__
+        assert driver.to_dict()["license_number"] is None
+        assert driver.to_dict()["driver_code"] == "D001"
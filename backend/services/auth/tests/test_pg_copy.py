@@ -0,0 +1,70 @@
+"""
+Tests for the binary COPY encoders
+"""
+
+import struct
+import uuid
+from datetime import datetime, timezone
+
+from app.models.trip_status import GPSLocation
+from app.utils import pg_copy
+
+
+class TestEncoders:
+    """Test the PostgreSQL binary representation of each type"""
+
+    def test_uuid(self):
+        """Test UUIDs and their strings encode as the 16 raw bytes"""
+        value = uuid.uuid4()
+        assert pg_copy.uuid_bytes(value) == value.bytes
+        assert pg_copy.uuid_bytes(str(value)) == value.bytes
+
+    def test_float8(self):
+        """Test floats encode as big-endian doubles"""
+        assert pg_copy.float8(-1.2921) == struct.pack(">d", -1.2921)
+
+    def test_naive_timestamp_is_utc(self):
+        """Test a naive timestamp encodes as the same instant in UTC"""
+        naive = datetime(2024, 3, 1, 8, 30)
+        assert pg_copy.timestamptz(naive) == pg_copy.timestamptz(
+            naive.replace(tzinfo=timezone.utc)
+        )
+
+    def test_copy_sql(self):
+        """Test the statement lists columns in COPY order"""
+        assert pg_copy.copy_sql("t", (("a", None), ("b", None))) == (
+            "COPY t (a, b) FROM STDIN (FORMAT BINARY)"
+        )
+
+
+class TestGPSCopyColumns:
+    """Test GPS readings map onto the COPY column list"""
+
+    def test_columns_exist(self):
+        """Test every COPY column is a gps_locations column"""
+        table_columns = set(GPSLocation.__table__.columns.keys())
+        assert {name for name, _ in GPSLocation._copy_columns} <= table_columns
+        assert "received_at" not in dict(GPSLocation._copy_columns)
+
+    def test_reading_encodes(self):
+        """Test a reading as the batch endpoint builds it encodes in full"""
+        row = {
+            "id": uuid.uuid4(),
+            "vehicle_id": str(uuid.uuid4()),
+            "trip_id": None,
+            "latitude": -1.2921,
+            "longitude": 36.8219,
+            "altitude": None,
+            "speed_kmh": 42.5,
+            "heading": 90.0,
+            "accuracy_meters": 5,
+            "recorded_at": datetime(2024, 3, 1, 8, 30, tzinfo=timezone.utc),
+        }
+        stream = pg_copy.encode_copy_binary(GPSLocation._copy_columns, [row])
+
+        assert stream.startswith(pg_copy.COPY_HEADER)
+        assert stream.endswith(pg_copy.COPY_TRAILER)
+        body = stream[len(pg_copy.COPY_HEADER) : -len(pg_copy.COPY_TRAILER)]
+        # field count, then 8 non-null fields with lengths and 2 NULLs
+        assert struct.unpack_from(">h", body)[0] == 10
+        assert len(body) == 2 + 10 * 4 + 16 * 2 + 8 * 4 + 4 + 8
@@ -0,0 +1,157 @@
+"""
+Tests for Redis client value serialization
+"""
+
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.core.redis_client import RedisClient, PACKED_KEY_PREFIX
+
+
+class FakePipeline:
+    """Minimal stand-in for a non-transactional redis pipeline"""
+
+    def __init__(self, fake):
+        self.fake = fake
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.calls = []
+
+    def __getattr__(self, name):
+        method = getattr(self.fake, name)
+        return lambda *args, **kwargs: self.calls.append((method, args, kwargs))
+
+    def execute(self):
+        return [method(*args, **kwargs) for method, args, kwargs in self.calls]
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for redis.Redis (raw bytes values)"""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    @staticmethod
+    def _encode(value):
+        if isinstance(value, bytes):
+            return value
+        return str(value).encode()
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = self._encode(value)
+        return True
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def mget(self, *keys):
+        return [self.store.get(key) for key in keys]
+
+    def delete(self, *keys):
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    def exists(self, *keys):
+        return sum(key in self.store for key in keys)
+
+    def incr(self, key, amount=1):
+        value = int(self.store.get(key, b"0")) + amount
+        self.store[key] = self._encode(value)
+        return value
+
+    def expire(self, key, seconds):
+        if key not in self.store:
+            return False
+        self.ttls[key] = seconds
+        return True
+
+
+@pytest.fixture
+def fake_redis():
+    """In-memory Redis store"""
+    return FakeRedis()
+
+
+@pytest.fixture
+def client(monkeypatch, fake_redis):
+    """Redis client backed by an in-memory store"""
+    redis_client = RedisClient()
+    monkeypatch.setattr(redis_client, "connect", lambda: fake_redis)
+    monkeypatch.setattr(redis_client, "connect_raw", lambda: fake_redis)
+    return redis_client
+
+
+class TestRedisClient:
+    """Test Redis get/set serialization"""
+
+    def test_dict_round_trip(self, client, fake_redis):
+        """Test dict values are msgpack-encoded and parsed back"""
+        value = {"otp_hash": "abc", "attempts": 0, "nested": [1, 2, 3]}
+        assert client.set("otp:+254712345678", value)
+
+        assert list(fake_redis.store) == [f"{PACKED_KEY_PREFIX}otp:+254712345678"]
+        assert client.get("otp:+254712345678") == value
+
+    def test_non_native_types_are_stringified(self, client):
+        """Test UUID, datetime and Decimal values are serializable"""
+        user_id = uuid.uuid4()
+        created = datetime(2025, 1, 1, 12, 30)
+        client.set("key", {"id": user_id, "at": created, "amount": Decimal("1.50")})
+
+        value = client.get("key")
+        assert value["id"] == str(user_id)
+        assert value["at"] == "2025-01-01T12:30:00"
+        assert value["amount"] == "1.50"
+
+    def test_legacy_json_value_still_readable(self, client, fake_redis):
+        """Test JSON entries written before msgpack are still parsed"""
+        fake_redis.store["otp:legacy"] = b'{"hash": "abc", "attempts": 1}'
+        assert client.get("otp:legacy") == {"hash": "abc", "attempts": 1}
+
+    def test_structured_set_replaces_legacy_value(self, client, fake_redis):
+        """Test writing a structured value removes its JSON copy"""
+        fake_redis.store["otp:legacy"] = b'{"attempts": 1}'
+        client.set("otp:legacy", {"attempts": 2})
+
+        assert "otp:legacy" not in fake_redis.store
+        assert client.get("otp:legacy") == {"attempts": 2}
+
+    def test_plain_string_returned_as_is(self, client):
+        """Test non-JSON strings fall through unchanged"""
+        client.set("token", "not-json")
+        assert client.get("token") == "not-json"
+
+    def test_delete_and_exists_cover_structured_values(self, client):
+        """Test delete/exists see msgpack-encoded values"""
+        client.set("otp", {"attempts": 0})
+        assert client.exists("otp")
+        assert client.delete("otp")
+        assert not client.exists("otp")
+
+    def test_incr_with_expiry(self, client, fake_redis):
+        """Test counter increment and expiry are batched together"""
+        assert client.incr_with_expiry("rate_limit:+254712345678", 60) == 1
+        assert client.incr_with_expiry("rate_limit:+254712345678", 60) == 2
+
+        assert fake_redis.ttls["rate_limit:+254712345678"] == 60
+        assert client.get("rate_limit:+254712345678") == 2
+
+    def test_missing_key(self, client):
+        """Test missing keys return None"""
+        assert client.get("missing") is None
+
+    def test_generation_counter(self, client):
+        """Test a generation starts at 0 and moves on each bump"""
+        assert client.get_generation("vsh:gen:v1") == 0
+        client.incr("vsh:gen:v1")
+        assert client.get_generation("vsh:gen:v1") == 1
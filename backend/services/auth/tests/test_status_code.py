@@ -0,0 +1,47 @@
+"""
+Tests for the SMALLINT status column type
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.payment import (
+    PaymentStatus,
+    PaymentStatusCode,
+    PaymentTransaction,
+    RefundStatus,
+    RefundStatusCode,
+    StatusCode,
+)
+
+
+class TestStatusCode:
+    """Test status strings round-trip through their stored codes"""
+
+    def test_codes_cover_statuses(self):
+        """Test every status string has a code and nothing else does"""
+        assert {m.name for m in PaymentStatusCode} == {m.name for m in PaymentStatus}
+        assert {m.name for m in RefundStatusCode} == {m.name for m in RefundStatus}
+
+    def test_round_trip(self):
+        """Test strings and enum members bind to codes and load as strings"""
+        status = StatusCode(PaymentStatusCode)
+        dialect = postgresql.dialect()
+
+        assert status.process_bind_param("completed", dialect) == 2
+        assert status.process_bind_param(PaymentStatus.COMPLETED, dialect) == 2
+        assert status.process_bind_param(None, dialect) is None
+        assert status.process_result_value(2, dialect) == "completed"
+
+    def test_unknown_value(self):
+        """Test binding a value outside the enum is rejected"""
+        with pytest.raises(ValueError):
+            StatusCode(RefundStatusCode).process_bind_param("bogus", None)
+
+    def test_comparison_binds_code(self):
+        """Test a status filter is compared as codes in SQL"""
+        clause = PaymentTransaction.status.in_(["failed", "pending"])
+        compiled = clause.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+        assert str(compiled) == "payment_transactions.status IN (3, 0)"
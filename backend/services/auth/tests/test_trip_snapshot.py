@@ -0,0 +1,49 @@
+"""
+Tests for trip display snapshots
+"""
+
+from types import SimpleNamespace
+
+from sqlalchemy import select
+
+from app.models.trip import Trip
+from app.services.trip_service import _TRIP_LIST_COLUMNS
+
+
+class TestTripSnapshot:
+    """Test trips carry the display fields their listings need"""
+
+    def test_take_snapshot(self):
+        """Test route, vehicle and driver fields are copied onto the trip"""
+        trip = Trip()
+        trip.take_snapshot(
+            route=SimpleNamespace(
+                name="CBD - Rongai", origin="CBD", destination="Rongai"
+            ),
+            vehicle=SimpleNamespace(fleet_number="KM-12", license_plate="KDA 123A"),
+            driver=SimpleNamespace(driver_code="DRV-001KM"),
+        )
+
+        assert trip.route_name_snapshot == "CBD - Rongai"
+        assert trip.origin_snapshot == "CBD"
+        assert trip.destination_snapshot == "Rongai"
+        assert trip.vehicle_number_snapshot == "KM-12"
+        assert trip.vehicle_plate_snapshot == "KDA 123A"
+        assert trip.driver_code_snapshot == "DRV-001KM"
+
+    def test_partial_snapshot(self):
+        """Test a reassignment only replaces the fields it is given"""
+        trip = Trip(
+            route_name_snapshot="CBD - Rongai", vehicle_plate_snapshot="KDA 123A"
+        )
+        trip.take_snapshot(
+            vehicle=SimpleNamespace(fleet_number="KM-7", license_plate="KBZ 9B")
+        )
+
+        assert trip.route_name_snapshot == "CBD - Rongai"
+        assert trip.vehicle_plate_snapshot == "KBZ 9B"
+
+    def test_list_reads_trips_only(self):
+        """Test the trip list select has no joins"""
+        froms = select(*_TRIP_LIST_COLUMNS).get_final_froms()
+        assert [str(table) for table in froms] == ["trips"]
@@ -0,0 +1,78 @@
+"""
+Tests for the in-process TTL cache
+"""
+
+from app.core import ttl_cache
+from app.core.ttl_cache import TTLCache
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Test expiry, eviction and invalidation"""
+
+    def test_entry_expires(self, monkeypatch):
+        """Test entries are dropped once their TTL has passed"""
+        clock = FakeClock()
+        monkeypatch.setattr(ttl_cache.time, "monotonic", clock)
+        cache = TTLCache(maxsize=10, ttl=60)
+
+        cache.set("token", {"sub": "user-1"})
+        clock.now += 59
+        assert cache.get("token") == {"sub": "user-1"}
+
+        clock.now += 2
+        assert cache.get("token") is None
+
+    def test_per_entry_ttl_bounded_by_default(self, monkeypatch):
+        """Test a per-entry TTL never outlives the cache TTL"""
+        clock = FakeClock()
+        monkeypatch.setattr(ttl_cache.time, "monotonic", clock)
+        cache = TTLCache(maxsize=10, ttl=60)
+
+        cache.set("short", 1, ttl=5)
+        cache.set("long", 2, ttl=3600)
+        clock.now += 10
+
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+
+        clock.now += 60
+        assert cache.get("long") is None
+
+    def test_expired_ttl_not_stored(self):
+        """Test non-positive TTLs are not cached"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("expired", 1, ttl=-5)
+
+        assert cache.get("expired") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_evicted(self):
+        """Test the oldest unused entry is evicted when full"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_pop(self):
+        """Test pop invalidates an entry"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("user-1", "admin")
+
+        assert cache.pop("user-1") == "admin"
+        assert cache.get("user-1") is None
+        assert cache.pop("user-1") is None
@@ -0,0 +1,194 @@
+"""
+Tests for the webhook log COPY encoder and queue flush
+"""
+
+import struct
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+import orjson
+from sqlalchemy.exc import DataError, OperationalError
+
+from app.services import webhook_bulk
+from app.services.webhook_bulk import (
+    WEBHOOK_LOG_DEAD_LETTER,
+    WEBHOOK_LOG_PROCESSING,
+    WEBHOOK_LOG_QUEUE,
+    _COLUMNS,
+    _FLUSH_LOCK,
+    encode_copy_binary,
+    new_webhook_log,
+)
+from app.utils.pg_copy import COPY_HEADER
+
+
+def _fields(stream: bytes):
+    """Split a single-row COPY binary stream into its field values"""
+    offset = len(COPY_HEADER)
+    (count,) = struct.unpack_from(">h", stream, offset)
+    offset += 2
+    fields = []
+    for _ in range(count):
+        (length,) = struct.unpack_from(">i", stream, offset)
+        offset += 4
+        if length == -1:
+            fields.append(None)
+        else:
+            fields.append(stream[offset : offset + length])
+            offset += length
+    assert stream[offset:] == struct.pack(">h", -1)
+    return dict(zip((name for name, _ in _COLUMNS), fields))
+
+
+class TestEncodeCopyBinary:
+    """Test the PostgreSQL binary COPY encoding of webhook logs"""
+
+    def test_empty_stream(self):
+        """Test an empty batch is just the header and trailer"""
+        assert encode_copy_binary([]) == COPY_HEADER + struct.pack(">h", -1)
+
+    def test_field_encoding(self):
+        """Test each column uses its PostgreSQL binary representation"""
+        record = new_webhook_log("stk_push", {"Body": {"stkCallback": {}}})
+        record["processed"] = True
+        record["received_at"] = datetime(2000, 1, 1, tzinfo=timezone.utc) + timedelta(
+            seconds=1, microseconds=5
+        )
+
+        fields = _fields(encode_copy_binary([record]))
+
+        assert fields["webhook_type"] == b"stk_push"
+        assert fields["raw_payload"] == b'\x01{"Body":{"stkCallback":{}}}'
+        assert fields["processed"] == b"\x01"
+        assert fields["retry_count"] == struct.pack(">i", 0)
+        assert fields["received_at"] == struct.pack(">q", 1_000_005)
+        assert fields["checkout_request_id"] is None
+        assert fields["processed_at"] is None
+
+
+class FakeListRedis:
+    """Minimal in-memory stand-in for the redis list commands the flush uses"""
+
+    def __init__(self):
+        self.lists = defaultdict(list)
+        self.keys = {}
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.keys:
+            return None
+        self.keys[key] = value
+        return True
+
+    def delete(self, key):
+        self.lists.pop(key, None)
+        self.keys.pop(key, None)
+
+    def lrange(self, key, start, end):
+        return list(self.lists[key])
+
+    def eval(self, script, numkeys, key, token):
+        # Only the flush's compare-and-delete lock release
+        if self.keys.get(key) == token:
+            del self.keys[key]
+            return 1
+        return 0
+
+    def lpop(self, key):
+        return self.lists[key].pop(0) if self.lists[key] else None
+
+    def lmove(self, source, destination, src_side, dest_side):
+        if not self.lists[source]:
+            return None
+        item = self.lists[source].pop(0)
+        self.lists[destination].append(item)
+        return item
+
+    def pipeline(self):
+        fake = self
+
+        class Pipeline:
+            def __init__(self):
+                self.calls = []
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                pass
+
+            def lmove(self, *args):
+                self.calls.append(args)
+
+            def execute(self):
+                return [fake.lmove(*args) for args in self.calls]
+
+        return Pipeline()
+
+
+def _queue(fake, *types):
+    for webhook_type in types:
+        record = new_webhook_log(webhook_type, {})
+        fake.lists[WEBHOOK_LOG_QUEUE].append(orjson.dumps(record))
+
+
+class TestFlushWebhookLogs:
+    """Test queued webhook logs are written, retried or dead-lettered"""
+
+    def _flush(self, monkeypatch, fake, write_batch):
+        monkeypatch.setattr(webhook_bulk.redis_client, "connect_raw", lambda: fake)
+        monkeypatch.setattr(webhook_bulk, "_write_batch", write_batch)
+        return webhook_bulk.flush_webhook_logs(batch_size=10)
+
+    def test_bad_record_is_dead_lettered(self, monkeypatch):
+        """Test one rejected record does not hold back the rest"""
+        fake = FakeListRedis()
+        _queue(fake, "stk_push", "bad", "b2c")
+        written = []
+
+        def write_batch(rows):
+            if any(row["webhook_type"] == "bad" for row in rows):
+                raise DataError("INSERT", {}, Exception("invalid jsonb"))
+            written.extend(row["webhook_type"] for row in rows)
+
+        assert self._flush(monkeypatch, fake, write_batch) == 2
+        assert written == ["stk_push", "b2c"]
+        assert len(fake.lists[WEBHOOK_LOG_DEAD_LETTER]) == 1
+        assert not fake.lists[WEBHOOK_LOG_QUEUE]
+        assert not fake.lists[WEBHOOK_LOG_PROCESSING]
+
+    def test_connection_error_keeps_records(self, monkeypatch):
+        """Test records stay on the processing list while the database is down"""
+        fake = FakeListRedis()
+        _queue(fake, "stk_push", "b2c")
+
+        def write_batch(rows):
+            raise OperationalError("INSERT", {}, Exception("connection refused"))
+
+        try:
+            self._flush(monkeypatch, fake, write_batch)
+        except OperationalError:
+            pass
+        assert len(fake.lists[WEBHOOK_LOG_PROCESSING]) == 2
+        assert not fake.lists[WEBHOOK_LOG_DEAD_LETTER]
+
+        # The next round writes what the interrupted one left behind
+        written = []
+        assert self._flush(monkeypatch, fake, written.extend) == 2
+        assert not fake.lists[WEBHOOK_LOG_PROCESSING]
+
+    def test_releases_only_its_own_lock(self, monkeypatch):
+        """Test a flush does not delete a lock another worker took over"""
+        fake = FakeListRedis()
+        _queue(fake, "stk_push")
+
+        def write_batch(rows):
+            # Our lock expired mid-write and another worker claimed it
+            fake.keys[_FLUSH_LOCK] = b"other-worker"
+
+        self._flush(monkeypatch, fake, write_batch)
+        assert fake.keys[_FLUSH_LOCK] == b"other-worker"
+
+        del fake.keys[_FLUSH_LOCK]
+        _queue(fake, "b2c")
+        assert self._flush(monkeypatch, fake, lambda rows: None) == 1
+        assert _FLUSH_LOCK not in fake.keys
@@ -0,0 +1,36 @@
+"""
+Tests for the SMALLINT weekday bitmask column type
+"""
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.trip import TripTemplate, WeekdayMask, weekday_mask
+
+
+class TestWeekdayMask:
+    """Test weekday lists round-trip through their bitmask"""
+
+    def test_round_trip(self):
+        """Test weekday lists bind to masks and load as sorted lists"""
+        days = WeekdayMask()
+
+        assert days.process_bind_param([1, 2, 3, 4, 5], None) == 0b0011111
+        assert days.process_bind_param([7, 1], None) == 0b1000001
+        assert days.process_bind_param(None, None) is None
+        assert days.process_result_value(0b1000001, None) == [1, 7]
+        assert days.process_result_value(127, None) == [1, 2, 3, 4, 5, 6, 7]
+
+    def test_out_of_range_day(self):
+        """Test weekdays outside 1-7 are rejected"""
+        with pytest.raises(ValueError):
+            weekday_mask([0])
+        with pytest.raises(ValueError):
+            weekday_mask([8])
+
+    def test_runs_on_tests_one_bit(self):
+        """Test the weekday filter is a bit test on the raw mask"""
+        compiled = TripTemplate.runs_on(3).compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+        assert str(compiled) == "(trip_templates.days_mask & 4) != 0"
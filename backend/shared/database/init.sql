@@ -50,8 +50,8 @@ CREATE TABLE vehicles (
     sim_number VARCHAR(20),
     gps_api_key TEXT, -- Encrypted in application layer
     status vehicle_status DEFAULT 'active',
-    created_at TIMESTAMP DEFAULT NOW(),
-    updated_at TIMESTAMP DEFAULT NOW(),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     UNIQUE(fleet_id, fleet_number)
 );
 
@@ -64,8 +64,8 @@ CREATE TABLE drivers (
     license_expiry DATE,
     fleet_id UUID REFERENCES fleets(id),
     is_active BOOLEAN DEFAULT true,
-    created_at TIMESTAMP DEFAULT NOW(),
-    updated_at TIMESTAMP DEFAULT NOW()
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
 -- Vehicle assignments
@@ -80,7 +80,8 @@ CREATE TABLE vehicle_assignments (
     is_active BOOLEAN DEFAULT true,
     assignment_notes TEXT,
     created_at TIMESTAMP DEFAULT NOW(),
-    updated_at TIMESTAMP DEFAULT NOW()
+    updated_at TIMESTAMP DEFAULT NOW(),
+    CONSTRAINT valid_assignment_end CHECK (is_active OR unassigned_at IS NOT NULL)
 );
 
 -- Add partial unique constraints for active assignments
@@ -95,7 +96,7 @@ CREATE INDEX idx_vehicle_assignments_vehicle_id ON vehicle_assignments(vehicle_i
 CREATE INDEX idx_vehicle_assignments_driver_id ON vehicle_assignments(driver_id);
 CREATE INDEX idx_vehicle_assignments_fleet_id ON vehicle_assignments(fleet_id);
 CREATE INDEX idx_vehicle_assignments_manager_id ON vehicle_assignments(manager_id);
-CREATE INDEX idx_vehicle_assignments_active ON vehicle_assignments(is_active) WHERE is_active = true;
+CREATE INDEX ix_va_fleet_active ON vehicle_assignments(fleet_id, assigned_at) WHERE is_active = true;
 
 -- Vehicle status history
 CREATE TABLE vehicle_status_history (
@@ -124,8 +125,8 @@ CREATE TABLE maintenance_records (
     assigned_to VARCHAR(200),
     performed_by VARCHAR(200),
     created_by UUID NOT NULL REFERENCES user_profiles(id),
-    estimated_cost INTEGER,
-    actual_cost INTEGER,
+    estimated_cost BIGINT,
+    actual_cost BIGINT,
     is_completed BOOLEAN DEFAULT false,
     is_approved BOOLEAN DEFAULT false,
     odometer_reading INTEGER,
@@ -145,7 +146,6 @@ CREATE TABLE vehicle_documents (
     issued_date DATE,
     expiry_date DATE,
     is_active BOOLEAN DEFAULT true,
-    is_expired BOOLEAN DEFAULT false,
     file_path VARCHAR(500),
     file_name VARCHAR(200),
     notes TEXT,
@@ -175,14 +175,14 @@ CREATE TABLE vehicle_inspections (
 );
 
 -- Indexes for vehicle status tables
-CREATE INDEX idx_vehicle_status_history_vehicle_id ON vehicle_status_history(vehicle_id);
+CREATE INDEX ix_vsh_vehicle_time ON vehicle_status_history(vehicle_id, changed_at);
 CREATE INDEX idx_vehicle_status_history_changed_at ON vehicle_status_history(changed_at);
-CREATE INDEX idx_maintenance_records_vehicle_id ON maintenance_records(vehicle_id);
-CREATE INDEX idx_maintenance_records_priority ON maintenance_records(priority);
-CREATE INDEX idx_maintenance_records_completed ON maintenance_records(is_completed);
+CREATE INDEX ix_maint_vehicle_cost ON maintenance_records(vehicle_id, actual_cost);
+CREATE INDEX ix_maint_open_priority ON maintenance_records(vehicle_id, priority) WHERE NOT is_completed;
 CREATE INDEX idx_vehicle_documents_vehicle_id ON vehicle_documents(vehicle_id);
 CREATE INDEX idx_vehicle_documents_type ON vehicle_documents(document_type);
 CREATE INDEX idx_vehicle_documents_expiry ON vehicle_documents(expiry_date);
+CREATE INDEX ix_vehicle_documents_insurance_expiry ON vehicle_documents(vehicle_id, expiry_date) WHERE document_type = 'insurance' AND is_active;
 CREATE INDEX idx_vehicle_inspections_vehicle_id ON vehicle_inspections(vehicle_id);
 CREATE INDEX idx_vehicle_inspections_date ON vehicle_inspections(inspection_date);
 
@@ -258,26 +258,31 @@ CREATE TABLE receipts (
     generated_at TIMESTAMP DEFAULT NOW()
 );
 
--- GPS locations
+-- GPS locations, monthly range partitions on recorded_at
 CREATE TABLE gps_locations (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
     vehicle_id UUID REFERENCES vehicles(id),
-    latitude DECIMAL(10, 8) NOT NULL,
-    longitude DECIMAL(11, 8) NOT NULL,
-    altitude DECIMAL(8, 2),
-    speed DECIMAL(5, 2),
-    heading DECIMAL(5, 2),
+    latitude DOUBLE PRECISION NOT NULL,
+    longitude DOUBLE PRECISION NOT NULL,
+    altitude DOUBLE PRECISION,
+    speed DOUBLE PRECISION,
+    heading DOUBLE PRECISION,
     accuracy DECIMAL(5, 2),
     recorded_at TIMESTAMP NOT NULL,
-    received_at TIMESTAMP DEFAULT NOW()
-);
+    received_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (id, recorded_at)
+) PARTITION BY RANGE (recorded_at);
+CREATE TABLE gps_locations_default PARTITION OF gps_locations DEFAULT;
 
 -- Create indexes for performance
 CREATE INDEX idx_user_profiles_user_id ON user_profiles(user_id);
+CREATE INDEX ix_user_profiles_user_id_active ON user_profiles(user_id) WHERE is_active = true;
 CREATE INDEX idx_user_profiles_phone ON user_profiles(phone);
 CREATE INDEX idx_vehicles_fleet_id ON vehicles(fleet_id);
 CREATE INDEX idx_vehicles_license_plate ON vehicles(license_plate);
 CREATE INDEX idx_drivers_fleet_id ON drivers(fleet_id);
+CREATE INDEX ix_drivers_fleet_active ON drivers(fleet_id) WHERE is_active = true;
+CREATE INDEX ix_drivers_license_number ON drivers USING hash (license_number);
 -- Indexes already created above for vehicle_assignments
 CREATE INDEX idx_trips_vehicle_date ON trips(vehicle_id, scheduled_departure);
 CREATE INDEX idx_trips_route_status_date ON trips(route_id, status, scheduled_departure);
@@ -285,6 +290,7 @@ CREATE INDEX idx_bookings_passenger ON bookings(passenger_id);
 CREATE INDEX idx_bookings_trip_status ON bookings(trip_id, booking_status);
 CREATE INDEX idx_payments_booking ON payments(booking_id);
 CREATE INDEX idx_gps_vehicle_time ON gps_locations(vehicle_id, recorded_at DESC);
+CREATE INDEX ix_gps_recorded_brin ON gps_locations USING brin (recorded_at) WITH (pages_per_range = 32);
 
 -- Create updated_at trigger function
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -304,10 +310,11 @@ CREATE TRIGGER update_routes_updated_at BEFORE UPDATE ON routes FOR EACH ROW EXE
 CREATE TRIGGER update_trips_updated_at BEFORE UPDATE ON trips FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_bookings_updated_at BEFORE UPDATE ON bookings FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_payments_updated_at BEFORE UPDATE ON payments FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+CREATE TRIGGER update_vehicle_assignments_updated_at BEFORE UPDATE ON vehicle_assignments FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
--- Performance metrics table
+-- Performance metrics table, range partitioned by month on date_recorded
 CREATE TABLE performance_metrics (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
     vehicle_id UUID REFERENCES vehicles(id) ON DELETE CASCADE, -- NULL for fleet-wide metrics
     fleet_id UUID NOT NULL REFERENCES fleets(id) ON DELETE CASCADE,
     metric_type VARCHAR(50) NOT NULL, -- fuel_efficiency, revenue, passenger_count, etc.
@@ -327,9 +334,29 @@ CREATE TABLE performance_metrics (
     notes TEXT,
     recorded_by UUID NOT NULL REFERENCES user_profiles(id),
 
-    created_at TIMESTAMP DEFAULT NOW(),
-    updated_at TIMESTAMP DEFAULT NOW()
-);
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+
+    PRIMARY KEY (id, date_recorded)
+) PARTITION BY RANGE (date_recorded);
+
+-- Performance measures, one row per vehicle (NULL for fleet-wide) and day,
+-- range partitioned by month on date_recorded. Supersedes performance_metrics
+CREATE TABLE performance_metrics_v2 (
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
+    fleet_id UUID NOT NULL REFERENCES fleets(id) ON DELETE CASCADE,
+    vehicle_id UUID REFERENCES vehicles(id) ON DELETE CASCADE,
+    date_recorded DATE NOT NULL,
+    measures JSONB DEFAULT '{}' NOT NULL, -- metric type -> value
+    details JSONB DEFAULT '{}' NOT NULL, -- metric type -> unit, period, route, driver, notes
+    recorded_by UUID NOT NULL REFERENCES user_profiles(id),
+
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+
+    PRIMARY KEY (id, date_recorded),
+    CONSTRAINT uq_perf_v2_fleet_vehicle_date UNIQUE NULLS NOT DISTINCT (fleet_id, vehicle_id, date_recorded)
+) PARTITION BY RANGE (date_recorded);
 
 -- Route performance table
 CREATE TABLE route_performance (
@@ -341,7 +368,7 @@ CREATE TABLE route_performance (
     -- Performance metrics
     total_trips INTEGER DEFAULT 0 NOT NULL,
     total_distance_km DECIMAL(10,2) DEFAULT 0.0 NOT NULL,
-    total_revenue INTEGER DEFAULT 0 NOT NULL, -- In cents
+    total_revenue BIGINT DEFAULT 0 NOT NULL, -- In cents
     total_passengers INTEGER DEFAULT 0 NOT NULL,
     average_trip_time_minutes DECIMAL(8,2),
     on_time_percentage DECIMAL(5,2),
@@ -349,7 +376,7 @@ CREATE TABLE route_performance (
     -- Efficiency metrics
     fuel_consumption_liters DECIMAL(10,2),
     fuel_efficiency_km_per_liter DECIMAL(8,2),
-    maintenance_cost INTEGER DEFAULT 0 NOT NULL, -- In cents
+    maintenance_cost BIGINT DEFAULT 0 NOT NULL, -- In cents
 
     -- Time period
     date_recorded DATE NOT NULL,
@@ -360,51 +387,61 @@ CREATE TABLE route_performance (
     recorded_by UUID NOT NULL REFERENCES user_profiles(id),
     notes TEXT,
 
-    created_at TIMESTAMP DEFAULT NOW(),
-    updated_at TIMESTAMP DEFAULT NOW()
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+
+    CONSTRAINT uq_route_perf_fleet_code_date UNIQUE (fleet_id, route_code, date_recorded)
 );
 
--- Vehicle performance summary table
+-- Vehicle performance summary table, range partitioned by month on summary_date
 CREATE TABLE vehicle_performance_summary (
-    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    -- Fixed-width columns first, widest alignment first, then variable-length
+    -- (including DECIMAL), so rows carry no alignment padding
+    id UUID NOT NULL DEFAULT uuid_generate_v4(),
     vehicle_id UUID NOT NULL REFERENCES vehicles(id) ON DELETE CASCADE,
     fleet_id UUID NOT NULL REFERENCES fleets(id) ON DELETE CASCADE,
+    primary_driver_id UUID REFERENCES drivers(id) ON DELETE SET NULL,
+
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+
+    -- Amounts in cents
+    total_revenue BIGINT DEFAULT 0 NOT NULL,
+    fuel_cost BIGINT,
+    maintenance_cost BIGINT DEFAULT 0 NOT NULL,
+    gross_revenue BIGINT DEFAULT 0 NOT NULL,
+    operating_cost BIGINT DEFAULT 0 NOT NULL,
+    net_profit BIGINT DEFAULT 0 NOT NULL,
 
     -- Summary period
     summary_date DATE NOT NULL,
-    period_type VARCHAR(20) NOT NULL, -- daily, weekly, monthly
 
-    -- Operational metrics
+    -- Counters
     trips_completed INTEGER DEFAULT 0 NOT NULL,
-    total_distance_km DECIMAL(10,2) DEFAULT 0.0 NOT NULL,
-    total_revenue INTEGER DEFAULT 0 NOT NULL, -- In cents
     total_passengers INTEGER DEFAULT 0 NOT NULL,
-    active_hours DECIMAL(8,2) DEFAULT 0.0 NOT NULL,
-
-    -- Efficiency metrics
-    fuel_consumed_liters DECIMAL(10,2),
-    fuel_cost INTEGER, -- In cents
-    maintenance_cost INTEGER DEFAULT 0 NOT NULL, -- In cents
-    utilization_rate DECIMAL(5,2), -- Percentage
-
-    -- Performance indicators
-    average_speed_kmh DECIMAL(8,2),
     on_time_trips INTEGER DEFAULT 0 NOT NULL,
     delayed_trips INTEGER DEFAULT 0 NOT NULL,
     cancelled_trips INTEGER DEFAULT 0 NOT NULL,
 
-    -- Financial metrics
-    gross_revenue INTEGER DEFAULT 0 NOT NULL, -- In cents
-    operating_cost INTEGER DEFAULT 0 NOT NULL, -- In cents
-    net_profit INTEGER DEFAULT 0 NOT NULL, -- In cents
+    period_type VARCHAR(20) NOT NULL, -- daily, weekly, monthly
+
+    -- Measured values
+    total_distance_km DECIMAL(10,2) DEFAULT 0.0 NOT NULL,
+    active_hours DECIMAL(8,2) DEFAULT 0.0 NOT NULL,
+    fuel_consumed_liters DECIMAL(10,2),
+    utilization_rate DECIMAL(5,2), -- Percentage
+    average_speed_kmh DECIMAL(8,2),
     profit_margin DECIMAL(5,2), -- Percentage
 
-    -- Driver assignment
-    primary_driver_id UUID REFERENCES drivers(id) ON DELETE SET NULL,
+    PRIMARY KEY (id, summary_date),
+    CONSTRAINT uq_vps_vehicle_date_period UNIQUE (vehicle_id, summary_date, period_type)
+) PARTITION BY RANGE (summary_date);
 
-    created_at TIMESTAMP DEFAULT NOW(),
-    updated_at TIMESTAMP DEFAULT NOW()
-);
+-- Rows outside the monthly partitions land here; the auth service creates
+-- the current and upcoming months at startup and on every maintenance round
+CREATE TABLE performance_metrics_default PARTITION OF performance_metrics DEFAULT;
+CREATE TABLE performance_metrics_v2_default PARTITION OF performance_metrics_v2 DEFAULT;
+CREATE TABLE vehicle_performance_summary_default PARTITION OF vehicle_performance_summary DEFAULT;
 
 -- Fleet KPIs table
 CREATE TABLE fleet_kpis (
@@ -420,9 +457,15 @@ CREATE TABLE fleet_kpis (
     target_value DECIMAL(15,2),
     previous_value DECIMAL(15,2),
 
-    -- Performance
-    achievement_percentage DECIMAL(5,2),
-    trend VARCHAR(20), -- improving, declining, stable
+    -- Performance, derived from the values above
+    achievement_percentage DOUBLE PRECISION GENERATED ALWAYS AS (
+        CASE WHEN target_value > 0 THEN current_value / target_value * 100 END
+    ) STORED,
+    trend VARCHAR(20) GENERATED ALWAYS AS (
+        CASE WHEN current_value > previous_value THEN 'improving'
+             WHEN current_value < previous_value THEN 'declining'
+             WHEN current_value = previous_value THEN 'stable' END
+    ) STORED,
 
     -- Time period
     measurement_date DATE NOT NULL,
@@ -435,34 +478,42 @@ CREATE TABLE fleet_kpis (
 
     recorded_by UUID NOT NULL REFERENCES user_profiles(id),
 
-    created_at TIMESTAMP DEFAULT NOW(),
-    updated_at TIMESTAMP DEFAULT NOW()
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+
+    CONSTRAINT uq_fleet_kpi_name_date_period UNIQUE (fleet_id, kpi_name, measurement_date, period_type)
 );
 
 -- Indexes for analytics tables
 CREATE INDEX idx_performance_metrics_vehicle_id ON performance_metrics(vehicle_id);
-CREATE INDEX idx_performance_metrics_fleet_id ON performance_metrics(fleet_id);
-CREATE INDEX idx_performance_metrics_type ON performance_metrics(metric_type);
-CREATE INDEX idx_performance_metrics_date ON performance_metrics(date_recorded);
+CREATE INDEX ix_perf_fleet_date_type ON performance_metrics(fleet_id, date_recorded, metric_type) INCLUDE (metric_value);
 CREATE INDEX idx_performance_metrics_route ON performance_metrics(route_id);
+CREATE INDEX ix_perf_date_brin ON performance_metrics USING brin (date_recorded) WITH (pages_per_range = 32);
+
+CREATE INDEX ix_perf_v2_fleet_date ON performance_metrics_v2(fleet_id, date_recorded);
+CREATE INDEX ix_perf_v2_vehicle ON performance_metrics_v2(vehicle_id);
+CREATE INDEX ix_perf_v2_fuel ON performance_metrics_v2(fleet_id, date_recorded, ((measures->>'fuel_efficiency')::float)) WHERE measures ? 'fuel_efficiency';
+CREATE INDEX ix_perf_v2_on_time ON performance_metrics_v2(fleet_id, date_recorded, ((measures->>'on_time_performance')::float)) WHERE measures ? 'on_time_performance';
 
 CREATE INDEX idx_route_performance_fleet_id ON route_performance(fleet_id);
 CREATE INDEX idx_route_performance_route_name ON route_performance(route_name);
 CREATE INDEX idx_route_performance_route_code ON route_performance(route_code);
-CREATE INDEX idx_route_performance_date ON route_performance(date_recorded);
+CREATE INDEX ix_route_perf_date_brin ON route_performance USING brin (date_recorded) WITH (pages_per_range = 32);
 
-CREATE INDEX idx_vehicle_performance_summary_vehicle_id ON vehicle_performance_summary(vehicle_id);
+CREATE INDEX ix_vps_vehicle_date ON vehicle_performance_summary(vehicle_id, summary_date) INCLUDE (total_revenue, total_distance_km, active_hours);
 CREATE INDEX idx_vehicle_performance_summary_fleet_id ON vehicle_performance_summary(fleet_id);
-CREATE INDEX idx_vehicle_performance_summary_date ON vehicle_performance_summary(summary_date);
+CREATE INDEX ix_vps_date_brin ON vehicle_performance_summary USING brin (summary_date) WITH (pages_per_range = 32);
 CREATE INDEX idx_vehicle_performance_summary_period ON vehicle_performance_summary(period_type);
 
 CREATE INDEX idx_fleet_kpis_fleet_id ON fleet_kpis(fleet_id);
 CREATE INDEX idx_fleet_kpis_name ON fleet_kpis(kpi_name);
 CREATE INDEX idx_fleet_kpis_category ON fleet_kpis(kpi_category);
 CREATE INDEX idx_fleet_kpis_date ON fleet_kpis(measurement_date);
+CREATE INDEX ix_fleet_kpi_achievement ON fleet_kpis(achievement_percentage);
 
 -- Add updated_at triggers for analytics tables
 CREATE TRIGGER update_performance_metrics_updated_at BEFORE UPDATE ON performance_metrics FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+CREATE TRIGGER update_performance_metrics_v2_updated_at BEFORE UPDATE ON performance_metrics_v2 FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_route_performance_updated_at BEFORE UPDATE ON route_performance FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_vehicle_performance_summary_updated_at BEFORE UPDATE ON vehicle_performance_summary FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_fleet_kpis_updated_at BEFORE UPDATE ON fleet_kpis FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
@@ -534,10 +585,18 @@ CREATE TABLE trips (
     booked_seats INTEGER DEFAULT 0 NOT NULL CHECK (booked_seats >= 0),
 
     -- Status and Notes
-    status trip_status DEFAULT 'scheduled' NOT NULL,
+    status VARCHAR(20) DEFAULT 'scheduled' NOT NULL,
     notes TEXT,
     cancellation_reason TEXT,
 
+    -- Display snapshots taken when the trip is scheduled
+    route_name_snapshot VARCHAR(255),
+    origin_snapshot VARCHAR(255),
+    destination_snapshot VARCHAR(255),
+    vehicle_number_snapshot VARCHAR(20),
+    vehicle_plate_snapshot VARCHAR(20),
+    driver_code_snapshot VARCHAR(20),
+
     -- Timestamps
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
@@ -550,6 +609,10 @@ CREATE TABLE trips (
         actual_arrival IS NULL OR actual_departure IS NULL OR actual_arrival >= actual_departure
     ),
     CONSTRAINT valid_seat_count CHECK (available_seats <= total_seats),
+    CONSTRAINT valid_trip_status CHECK (status IN (
+        'scheduled', 'departed', 'in_progress', 'in_transit', 'arrived',
+        'completed', 'cancelled', 'delayed'
+    )),
     CONSTRAINT valid_booked_seats CHECK (booked_seats <= total_seats),
     CONSTRAINT seat_count_consistency CHECK (available_seats + booked_seats = total_seats)
 );
@@ -569,7 +632,7 @@ CREATE TABLE trip_templates (
     fare DECIMAL(10,2) NOT NULL CHECK (fare >= 0),
 
     -- Recurrence Pattern
-    days_of_week INTEGER[] NOT NULL, -- [1,2,3,4,5] for weekdays
+    days_mask SMALLINT NOT NULL CHECK (days_mask BETWEEN 1 AND 127), -- bit d - 1 for weekday d, 31 for Monday-Friday
 
     -- Status
     is_active BOOLEAN DEFAULT true NOT NULL,
@@ -587,9 +650,9 @@ CREATE INDEX idx_routes_origin_destination ON routes(origin_name, destination_na
 
 -- Create indexes for enhanced trips
 CREATE INDEX idx_trips_route_date ON trips(route_id, scheduled_departure);
-CREATE INDEX idx_trips_vehicle_date ON trips(vehicle_id, scheduled_departure);
+CREATE INDEX ix_trips_vehicle_dep ON trips(vehicle_id, scheduled_departure);
 CREATE INDEX idx_trips_driver_date ON trips(driver_id, scheduled_departure);
-CREATE INDEX idx_trips_status ON trips(status);
+CREATE INDEX ix_trips_fleet_status_dep ON trips(fleet_id, status, scheduled_departure);
 CREATE INDEX idx_trips_fleet_date ON trips(fleet_id, scheduled_departure);
 CREATE INDEX idx_trips_trip_code ON trips(trip_code);
 CREATE INDEX idx_trips_departure_date ON trips(DATE(scheduled_departure));
@@ -597,8 +660,8 @@ CREATE INDEX idx_trips_departure_date ON trips(DATE(scheduled_departure));
 -- Create indexes for trip_templates
 CREATE INDEX idx_trip_templates_route_id ON trip_templates(route_id);
 CREATE INDEX idx_trip_templates_fleet_id ON trip_templates(fleet_id);
+CREATE INDEX ix_trip_templates_created_by ON trip_templates(created_by);
 CREATE INDEX idx_trip_templates_is_active ON trip_templates(is_active);
-CREATE INDEX idx_trip_templates_days_of_week ON trip_templates USING GIN(days_of_week);
 
 -- Add updated_at triggers for trip management tables
 CREATE TRIGGER update_routes_updated_at BEFORE UPDATE ON routes FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
@@ -628,6 +691,9 @@ CREATE TYPE payment_method AS ENUM ('mpesa', 'card', 'cash', 'bank_transfer');
 -- Create seat preference enum
 CREATE TYPE seat_preference AS ENUM ('window', 'aisle', 'front', 'back', 'any');
 
+-- Booking reference sequence (BKG-0000000001 format)
+CREATE SEQUENCE IF NOT EXISTS booking_ref_seq;
+
 -- Passengers table for booking system
 CREATE TABLE passengers (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -655,7 +721,7 @@ CREATE TABLE bookings (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     trip_id UUID NOT NULL REFERENCES trips(id) ON DELETE CASCADE,
     passenger_id UUID NOT NULL REFERENCES passengers(id) ON DELETE CASCADE,
-    booking_reference VARCHAR(20) UNIQUE NOT NULL, -- BKG-XXXXXXXX format
+    booking_reference VARCHAR(20) UNIQUE NOT NULL DEFAULT 'BKG-' || lpad(nextval('booking_ref_seq')::text, 10, '0'),
 
     -- Booking Details
     seats_booked INTEGER NOT NULL CHECK (seats_booked > 0),
@@ -717,6 +783,9 @@ CREATE INDEX idx_bookings_passenger_id ON bookings(passenger_id);
 CREATE INDEX idx_bookings_reference ON bookings(booking_reference);
 CREATE INDEX idx_bookings_status ON bookings(booking_status);
 CREATE INDEX idx_bookings_phone ON bookings(passenger_phone);
+CREATE INDEX ix_bookings_passenger_status ON bookings(passenger_id, booking_status);
+CREATE INDEX ix_bookings_trip_active ON bookings(trip_id) WHERE booking_status IN ('pending', 'confirmed');
+CREATE INDEX ix_bookings_seat_numbers_gin ON bookings USING gin (seat_numbers);
 CREATE INDEX idx_payments_booking_id ON payments(booking_id);
 CREATE INDEX idx_payments_reference ON payments(payment_reference);
 CREATE INDEX idx_payments_status ON payments(payment_status);
@@ -725,3 +794,32 @@ CREATE INDEX idx_payments_status ON payments(payment_status);
 CREATE TRIGGER update_passengers_updated_at BEFORE UPDATE ON passengers FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_bookings_updated_at BEFORE UPDATE ON bookings FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_payments_updated_at BEFORE UPDATE ON payments FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+-- Per-vehicle daily trip and revenue rollup, refreshed CONCURRENTLY by the
+-- auth service (see migrations/004_create_vehicle_daily_summary_view.sql)
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_vehicle_daily_summary AS
+SELECT
+    t.vehicle_id,
+    v.fleet_id,
+    t.scheduled_departure::date AS summary_date,
+    COUNT(*) FILTER (WHERE t.status = 'completed') AS trips_completed,
+    COUNT(*) FILTER (WHERE t.status = 'cancelled') AS cancelled_trips,
+    COALESCE(SUM(t.total_seats - t.available_seats), 0)::integer AS total_passengers,
+    COALESCE(SUM(b.revenue_cents), 0)::bigint AS total_revenue -- In cents
+FROM trips t
+JOIN vehicles v ON v.id = t.vehicle_id
+LEFT JOIN (
+    SELECT trip_id, SUM(amount_paid * 100)::bigint AS revenue_cents
+    FROM bookings
+    WHERE booking_status <> 'cancelled'
+    GROUP BY trip_id
+) b ON b.trip_id = t.id
+GROUP BY t.vehicle_id, v.fleet_id, t.scheduled_departure::date;
+
+-- Required by REFRESH ... CONCURRENTLY; also serves per-vehicle lookups
+CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_vehicle_daily_summary
+    ON mv_vehicle_daily_summary (vehicle_id, summary_date);
+
+-- Dashboard reads: one fleet, one day, ranked by revenue
+CREATE INDEX IF NOT EXISTS ix_mv_vehicle_daily_summary_fleet_date
+    ON mv_vehicle_daily_summary (fleet_id, summary_date, total_revenue DESC);
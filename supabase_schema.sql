@@ -99,6 +99,15 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql SECURITY DEFINER;
 
+-- Profile lookup for the auth service, called via PostgREST RPC.
+-- PL/pgSQL caches the statement plan across calls in a session.
+CREATE OR REPLACE FUNCTION public.get_profile(profile_id UUID)
+RETURNS SETOF profiles AS $$
+BEGIN
+    RETURN QUERY SELECT * FROM profiles WHERE profiles.id = profile_id;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
 -- Optional: Create trigger for automatic profile creation
 -- DROP TRIGGER IF EXISTS on_auth_user_created ON auth.users;
 -- CREATE TRIGGER on_auth_user_created
@@ -109,6 +118,7 @@ $$ LANGUAGE plpgsql SECURITY DEFINER;
 GRANT USAGE ON SCHEMA public TO anon, authenticated;
 GRANT ALL ON profiles TO anon, authenticated;
 GRANT USAGE, SELECT ON ALL SEQUENCES IN SCHEMA public TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.get_profile(UUID) TO anon, authenticated;
 
 -- Insert sample data (optional - for testing)
 -- INSERT INTO profiles (user_id, phone, first_name, last_name, email, role) VALUES